@@ -1,10 +1,23 @@
 import copy
-from typing import Any, Dict, List
-
+import gc
+import io
+import pickle
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
 from pytest import fixture, lazy_fixture, mark, param
 
-from omegaconf import OmegaConf
-from omegaconf._utils import ValueKind, _is_missing_literal, get_value_kind
+from omegaconf import AnyNode, ListConfig, Node, OmegaConf
+from omegaconf._utils import (
+    ValueKind,
+    _is_missing_literal,
+    get_value_kind,
+    get_yaml_loader,
+)
+from omegaconf.grammar_compiler import GrammarCompiler, _compile_simple
+from omegaconf.grammar_parser import _parse
 
 
 def build_dict(
@@ -85,6 +98,136 @@ def test_omegaconf_create(data: Any, benchmark: Any) -> None:
     benchmark(OmegaConf.create, data)
 
 
+@dataclass
+class Server:
+    host: str = "localhost"
+    port: int = 80
+    timeout: float = 1.5
+    secure: bool = False
+    tags: List[str] = field(default_factory=list)
+    proxy: Optional[str] = None
+
+
+@dataclass
+class Service:
+    name: str = "service"
+    replicas: int = 1
+    server: Server = field(default_factory=Server)
+    fallback: Optional[Server] = None
+
+
+def test_omegaconf_structured(benchmark: Any) -> None:
+    benchmark(OmegaConf.structured, Service)
+
+
+def test_omegaconf_create_from_yaml(large_dict_config: Any, benchmark: Any) -> None:
+    yaml_str = OmegaConf.to_yaml(large_dict_config)
+    assert benchmark(OmegaConf.create, yaml_str) == large_dict_config
+
+
+@mark.parametrize("fmt", ["yaml", "json"])
+def test_load(fmt: str, large_dict_config: Any, tmp_path: Any, benchmark: Any) -> None:
+    path = tmp_path / f"cfg.{fmt}"
+    OmegaConf.save(large_dict_config, path)
+    assert benchmark(OmegaConf.load, path) == large_dict_config
+
+
+@mark.parametrize("workers", [1, 4])
+def test_load_many(workers: int, tmp_path: Any, benchmark: Any) -> None:
+    paths = []
+    for i in range(16):
+        path = tmp_path / f"cfg_{i}.yaml"
+        OmegaConf.save(OmegaConf.create(build_dict({"id": i}, 7, 2)), path)
+        paths.append(path)
+    benchmark(OmegaConf.load_many, paths, workers=workers)
+
+
+@mark.parametrize(
+    "leaf_value",
+    [param(1, id="int"), param("1", id="int_str"), param("value", id="str")],
+)
+def test_to_yaml(leaf_value: Any, benchmark: Any) -> None:
+    cfg = OmegaConf.create(build_dict({}, 9, 2, leaf_value=leaf_value))
+    benchmark(OmegaConf.to_yaml, cfg)
+
+
+@mark.parametrize("stream", [False, True])
+def test_save_memory(stream: bool, large_dict_config: Any, benchmark: Any) -> None:
+    # The peak memory used is reported in the `extra_info` of the benchmark.
+    def save() -> None:
+        if stream:
+            OmegaConf.dump(large_dict_config, io.StringIO())
+        else:
+            io.StringIO().write(OmegaConf.to_yaml(large_dict_config))
+
+    tracemalloc.start()
+    try:
+        save()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_bytes"] = peak
+    benchmark(save)
+
+
+@mark.parametrize("fmt", ["bytes", "pickle"])
+def test_serialize(fmt: str, large_dict_config: Any, benchmark: Any) -> None:
+    # The size of the encoded config is reported in the `extra_info` of the benchmark.
+    dumps: Callable[[Any], bytes]
+    if fmt == "bytes":
+        dumps = OmegaConf.to_bytes
+    else:
+        dumps = pickle.dumps
+    benchmark.extra_info["size"] = len(dumps(large_dict_config))
+    benchmark(dumps, large_dict_config)
+
+
+@mark.parametrize("fmt", ["bytes", "pickle"])
+def test_deserialize(fmt: str, large_dict_config: Any, benchmark: Any) -> None:
+    loads: Callable[[bytes], Any]
+    if fmt == "bytes":
+        data, loads = OmegaConf.to_bytes(large_dict_config), OmegaConf.from_bytes
+    else:
+        data, loads = pickle.dumps(large_dict_config), pickle.loads
+    assert benchmark(loads, data) == large_dict_config
+
+
+@mark.parametrize("lazy", [False, True])
+def test_load_binary_one_value(
+    lazy: bool, large_dict_config: Any, tmp_path: Any, benchmark: Any
+) -> None:
+    path = tmp_path / "cfg.bin"
+    path.write_bytes(OmegaConf.to_bytes(large_dict_config, indexed=lazy))
+
+    def load_one_value() -> Any:
+        cfg = OmegaConf.load(path, lazy=True)
+        return (
+            cfg.key_0.key_1.key_0.key_1.key_0.key_1.key_0.key_1.key_0.key_1.key_0.key_1
+        )
+
+    assert benchmark(load_one_value) == 1
+
+
+def test_omegaconf_create_memory(large_dict: Any, benchmark: Any) -> None:
+    # The memory used per leaf is reported in the `extra_info` of the benchmark.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        cfg = OmegaConf.create(large_dict)
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert cfg == large_dict
+    leaves = 2**12  # see `large_dict()`
+    benchmark.extra_info["bytes_per_leaf"] = round(size / leaves)
+    benchmark(OmegaConf.create, large_dict)
+
+
+def test_deepcopy(large_dict_config: Any, benchmark: Any) -> None:
+    benchmark(copy.deepcopy, large_dict_config)
+
+
 @mark.parametrize(
     "merge_function",
     [
@@ -96,6 +239,82 @@ def test_omegaconf_merge(merge_function: Any, merge_data: Any, benchmark: Any) -
     benchmark(merge_function, merge_data)
 
 
+@mark.parametrize(
+    "merge_function",
+    [
+        param(OmegaConf.merge, id="merge"),
+        param(OmegaConf.unsafe_merge, id="unsafe_merge"),
+    ],
+)
+def test_omegaconf_merge_small_override(
+    merge_function: Any, large_dict_config: Any, benchmark: Any
+) -> None:
+    # The cost of `merge` should depend on the size of the override, not the base.
+    override = {"key_0": {"key_1": {"key_0": 10}}}
+    if merge_function is OmegaConf.unsafe_merge:
+        # unsafe_merge modifies the base
+        cfg = copy.deepcopy(large_dict_config)
+        benchmark(merge_function, cfg, override)
+    else:
+        benchmark(merge_function, large_dict_config, override)
+
+
+@mark.parametrize(
+    "inputs, at_once",
+    [
+        param(10, True, id="10"),
+        param(100, True, id="100"),
+        param(1000, True, id="1000"),
+        # merging 1000 inputs one at a time takes about a minute
+        param(10, False, id="10-one_at_a_time"),
+        param(100, False, id="100-one_at_a_time"),
+    ],
+)
+def test_omegaconf_merge_many(
+    inputs: int, at_once: bool, large_dict_config: Any, benchmark: Any
+) -> None:
+    # Each override sets one leaf of the base config, picked from the bits of its index.
+    overrides = []
+    for i in range(inputs):
+        override: Dict[str, Any] = {f"key_{i >> 11 & 1}": i}
+        for bit in range(11):
+            override = {f"key_{i >> bit & 1}": override}
+        overrides.append(override)
+
+    def merge_one_at_a_time() -> Any:
+        cfg = copy.deepcopy(large_dict_config)
+        for override in overrides:
+            cfg.merge_with(override)
+        return cfg
+
+    if at_once:
+        benchmark(OmegaConf.merge, large_dict_config, *overrides)
+    else:
+        benchmark(merge_one_at_a_time)
+
+
+@mark.parametrize("batched", [True, False])
+def test_merge_with_dotlist(
+    batched: bool, large_dict_config: Any, benchmark: Any
+) -> None:
+    # 1024 overrides of leaves of the base config, sharing long prefixes.
+    dotlist = []
+    for i in range(1024):
+        key = ".".join(f"key_{i >> bit & 1}" for bit in reversed(range(12)))
+        dotlist.append(f"{key}={i}" if i % 2 else f"{key}=value_{i}")
+    cfg = copy.deepcopy(large_dict_config)  # this test modifies the config
+
+    def update_one_at_a_time() -> None:
+        for arg in dotlist:
+            key, value = arg.split("=")
+            OmegaConf.update(cfg, key, yaml.load(value, Loader=get_yaml_loader()))
+
+    if batched:
+        benchmark(cfg.merge_with_dotlist, dotlist)
+    else:
+        benchmark(update_one_at_a_time)
+
+
 @mark.parametrize(
     "lst",
     [
@@ -122,6 +341,68 @@ def test_list_iter(lst: List[Any], benchmark: Any) -> None:
     benchmark(iterate, lst)
 
 
+@mark.parametrize("position", ["head", "middle", "tail"])
+@mark.parametrize("operation", ["insert", "delete"])
+def test_list_insert_delete(operation: str, position: str, benchmark: Any) -> None:
+    lst = ListConfig(list(range(10000)))
+    index = {"head": 0, "middle": 5000, "tail": 9999}[position]
+
+    def insert() -> None:
+        lst.insert(index, -1)
+
+    def delete() -> None:
+        del lst[index]
+
+    # Each round starts from a list of the same length.
+    if operation == "insert":
+        benchmark.pedantic(insert, setup=delete, rounds=2000)
+    else:
+        benchmark.pedantic(delete, setup=insert, rounds=2000)
+    node = lst._get_node(index)
+    assert isinstance(node, Node)
+    assert node._key() == index
+
+
+@fixture(scope="module")
+def large_numeric_list() -> Any:
+    return [i / 10 for i in range(20000)]
+
+
+@mark.parametrize("element_type", [Any, float])
+def test_create_large_numeric_list(
+    element_type: Any, large_numeric_list: Any, benchmark: Any
+) -> None:
+    # The memory used per item is reported in the `extra_info` of the benchmark.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        lst = ListConfig(large_numeric_list, element_type=element_type)
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert lst == large_numeric_list
+    benchmark.extra_info["bytes_per_item"] = round(size / len(large_numeric_list))
+    benchmark(ListConfig, large_numeric_list, element_type=element_type)
+
+
+@mark.parametrize("element_type", [Any, float])
+@mark.parametrize(
+    "operation",
+    [
+        param(lambda lst: 0.5 in lst, id="in"),
+        param(lambda lst: lst.count(0.5), id="count"),
+        param(lambda lst: lst[1000:2000], id="slice"),
+        param(OmegaConf.to_container, id="to_container"),
+    ],
+)
+def test_large_numeric_list(
+    element_type: Any, operation: Any, large_numeric_list: Any, benchmark: Any
+) -> None:
+    lst = ListConfig(large_numeric_list, element_type=element_type)
+    benchmark(operation, lst)
+
+
 @mark.parametrize(
     "strict_interpolation_validation",
     [True, False],
@@ -147,6 +428,73 @@ def test_get_value_kind(
     assert benchmark(get_value_kind, value, strict_interpolation_validation) == expected
 
 
+@mark.parametrize(
+    ("value", "expected"),
+    [
+        ("simple", ValueKind.VALUE),
+        ("???", ValueKind.MANDATORY_MISSING),
+        ("${long_string1xxx}_${long_string2xxx:${key}}", ValueKind.INTERPOLATION),
+    ],
+)
+def test_get_value_kind_of_node(value: Any, expected: Any, benchmark: Any) -> None:
+    node = AnyNode(value)
+    assert benchmark(get_value_kind, node) == expected
+
+
+@mark.parametrize("fast_path", [True, False])
+@mark.parametrize("value", ["${a.b}", "prefix_${x}_${y}", "${env:HOME}"])
+def test_compile_interpolation(value: str, fast_path: bool, benchmark: Any) -> None:
+    # Caches are bypassed, so as to measure the actual compilation.
+    def compile_uncached() -> Any:
+        program = _compile_simple(value) if fast_path else None
+        if program is None:
+            program = GrammarCompiler().compile(
+                _parse(value, parser_rule="configValue", lexer_mode="DEFAULT_MODE")
+            )
+        return program
+
+    benchmark(compile_uncached)
+
+
+@mark.parametrize("key", ["node", "concat", "resolver"])
+def test_resolve_interpolation(key: str, benchmark: Any) -> None:
+    cfg = OmegaConf.create(
+        {
+            "x": 1,
+            "y": {"z": 2},
+            "node": "${y.z}",
+            "concat": "prefix_${x}_${y.z}",
+            "resolver": "${oc.select:y.z,0}",
+        }
+    )
+    assert benchmark(cfg.__getitem__, key) is not None
+
+
+@mark.parametrize("cache_interpolations", [False, True])
+def test_read_cached_interpolation(cache_interpolations: bool, benchmark: Any) -> None:
+    cfg = OmegaConf.create(
+        {"a": {"b": {"c": 1}}, "x": "${a.b.c}_${a.b.c}"},
+        flags={"cache_interpolations": cache_interpolations},
+    )
+    assert benchmark(getattr, cfg, "x") == "1_1"
+
+
+@mark.parametrize("frozen", [False, True])
+def test_read_frozen(frozen: bool, benchmark: Any) -> None:
+    cfg = OmegaConf.create({"a": {"b": {"c": 1}}, "x": "${a.b.c}"})
+    OmegaConf.set_readonly(cfg, True)
+    snapshot = OmegaConf.freeze(cfg) if frozen else cfg
+    assert benchmark(lambda: snapshot.a.b.c + snapshot.x) == 2
+
+
+@mark.parametrize("length", [10, 100, 1000])
+def test_to_container_resolve_chain(length: int, benchmark: Any) -> None:
+    chain: Dict[str, Any] = {f"k{i}": f"${{k{i + 1}}}" for i in range(length)}
+    chain[f"k{length}"] = 1
+    cfg = OmegaConf.create(chain)
+    benchmark(OmegaConf.to_container, cfg, resolve=True)
+
+
 def test_is_missing_literal(benchmark: Any) -> None:
     assert benchmark(_is_missing_literal, "???")
 
@@ -169,3 +517,20 @@ def test_update_force_add(
     recursive_is_struct(cfg)
 
     benchmark(OmegaConf.update, cfg, key, 10, force_add=force_add)
+
+
+@mark.parametrize("index_keys", [False, True])
+@mark.parametrize(
+    "key", ["key_0", "key_0.key_1.key_0.key_1", "key_0.key_1.key_0.key_1.key_0.key_1"]
+)
+def test_select(
+    large_dict_config: Any, key: str, index_keys: bool, benchmark: Any
+) -> None:
+    cfg = OmegaConf.create(large_dict_config, flags={"index_keys": index_keys})
+    benchmark(OmegaConf.select, cfg, key)
+
+
+@mark.parametrize("index_keys", [False, True])
+def test_full_keys(large_dict_config: Any, index_keys: bool, benchmark: Any) -> None:
+    cfg = OmegaConf.create(large_dict_config, flags={"index_keys": index_keys})
+    benchmark(OmegaConf.full_keys, cfg, "key_0.key_1")
@@ -0,0 +1 @@
+Add the `cache_interpolations` flag, which keeps the resolved interpolations of a config in a cache until the nodes they depend on are modified
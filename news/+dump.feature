@@ -0,0 +1 @@
+Add `OmegaConf.dump(cfg, stream)` to write the YAML dump of a config to a stream node by node. `OmegaConf.save()` now streams the dump, and only replaces the file once it is complete
@@ -0,0 +1 @@
+Add `OmegaConf.freeze()`, which returns an immutable and hashable resolved snapshot of a config (`FrozenDict` / `FrozenList`) that is much faster to read
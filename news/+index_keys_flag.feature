@@ -0,0 +1 @@
+Add the `index_keys` flag, which keeps an index of the full keys of a config on its root to speed up `OmegaConf.select()` and absolute interpolations, and `OmegaConf.full_keys()` to list the full keys of a config
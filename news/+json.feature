@@ -0,0 +1 @@
+Load and save JSON configs with the standard library parser: `OmegaConf.load()` and `OmegaConf.save()` use JSON for files with a `.json` extension or with `format="json"`
@@ -0,0 +1 @@
+Add `OmegaConf.to_bytes(cfg, indexed=True)` and `OmegaConf.load(path, lazy=True)`, which memory-maps such a file and only decodes the content of each container when first accessed
@@ -0,0 +1 @@
+Add `OmegaConf.load_many(paths, workers=...)` to load config files in parallel processes and merge them in order
@@ -0,0 +1 @@
+Cache interpolation parse trees in a process-wide LRU cache, configurable with `OmegaConf.set_parse_cache_size()` and `OmegaConf.clear_parse_cache()`, and monitored with `OmegaConf.parse_cache_info()`
@@ -0,0 +1 @@
+Add `OmegaConf.to_bytes()` and `OmegaConf.from_bytes()` to encode configs, including their types and flags, in a compact binary format that is faster than pickle
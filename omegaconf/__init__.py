@@ -7,6 +7,7 @@ from .errors import (
     UnsupportedValueType,
     ValidationError,
 )
+from .frozen import FrozenDict, FrozenList
 from .listconfig import ListConfig
 from .nodes import (
     AnyNode,
@@ -42,6 +43,8 @@ __all__ = [
     "UnionNode",
     "ListConfig",
     "DictConfig",
+    "FrozenDict",
+    "FrozenList",
     "DictKeyType",
     "OmegaConf",
     "Resolver",
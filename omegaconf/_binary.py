@@ -0,0 +1,439 @@
+"""
+Compact binary encoding of configs (see `OmegaConf.to_bytes()`).
+
+The tree of nodes is encoded as nested tuples, dicts and lists of primitives, which
+`marshal` then writes in native code:
+
+* a plain `AnyNode` (the vast majority of the leaves) is encoded as its value,
+* other nodes are encoded as a tuple starting with their kind, followed by their
+  metadata: types are references into a table holding each type once (by qualified
+  name when it can be imported back, pickled otherwise) and flags are only stored
+  when set,
+* interpolations, missing values and `None` are stored as they are, without being
+  resolved,
+* values that `marshal` does not support (enums, paths and objects) are escaped.
+
+Nodes that this module does not know about (e.g. subclasses) are pickled.
+
+In the indexed layout, the content of each container is written in its own chunk and
+referenced by its offset and size in the data. The content of the decoded containers
+is then only decoded when first accessed (see `_EncodedContent`), so that decoding a
+memory-mapped file only reads the parts of the config that are used.
+"""
+import marshal
+import pickle
+import struct
+import sys
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from ._utils import NoneType
+from .base import (
+    _EMPTY_FLAGS,
+    Box,
+    Container,
+    ContainerMetadata,
+    Metadata,
+    Node,
+    UnionNode,
+    _LazyContent,
+    _shared_metadata,
+)
+from .dictconfig import DictConfig
+from .listconfig import ListConfig
+from .nodes import (
+    AnyNode,
+    BooleanNode,
+    BytesNode,
+    EnumNode,
+    FloatNode,
+    IntegerNode,
+    PathNode,
+    StringNode,
+    ValueNode,
+)
+
+_HEADER = b"OCB"
+_VERSION = 1
+
+# The layouts of the data, following the version.
+_INLINE, _INDEXED = range(2)
+
+# Smaller contents are not worth decoding lazily, and stay in their parent's chunk.
+_MIN_CHUNK_SIZE = 256
+
+# The offset of the trailer of the indexed layout, at the end of the data.
+_TRAILER_OFFSET = struct.Struct("<Q")
+
+# The kinds of nodes, first item of the tuple encoding a node.
+_DICT, _LIST, _VALUE, _UNION, _PICKLED_NODE = range(5)
+
+# The escapes of keys and values that `marshal` does not support.
+_ENUM, _PICKLED = range(2)
+
+_VALUE_NODE_TYPES: Tuple[Type[ValueNode], ...] = (
+    AnyNode,
+    StringNode,
+    IntegerNode,
+    FloatNode,
+    BooleanNode,
+    BytesNode,
+    PathNode,
+    EnumNode,
+)
+_VALUE_NODE_CODES: Dict[Type[Node], int] = {
+    t: code for code, t in enumerate(_VALUE_NODE_TYPES)
+}
+
+_MARSHAL_TYPES = frozenset({NoneType, bool, int, float, str, bytes})
+
+
+class _Encoder:
+    def __init__(self, chunks: Optional[List[bytes]] = None, offset: int = 0) -> None:
+        self.types: List[Union[str, bytes]] = []
+        self.type_refs: Dict[Any, int] = {}
+        # The chunks of the indexed layout (None for the inline layout), starting at `offset`.
+        self.chunks = chunks
+        self.offset = offset
+
+    def encode_type(self, type_: Any) -> Optional[int]:
+        if type_ is None:
+            return None
+        ref = self.type_refs.get(type_)
+        if ref is None:
+            ref = self.type_refs[type_] = len(self.types)
+            self.types.append(_encode_type(type_))
+        return ref
+
+    def encode_value(self, value: Any) -> Any:
+        if type(value) in _MARSHAL_TYPES:
+            return value
+        if isinstance(value, Enum):
+            return _ENUM, self.encode_type(type(value)), value.name
+        return _PICKLED, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def encode_flags(self, metadata: Metadata) -> Any:
+        if not metadata.flags and not metadata.flags_root:
+            return None
+        flags = dict(metadata.flags) if metadata.flags else None
+        return flags, metadata.flags_root
+
+    def encode_node(self, node: Node) -> Any:
+        node_type = type(node)
+        md = node._metadata
+        if node_type is AnyNode:
+            value = node._val  # type: ignore
+            if (
+                type(value) in _MARSHAL_TYPES
+                and md.optional
+                and not md.flags
+                and not md.flags_root
+            ):
+                return value
+        if node_type in _VALUE_NODE_CODES:
+            return (
+                _VALUE,
+                _VALUE_NODE_CODES[node_type],
+                self.encode_type(md.ref_type),
+                self.encode_type(md.object_type),
+                md.optional,
+                self.encode_flags(md),
+                self.encode_value(node._val),  # type: ignore
+            )
+        if node_type is DictConfig or node_type is ListConfig:
+            assert isinstance(md, ContainerMetadata)
+            content = node.__dict__["_content"]
+            if isinstance(content, dict):
+                content = {
+                    self.encode_key(k): self.encode_node(v) for k, v in content.items()
+                }
+            elif isinstance(content, list):
+                content = [self.encode_node(v) for v in content]
+            if self.chunks is not None and isinstance(content, (dict, list)):
+                content = self.add_chunk(content)
+            return (
+                _DICT if node_type is DictConfig else _LIST,
+                self.encode_type(md.ref_type),
+                self.encode_type(md.object_type),
+                md.optional,
+                self.encode_flags(md),
+                self.encode_type(md.key_type),
+                self.encode_type(md.element_type),
+                content,
+            )
+        if node_type is UnionNode:
+            content = node.__dict__["_content"]
+            is_node = isinstance(content, Node)
+            if is_node:
+                # The key of the wrapped node is not the key of the union node.
+                child_key = self.encode_key(content._key())
+                content = child_key, self.encode_node(content)
+            return (
+                _UNION,
+                self.encode_type(md.ref_type),
+                md.optional,
+                self.encode_flags(md),
+                is_node,
+                content,
+            )
+        return _PICKLED_NODE, _pickle_node(node)
+
+    def add_chunk(self, content: Any) -> Any:
+        """The reference to a new chunk holding `content`, or `content` if it is small"""
+        assert self.chunks is not None
+        chunk = marshal.dumps(content)
+        if len(chunk) < _MIN_CHUNK_SIZE:
+            return content
+        self.chunks.append(chunk)
+        ref = self.offset, len(chunk)
+        self.offset += len(chunk)
+        return ref
+
+    def encode_key(self, key: Any) -> Any:
+        if isinstance(key, Enum):
+            return self.encode_type(type(key)), key.name
+        return key
+
+
+class _EncodedContent(_LazyContent):
+    """`__dict__` of a decoded container whose content is still encoded in a chunk"""
+
+    __slots__ = ("decoder", "chunk")
+
+    decoder: "_Decoder"
+    chunk: Tuple[int, ...]
+
+    def _create_content(self, owner: Container) -> None:
+        offset, size = self.chunk
+        data = marshal.loads(self.decoder.data[offset : offset + size])
+        self["_content"] = self.decoder.decode_content(data, owner)
+
+
+class _Decoder:
+    def __init__(self, types: List[Union[str, bytes]], data: Any = None) -> None:
+        self.types = [_decode_type(t) for t in types]
+        # The data holding the chunks of the indexed layout
+        self.data = data
+
+    def decode_type(self, ref: Optional[int]) -> Any:
+        return None if ref is None else self.types[ref]
+
+    def decode_value(self, value: Any) -> Any:
+        if type(value) is not tuple:
+            return value
+        if value[0] == _ENUM:
+            return self.types[value[1]][value[2]]
+        return pickle.loads(value[1])
+
+    def decode_key(self, key: Any) -> Any:
+        if type(key) is tuple:
+            return self.types[key[0]][key[1]]
+        return key
+
+    def decode_metadata(
+        self, ref_type: Any, object_type: Any, optional: bool, key: Any, flags: Any
+    ) -> Metadata:
+        flags, flags_root = flags or (None, False)
+        return Metadata(
+            ref_type=ref_type,
+            object_type=object_type,
+            optional=optional,
+            key=key,
+            flags=flags,
+            flags_root=flags_root,
+        )
+
+    def decode_value_metadata(
+        self, ref_type: Any, object_type: Any, optional: bool, flags: Any
+    ) -> Metadata:
+        """The metadata of a value node, whose key is not part of it"""
+        if flags is None:
+            return _shared_metadata(
+                ref_type=ref_type, object_type=object_type, optional=optional
+            )
+        return self.decode_metadata(ref_type, object_type, optional, None, flags)
+
+    def decode_container_metadata(self, data: Any, key: Any) -> ContainerMetadata:
+        _, ref_type, object_type, optional, flags, key_type, element_type, _ = data
+        flags, flags_root = flags or (None, False)
+        # The types were validated when the config was created: skip `__post_init__()`.
+        metadata = ContainerMetadata.__new__(ContainerMetadata)
+        metadata.__dict__.update(
+            ref_type=self.decode_type(ref_type),
+            object_type=self.decode_type(object_type),
+            optional=optional,
+            key=key,
+            flags=flags or _EMPTY_FLAGS,
+            flags_root=flags_root,
+            resolver_cache=None,
+            key_type=self.decode_type(key_type),
+            element_type=self.decode_type(element_type),
+        )
+        return metadata
+
+    def decode_content(self, data: Any, container: Container) -> Any:
+        if not isinstance(data, (dict, list)):
+            return data  # None, missing or interpolation
+        decode_key, decode_node = self.decode_key, self.decode_node
+        # Inlined `AnyNode._create_valid()` for the plain leaves.
+        new_node = AnyNode.__new__
+        items = data.items() if isinstance(data, dict) else enumerate(data)
+        content = {}
+        for key, value in items:
+            if type(key) is tuple:
+                key = decode_key(key)
+            if type(value) is tuple:
+                content[key] = decode_node(value, key, container)
+            else:
+                node = content[key] = new_node(AnyNode)
+                node._metadata = _shared_metadata(
+                    ref_type=Any, object_type=None, optional=True
+                )
+                node._parent = container
+                node._flags_cache = None
+                node._val = value
+                node._node_key = key
+        return content if isinstance(data, dict) else list(content.values())
+
+    def decode_node(self, data: Any, key: Any, parent: Optional[Box]) -> Node:
+        if type(data) is not tuple:
+            return AnyNode._create_valid(data, key, parent)
+        kind = data[0]
+        if kind == _VALUE:
+            _, code, ref_type, object_type, optional, flags, value = data
+            node_type = _VALUE_NODE_TYPES[code]
+            node = node_type.__new__(node_type)
+            metadata = self.decode_value_metadata(
+                self.decode_type(ref_type),
+                self.decode_type(object_type),
+                optional,
+                flags,
+            )
+            Node.__init__(node, parent=parent, metadata=metadata)
+            node._node_key = key
+            if node_type is EnumNode:
+                node.enum_type = metadata.ref_type  # type: ignore
+            node._val = self.decode_value(value)
+            return node
+        if kind == _DICT or kind == _LIST:
+            container: Container
+            if kind == _DICT:
+                container = DictConfig.__new__(DictConfig)
+            else:
+                container = ListConfig.__new__(ListConfig)
+            Container.__init__(
+                container,
+                parent=parent,
+                metadata=self.decode_container_metadata(data, key),
+            )
+            content = data[7]
+            if type(content) is tuple:
+                state = _EncodedContent(container.__dict__)
+                del state["_content"]
+                state.owner, state.decoder, state.chunk = container, self, content
+                object.__setattr__(container, "__dict__", state)
+            else:
+                container.__dict__["_content"] = self.decode_content(content, container)
+            return container
+        if kind == _UNION:
+            _, ref_type, optional, flags, is_node, content = data
+            union_node = UnionNode.__new__(UnionNode)
+            Box.__init__(
+                union_node,
+                parent=parent,
+                metadata=self.decode_metadata(
+                    self.decode_type(ref_type), None, optional, key, flags
+                ),
+            )
+            if is_node:
+                child_key = self.decode_key(content[0])
+                content = self.decode_node(content[1], child_key, union_node)
+            union_node.__dict__["_content"] = content
+            return union_node
+        assert kind == _PICKLED_NODE
+        pickled_node: Node = pickle.loads(data[1])
+        pickled_node._set_parent(parent)
+        return pickled_node
+
+
+def _encode_type(type_: Any) -> Union[str, bytes]:
+    """A type by qualified name if it can be imported back, pickled otherwise"""
+    module = getattr(type_, "__module__", None)
+    qualname = getattr(type_, "__qualname__", None)
+    if isinstance(module, str) and isinstance(qualname, str):
+        try:
+            if _import_type(module, qualname) is type_:
+                return f"{module}:{qualname}"
+        except (ImportError, AttributeError):
+            pass
+    return pickle.dumps(type_, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_type(data: Union[str, bytes]) -> Any:
+    if isinstance(data, bytes):
+        return pickle.loads(data)
+    module, _, qualname = data.partition(":")
+    return _import_type(module, qualname)
+
+
+def _import_type(module: str, qualname: str) -> Any:
+    if module not in sys.modules:
+        __import__(module)
+    obj: Any = sys.modules[module]
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _pickle_node(node: Node) -> bytes:
+    # The parent is not part of the pickle: it is set back when decoding.
+    parent = node._parent
+    try:
+        object.__setattr__(node, "_parent", None)
+        return pickle.dumps(node, protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+        object.__setattr__(node, "_parent", parent)
+
+
+def config_to_bytes(cfg: Container, indexed: bool = False) -> bytes:
+    header = _HEADER + bytes([_VERSION, _INDEXED if indexed else _INLINE])
+    if not indexed:
+        encoder = _Encoder()
+        root = encoder.encode_node(cfg)
+        root_key = encoder.encode_key(cfg._key())
+        return header + marshal.dumps((encoder.types, root_key, root))
+
+    chunks = [header]
+    encoder = _Encoder(chunks, offset=len(header))
+    root = encoder.encode_node(cfg)
+    root_key = encoder.encode_key(cfg._key())
+    chunks.append(marshal.dumps((encoder.types, root_key, root)))
+    chunks.append(_TRAILER_OFFSET.pack(encoder.offset))
+    return b"".join(chunks)
+
+
+def config_from_bytes(data: Any) -> Container:
+    """
+    Decode a config from `data` (`bytes` or any object supporting slicing into
+    `bytes`, such as a memory map), which is kept by the decoded config until the
+    content of all its containers is decoded.
+    """
+    header = data[: len(_HEADER) + 2]
+    if len(header) < len(_HEADER) + 2 or header[: len(_HEADER)] != _HEADER:
+        raise ValueError("Data is not a config encoded by OmegaConf.to_bytes()")
+    version, layout = header[len(_HEADER) :]
+    if version != _VERSION:
+        raise ValueError(
+            f"Unsupported version of the OmegaConf binary format: {version}"
+        )
+    if layout == _INLINE:
+        types, root_key, root = marshal.loads(data[len(header) :])
+        decoder = _Decoder(types)
+    else:
+        trailer_offset = len(data) - _TRAILER_OFFSET.size
+        (offset,) = _TRAILER_OFFSET.unpack(data[trailer_offset:])
+        types, root_key, root = marshal.loads(data[offset:trailer_offset])
+        decoder = _Decoder(types, data)
+    node = decoder.decode_node(root, decoder.decode_key(root_key), None)
+    assert isinstance(node, Container)
+    return node
@@ -1,12 +1,20 @@
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Set
 
 from omegaconf import MISSING, Container, DictConfig, ListConfig, Node, ValueNode
-from omegaconf.errors import ConfigTypeError, InterpolationToMissingValueError
+from omegaconf.errors import (
+    ConfigTypeError,
+    InterpolationToMissingValueError,
+    OmegaConfBaseException,
+)
 
-from ._utils import _DEFAULT_MARKER_, _get_value
+from ._utils import _DEFAULT_MARKER_, _get_value, _split_key
+from .base import _resolution_pass
+from .basecontainer import _check_resolution_cycle
+from .omegaconf import _select_one
 
 
-def _resolve_container_value(cfg: Container, key: Any) -> None:
+def _resolve_container_value(cfg: Container, key: Any, memo: Set[int]) -> None:
     node = cfg._get_child(key)
     assert isinstance(node, Node)
     if node._is_interpolation():
@@ -16,16 +24,21 @@ def _resolve_container_value(cfg: Container, key: Any) -> None:
             node._set_value(MISSING)
         else:
             if isinstance(resolved, Container):
-                _resolve(resolved)
+                _check_resolution_cycle(cfg, key, resolved, memo)
+                _resolve(resolved, memo)
             if isinstance(resolved, Container) and isinstance(node, ValueNode):
                 cfg[key] = resolved
             else:
                 node._set_value(_get_value(resolved))
     else:
-        _resolve(node)
+        _resolve(node, memo)
 
 
-def _resolve(cfg: Node) -> Node:
+def _resolve(cfg: Node, memo: Optional[Set[int]] = None) -> Node:
+    """
+    :param memo: The ids of the containers being resolved, used to detect
+        interpolations resolving to a container that contains them.
+    """
     assert isinstance(cfg, Node)
     if cfg._is_interpolation():
         try:
@@ -35,17 +48,146 @@ def _resolve(cfg: Node) -> Node:
         else:
             cfg._set_value(resolved._value())
 
+    if memo is None:
+        memo = set()
     if isinstance(cfg, DictConfig):
+        # push to memo "stack"
+        memo.add(id(cfg))
         for k in cfg.keys():
-            _resolve_container_value(cfg, k)
+            _resolve_container_value(cfg, k, memo)
+        # pop from memo "stack"
+        memo.remove(id(cfg))
 
     elif isinstance(cfg, ListConfig):
+        memo.add(id(cfg))
         for i in range(len(cfg)):
-            _resolve_container_value(cfg, i)
+            _resolve_container_value(cfg, i, memo)
+        memo.remove(id(cfg))
 
     return cfg
 
 
+@contextmanager
+def resolution_pass(cfg: Node) -> Iterator[None]:
+    """
+    Memoize the result of each interpolation while resolving the whole of `cfg`.
+
+    The interpolations of `cfg` are first resolved in dependency order (see
+    `_resolution_order()`), so that chains of interpolations are resolved in linear
+    time, and without deep recursion. During the pass, the config must not be
+    modified (other than by `_resolve()` replacing interpolations with their value).
+    """
+    if _resolution_pass.results is not None:
+        # Nested pass (e.g. from a custom resolver): the outer one is used.
+        yield
+        return
+
+    _resolution_pass.results = {}
+    try:
+        for node in _resolution_order(cfg):
+            try:
+                node._maybe_dereference_node()
+            except OmegaConfBaseException:
+                # Errors are raised when this node is reached by the actual traversal.
+                pass
+        yield
+    finally:
+        _resolution_pass.results = None
+
+
+def _resolution_order(cfg: Node) -> List[Node]:
+    """
+    Return the interpolations in `cfg`, and those they depend on, in an order such
+    that each interpolation comes after its dependencies.
+
+    Dependencies are the nodes referenced by a constant key (see `Program.node_keys`),
+    other ones (e.g. `${${foo}}`, or custom resolvers accessing the config) are simply
+    resolved recursively when needed. Cycles are left to be reported by the resolution.
+    """
+    order: List[Node] = []
+    visited: Set[int] = set()
+    for inter in _iter_interpolations(cfg):
+        if id(inter) in visited:
+            continue
+        visited.add(id(inter))
+        # Iterative depth-first search, since dependency chains may be very long.
+        stack = [(inter, iter(_dependencies(inter)))]
+        while stack:
+            node, deps = stack[-1]
+            for dep in deps:
+                if id(dep) not in visited:
+                    visited.add(id(dep))
+                    stack.append((dep, iter(_dependencies(dep))))
+                    break
+            else:
+                stack.pop()
+                order.append(node)
+    return order
+
+
+def _iter_interpolations(cfg: Node) -> Iterator[Node]:
+    stack = [cfg]
+    while stack:
+        node = stack.pop()
+        if node._is_interpolation():
+            yield node
+        elif isinstance(node, Container) and not (
+            node._is_none() or node._is_missing()
+        ):
+            content = node.__dict__["_content"]
+            assert isinstance(content, (dict, list))
+            children = content.values() if isinstance(content, dict) else content
+            stack.extend(reversed(list(children)))
+
+
+def _dependencies(node: Node) -> List[Node]:
+    """The interpolations that must be resolved before `node`"""
+    parent = node._get_parent_container()
+    if parent is None or not node._is_interpolation():
+        return []
+    try:
+        program = node._get_program()
+    except OmegaConfBaseException:
+        return []
+
+    deps = []
+    for key in program.node_keys:
+        target = _lookup_interpolation(parent, key)
+        if target is not None:
+            deps.append(target)
+    return deps
+
+
+def _lookup_interpolation(parent: Container, key: str) -> Optional[Node]:
+    """
+    Return the interpolation that `key` (as seen from `parent`) refers to, or whose
+    value the rest of the path depends on, without resolving anything.
+    """
+    try:
+        root, key = parent._resolve_key_and_root(key)
+    except OmegaConfBaseException:
+        return None
+
+    node: Node = root
+
+    if key != "":
+        for k in _split_key(key):
+            if node._is_interpolation():
+                break
+            if not isinstance(node, Container) or node._is_missing():
+                return None
+            try:
+                child, _ = _select_one(
+                    c=node, key=k, throw_on_missing=False, throw_on_type_error=False
+                )
+            except OmegaConfBaseException:
+                return None
+            if child is None:
+                return None
+            node = child
+    return node if node._is_interpolation() else None
+
+
 def select_value(
     cfg: Container,
     key: str,
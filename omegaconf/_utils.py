@@ -1,4 +1,5 @@
 import copy
+import json
 import os
 import pathlib
 import re
@@ -6,14 +7,19 @@ import string
 import sys
 import types
 import warnings
+import weakref
 from contextlib import contextmanager
 from enum import Enum
 from textwrap import dedent
 from typing import (
+    IO,
     Any,
+    Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
+    NamedTuple,
     Optional,
     Tuple,
     Type,
@@ -31,7 +37,12 @@ from .errors import (
     OmegaConfBaseException,
     ValidationError,
 )
-from .grammar_parser import SIMPLE_INTERPOLATION_PATTERN, parse
+from .grammar_parser import (
+    DEFAULT_PARSE_CACHE_SIZE,
+    SIMPLE_INTERPOLATION_PATTERN,
+    LRUCache,
+    parse,
+)
 
 try:
     import dataclasses
@@ -95,6 +106,20 @@ YAML_BOOL_TYPES = [
     "Off",
     "OFF",
 ]
+_YAML_BOOL_TYPES = frozenset(YAML_BOOL_TYPES)
+
+# Strings accepted by `int()` or `float()` (whitespace, signs, underscores between
+# digits, any unicode decimal digits, and case insensitive inf, infinity and nan).
+# Unlike `\s`, the whitespace they accept excludes \x1c to \x1f.
+_NUMBER_STRING = re.compile(
+    r"""[^\S\x1c-\x1f]*[-+]?(?:
+      (?:\d(?:_?\d)*)?\.\d(?:_?\d)*(?:e[-+]?\d(?:_?\d)*)?
+    | \d(?:_?\d)*\.?(?:e[-+]?\d(?:_?\d)*)?
+    | inf(?:inity)?
+    | nan
+    )[^\S\x1c-\x1f]*""",
+    re.X | re.I,
+)
 
 
 class Marker:
@@ -114,7 +139,11 @@ class OmegaConfDumper(yaml.Dumper):  # type: ignore
 
     @staticmethod
     def str_representer(dumper: yaml.Dumper, data: str) -> yaml.ScalarNode:
-        with_quotes = yaml_is_bool(data) or is_int(data) or is_float(data)
+        # Quote the strings that would be loaded as booleans or numbers otherwise.
+        # Same as `yaml_is_bool(data) or is_int(data) or is_float(data)`.
+        with_quotes = data in _YAML_BOOL_TYPES or (
+            _NUMBER_STRING.fullmatch(data) is not None
+        )
         return dumper.represent_scalar(
             yaml.resolver.BaseResolver.DEFAULT_SCALAR_TAG,
             data,
@@ -125,16 +154,127 @@ class OmegaConfDumper(yaml.Dumper):  # type: ignore
 def get_omega_conf_dumper() -> Type[OmegaConfDumper]:
     if not OmegaConfDumper.str_representer_added:
         OmegaConfDumper.add_representer(str, OmegaConfDumper.str_representer)
+        # Own the representers, so that they are shared with the libyaml dumper.
+        OmegaConfDumper.yaml_multi_representers = dict(
+            OmegaConfDumper.yaml_multi_representers
+        )
         OmegaConfDumper.str_representer_added = True
     return OmegaConfDumper
 
 
+_omega_conf_c_dumper: Optional[Any] = None
+
+# Longest mapping key that libyaml writes like the pure Python emitter: it measures the
+# length of simple keys in bytes, and the latter writes longer keys as complex keys.
+_LIBYAML_MAX_KEY_LENGTH = 120
+
+
+class _LibyamlMismatch(Exception):
+    """Raised when libyaml would not emit a dumped string like the Python emitter"""
+
+
+def _check_libyaml_scalar(value: str, is_key: bool) -> None:
+    """
+    Raise `_LibyamlMismatch` unless libyaml emits `value` exactly like the pure Python
+    emitter. They only differ on strings that are not printable ASCII (libyaml escapes
+    characters beyond U+FFFF for instance, and folds escaped strings differently), and
+    on empty or long keys.
+    """
+    if not (value.isascii() and value.isprintable()):
+        raise _LibyamlMismatch()
+    if is_key and not 0 < len(value) <= _LIBYAML_MAX_KEY_LENGTH:
+        raise _LibyamlMismatch()
+
+
+def _check_libyaml_node(node: yaml.Node, is_key: bool = False) -> None:
+    """`_check_libyaml_scalar()` for all the scalars of a represented `node`"""
+    if isinstance(node, yaml.ScalarNode):
+        _check_libyaml_scalar(node.value, is_key)
+    elif isinstance(node, yaml.SequenceNode):
+        for item in node.value:
+            _check_libyaml_node(item)
+    else:
+        assert isinstance(node, yaml.MappingNode)
+        for key, value in node.value:
+            _check_libyaml_node(key, is_key=True)
+            _check_libyaml_node(value)
+
+
+def _check_libyaml_events(events: Iterable[yaml.Event]) -> Iterator[yaml.Event]:
+    """`events`, after calling `_check_libyaml_scalar()` for their scalars"""
+    # For each open collection: None for a sequence, otherwise whether the next node
+    # of the mapping is a key.
+    next_is_key: List[Optional[bool]] = []
+    for event in events:
+        if isinstance(event, yaml.CollectionEndEvent):
+            next_is_key.pop()
+        elif isinstance(event, yaml.NodeEvent):
+            is_key = False
+            if next_is_key and next_is_key[-1] is not None:
+                is_key = next_is_key[-1]
+                next_is_key[-1] = not is_key
+            if isinstance(event, yaml.ScalarEvent):
+                _check_libyaml_scalar(event.value, is_key)
+            elif isinstance(event, yaml.CollectionStartEvent):
+                next_is_key.append(
+                    True if isinstance(event, yaml.MappingStartEvent) else None
+                )
+        yield event
+
+
+def _get_omega_conf_fast_dumper() -> Any:
+    """
+    Same as `get_omega_conf_dumper()`, but based on the libyaml bindings when they are
+    available (which are several times faster than pure Python). It uses the
+    representers of `OmegaConfDumper`, including those added to it later.
+
+    libyaml does not emit all strings like the Python emitter (see
+    `_check_libyaml_scalar()`): this dumper raises `_LibyamlMismatch` before
+    serializing data holding such strings, so that it can be dumped with
+    `get_omega_conf_dumper()` instead. Events emitted directly are checked with
+    `_check_libyaml_events()`.
+    """
+    global _omega_conf_c_dumper
+    dumper = get_omega_conf_dumper()
+    if not yaml.__with_libyaml__:
+        return dumper
+    if _omega_conf_c_dumper is None:
+
+        class OmegaConfCDumper(yaml.CDumper):  # type: ignore
+            yaml_representers = dumper.yaml_representers
+            yaml_multi_representers = dumper.yaml_multi_representers
+
+            def serialize(self, node: yaml.Node) -> None:
+                _check_libyaml_node(node)
+                super().serialize(node)
+
+        _omega_conf_c_dumper = OmegaConfCDumper
+    return _omega_conf_c_dumper
+
+
 def yaml_is_bool(b: str) -> bool:
     return b in YAML_BOOL_TYPES
 
 
+_yaml_loader: Optional[Any] = None
+
+
 def get_yaml_loader() -> Any:
-    class OmegaConfLoader(yaml.SafeLoader):  # type: ignore
+    """
+    The YAML loader used by OmegaConf. It is built once, and based on the libyaml
+    bindings when available (which are several times faster than pure Python).
+    """
+    global _yaml_loader
+    if _yaml_loader is None:
+        base = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        _yaml_loader = _create_yaml_loader(base)
+    return _yaml_loader
+
+
+def _create_yaml_loader(base: Any) -> Any:
+    """Create the OmegaConf loader, based on `base` (a `yaml.SafeLoader` variant)"""
+
+    class OmegaConfLoader(base):  # type: ignore
         def construct_mapping(self, node: yaml.Node, deep: bool = False) -> Any:
             keys = set()
             for key_node, value_node in node.value:
@@ -190,6 +330,66 @@ def get_yaml_loader() -> Any:
     return loader
 
 
+def _json_object_pairs_hook(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    obj: Dict[str, Any] = {}
+    for key, value in pairs:
+        if key in obj:
+            # Like the YAML loader, reject duplicate keys instead of keeping the last one.
+            raise yaml.constructor.ConstructorError(
+                "while constructing a mapping", None, f"found duplicate key {key}"
+            )
+        obj[key] = value
+    return obj
+
+
+def load_json(data: Union[str, IO[Any]]) -> Any:
+    """
+    Parse a JSON document (a string or a text stream) with the C parser of the
+    standard library. Strings (including interpolations and "???") are kept as is.
+    """
+    # NaN and Infinity are not valid JSON: like the YAML loader, keep them as strings.
+    if isinstance(data, str):
+        return json.loads(
+            data, object_pairs_hook=_json_object_pairs_hook, parse_constant=str
+        )
+    return json.load(
+        data, object_pairs_hook=_json_object_pairs_hook, parse_constant=str
+    )
+
+
+# Plain scalars that `load_dotlist_value()` recognizes without the YAML parser.
+_DOTLIST_INT_RE = re.compile(r"[-+]?(?:0|[1-9][0-9]*)")
+_DOTLIST_FLOAT_RE = re.compile(r"[-+]?[0-9]+\.[0-9]+")
+_DOTLIST_WORD_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_./-]*")
+_YAML_WORDS: Dict[str, Any] = {
+    **dict.fromkeys(["true", "True", "TRUE", "yes", "Yes", "YES"], True),
+    **dict.fromkeys(["on", "On", "ON"], True),
+    **dict.fromkeys(["false", "False", "FALSE", "no", "No", "NO"], False),
+    **dict.fromkeys(["off", "Off", "OFF"], False),
+    **dict.fromkeys(["null", "Null", "NULL"], None),
+}
+
+
+def load_dotlist_value(value: str) -> Any:
+    """
+    Parse the value of a dotlist override (``key=value``) like the YAML loader.
+    Decimal numbers, booleans, null and words are recognized without the loader.
+    """
+    if _DOTLIST_WORD_RE.fullmatch(value):
+        return _YAML_WORDS.get(value, value)
+    if _DOTLIST_INT_RE.fullmatch(value):
+        return int(value)
+    if _DOTLIST_FLOAT_RE.fullmatch(value):
+        return float(value)
+    if value == "":
+        return None
+    return yaml.load(value, Loader=get_yaml_loader())
+
+
+def is_json_path(path: Union[str, pathlib.Path]) -> bool:
+    return os.path.splitext(path)[1].lower() == ".json"
+
+
 def _get_class(path: str) -> type:
     from importlib import import_module
 
@@ -322,106 +522,164 @@ def get_attr_class_fields(obj: Any) -> List["attr.Attribute[Any]"]:
 
 
 def get_attr_data(obj: Any, allow_objects: Optional[bool] = None) -> Dict[str, Any]:
-    from omegaconf.omegaconf import OmegaConf, _maybe_wrap
+    return _get_structured_data(obj, allow_objects=allow_objects)
 
-    flags = {"allow_objects": allow_objects} if allow_objects is not None else {}
+
+def get_dataclass_fields(obj: Any) -> List["dataclasses.Field[Any]"]:
+    fields = dataclasses.fields(obj)
+    return [f for f in fields if f.metadata.get("omegaconf_ignore") is not True]
+
+
+def get_dataclass_data(
+    obj: Any, allow_objects: Optional[bool] = None
+) -> Dict[str, Any]:
+    return _get_structured_data(obj, allow_objects=allow_objects)
+
+
+class _StructuredField(NamedTuple):
+    """A field of a structured config class, see `_get_structured_schema()`"""
+
+    name: str
+    ref_type: Any
+    is_optional: bool
+    # Exactly one of `default` (MISSING if there is none) and `default_factory` is used.
+    default: Any
+    default_factory: Optional[Callable[[], Any]]
+    # The node class of fields whose type alone determines it, or None.
+    node_type: Optional[Type[Any]]
+    is_unsupported_union: bool
+
+
+_structured_schemas: "weakref.WeakKeyDictionary[Type[Any], List[_StructuredField]]"
+_structured_schemas = weakref.WeakKeyDictionary()
+
+# Dummy parents of the nodes created by `_get_structured_data()`, per `allow_objects`.
+_dummy_parents: Dict[Optional[bool], Any] = {}
+
+
+def _get_structured_schema(obj_type: Type[Any]) -> List[_StructuredField]:
+    """
+    The fields of the structured config class `obj_type` with their resolved types.
+    They are computed on first use and cached (weakly on the class), since the same
+    classes are typically instantiated many times.
+    """
+    schema = _structured_schemas.get(obj_type)
+    if schema is not None:
+        return schema
 
     from omegaconf import MISSING
+    from omegaconf.nodes import (
+        BooleanNode,
+        BytesNode,
+        FloatNode,
+        IntegerNode,
+        PathNode,
+        StringNode,
+    )
 
-    d = {}
-    is_type = isinstance(obj, type)
-    obj_type = obj if is_type else type(obj)
-    dummy_parent = OmegaConf.create({}, flags=flags)
-    dummy_parent._metadata.object_type = obj_type
-    resolved_hints = get_type_hints(obj_type)
+    node_types = {
+        int: IntegerNode,
+        float: FloatNode,
+        bool: BooleanNode,
+        str: StringNode,
+        bytes: BytesNode,
+        pathlib.Path: PathNode,
+    }
+    # (name, default, default_factory) of each field
+    fields: List[Tuple[str, Any, Optional[Callable[[], Any]]]] = []
+    if is_dataclass(obj_type):
+        for f in get_dataclass_fields(obj_type):
+            if f.default is not dataclasses.MISSING:
+                fields.append((f.name, f.default, None))
+            elif f.default_factory is not dataclasses.MISSING:
+                fields.append((f.name, None, f.default_factory))
+            else:
+                fields.append((f.name, MISSING, None))
+    else:
+        for attrib in get_attr_class_fields(obj_type):
+            default = attrib.default
+            if default == attr.NOTHING:
+                default = MISSING
+            fields.append((attrib.name, default, None))
 
-    for attrib in get_attr_class_fields(obj):
-        name = attrib.name
+    resolved_hints = get_type_hints(obj_type)
+    schema = []
+    for name, default, default_factory in fields:
         is_optional, type_ = _resolve_optional(resolved_hints[name])
-        type_ = _resolve_forward(type_, obj.__module__)
-        if not is_type:
-            value = getattr(obj, name)
-        else:
-            value = attrib.default
-            if value == attr.NOTHING:
-                value = MISSING
-        if is_union_annotation(type_) and not is_supported_union_annotation(type_):
-            e = ConfigValueError(
-                f"Unions of containers are not supported:\n{name}: {type_str(type_)}"
-            )
-            format_and_raise(node=None, key=None, value=value, cause=e, msg=str(e))
-
-        try:
-            d[name] = _maybe_wrap(
+        type_ = _resolve_forward(type_, obj_type.__module__)
+        schema.append(
+            _StructuredField(
+                name=name,
                 ref_type=type_,
                 is_optional=is_optional,
-                key=name,
-                value=value,
-                parent=dummy_parent,
-            )
-        except (ValidationError, GrammarParseError) as ex:
-            format_and_raise(
-                node=dummy_parent, key=name, value=value, cause=ex, msg=str(ex)
+                default=default,
+                default_factory=default_factory,
+                node_type=node_types.get(type_),
+                is_unsupported_union=is_union_annotation(type_)
+                and not is_supported_union_annotation(type_),
             )
-        d[name]._set_parent(None)
-    dict_subclass_data = extract_dict_subclass_data(obj=obj, parent=dummy_parent)
-    if dict_subclass_data is not None:
-        d.update(dict_subclass_data)
-    return d
-
-
-def get_dataclass_fields(obj: Any) -> List["dataclasses.Field[Any]"]:
-    fields = dataclasses.fields(obj)
-    return [f for f in fields if f.metadata.get("omegaconf_ignore") is not True]
+        )
+    _structured_schemas[obj_type] = schema
+    return schema
 
 
-def get_dataclass_data(
+def _get_structured_data(
     obj: Any, allow_objects: Optional[bool] = None
 ) -> Dict[str, Any]:
-    from omegaconf.omegaconf import MISSING, OmegaConf, _maybe_wrap
+    from omegaconf.omegaconf import OmegaConf, _maybe_wrap
 
-    flags = {"allow_objects": allow_objects} if allow_objects is not None else {}
     d = {}
     is_type = isinstance(obj, type)
     obj_type = get_type_of(obj)
-    dummy_parent = OmegaConf.create({}, flags=flags)
-    dummy_parent._metadata.object_type = obj_type
-    resolved_hints = get_type_hints(obj_type)
-    for field in get_dataclass_fields(obj):
-        name = field.name
-        is_optional, type_ = _resolve_optional(resolved_hints[field.name])
-        type_ = _resolve_forward(type_, obj.__module__)
-        has_default = field.default != dataclasses.MISSING
-        has_default_factory = field.default_factory != dataclasses.MISSING
+    # The dummy parent provides the flags to the nodes while they are created.
+    dummy_parent = _dummy_parents.get(allow_objects)
+    if dummy_parent is None:
+        flags = {"allow_objects": allow_objects} if allow_objects is not None else {}
+        dummy_parent = _dummy_parents[allow_objects] = OmegaConf.create({}, flags=flags)
 
+    for field in _get_structured_schema(obj_type):
+        name = field.name
         if not is_type:
             value = getattr(obj, name)
+        elif field.default_factory is not None:
+            value = field.default_factory()
         else:
-            if has_default:
-                value = field.default
-            elif has_default_factory:
-                value = field.default_factory()  # type: ignore
-            else:
-                value = MISSING
+            value = field.default
 
-        if is_union_annotation(type_) and not is_supported_union_annotation(type_):
+        if field.is_unsupported_union:
             e = ConfigValueError(
-                f"Unions of containers are not supported:\n{name}: {type_str(type_)}"
+                "Unions of containers are not supported:\n"
+                f"{name}: {type_str(field.ref_type)}"
             )
             format_and_raise(node=None, key=None, value=value, cause=e, msg=str(e))
         try:
-            d[name] = _maybe_wrap(
-                ref_type=type_,
-                is_optional=is_optional,
-                key=name,
-                value=value,
-                parent=dummy_parent,
-            )
+            if field.node_type is not None and type(value) in BUILTIN_VALUE_TYPES:
+                node = field.node_type(
+                    value=value,
+                    key=name,
+                    parent=dummy_parent,
+                    is_optional=field.is_optional,
+                )
+            else:
+                node = _maybe_wrap(
+                    ref_type=field.ref_type,
+                    is_optional=field.is_optional,
+                    key=name,
+                    value=value,
+                    parent=dummy_parent,
+                )
         except (ValidationError, GrammarParseError) as ex:
+            # Report the error from a parent of the type of the structured config.
+            flags = (
+                {"allow_objects": allow_objects} if allow_objects is not None else {}
+            )
+            error_parent = OmegaConf.create({}, flags=flags)
+            error_parent._metadata.object_type = obj_type
             format_and_raise(
-                node=dummy_parent, key=name, value=value, cause=ex, msg=str(ex)
+                node=error_parent, key=name, value=value, cause=ex, msg=str(ex)
             )
-        d[name]._set_parent(None)
+        node._set_parent(None)
+        d[name] = node
     dict_subclass_data = extract_dict_subclass_data(obj=obj, parent=dummy_parent)
     if dict_subclass_data is not None:
         d.update(dict_subclass_data)
@@ -509,7 +767,7 @@ def _is_missing_value(value: Any) -> bool:
     from omegaconf import Node
 
     if isinstance(value, Node):
-        value = value._value()
+        return value._is_missing()
     return _is_missing_literal(value)
 
 
@@ -554,11 +812,20 @@ def get_value_kind(
         containing "${", it is parsed to validate the interpolation syntax. If `False`,
         this parsing step is skipped: this is more efficient, but will not detect errors.
     """
+    from omegaconf import Node
 
-    if _is_missing_value(value):
+    if isinstance(value, Node):
+        if not strict_interpolation_validation:
+            # Nodes may remember the kind of their value.
+            return value._value_kind()
+        value = value._value()
+
+    if _is_missing_literal(value):
         return ValueKind.MANDATORY_MISSING
 
-    if _is_interpolation(value, strict_interpolation_validation):
+    if isinstance(value, str) and _is_interpolation_string(
+        value, strict_interpolation_validation
+    ):
         return ValueKind.INTERPOLATION
 
     return ValueKind.VALUE
@@ -568,6 +835,8 @@ def _is_interpolation(v: Any, strict_interpolation_validation: bool = False) ->
     from omegaconf import Node
 
     if isinstance(v, Node):
+        if not strict_interpolation_validation:
+            return v._is_interpolation()
         v = v._value()
 
     if isinstance(v, str) and _is_interpolation_string(
@@ -750,9 +1019,8 @@ def _get_value(value: Any) -> Any:
     if isinstance(value, ValueNode):
         return value._value()
     elif isinstance(value, Container):
-        boxed = value._value()
-        if boxed is None or _is_missing_literal(boxed) or _is_interpolation(boxed):
-            return boxed
+        if value._is_none() or value._value_kind() is not ValueKind.VALUE:
+            return value._value()
     elif isinstance(value, UnionNode):
         boxed = value._value()
         if boxed is None or _is_missing_literal(boxed) or _is_interpolation(boxed):
@@ -991,6 +1259,10 @@ def is_container_annotation(type_: Any) -> bool:
     return is_list_annotation(type_) or is_dict_annotation(type_)
 
 
+# Process-wide cache of split key paths, keyed on the full key.
+_split_key_cache = LRUCache(DEFAULT_PARSE_CACHE_SIZE)
+
+
 def split_key(key: str) -> List[str]:
     """
     Split a full key path into its individual components.
@@ -1001,6 +1273,23 @@ def split_key(key: str) -> List[str]:
         ".a.b[c].d" -> ["", "a", "b", "c", "d"]
         "[a].b"     -> ["a", "b"]
     """
+    return list(_split_key(key))
+
+
+def _split_key(key: str) -> Tuple[str, ...]:
+    """
+    Same as `split_key()`, but returns a tuple that is cached across calls, since
+    the same keys tend to be selected over and over.
+    """
+    tokens = _split_key_cache.get(key)
+    if tokens is None:
+        tokens = tuple(_tokenize_key(key))
+        _split_key_cache.put(key, tokens)
+    assert isinstance(tokens, tuple)
+    return tokens
+
+
+def _tokenize_key(key: str) -> List[str]:
     # Obtain the first part of the key (in docstring examples: a, a, .a, '')
     first = KEY_PATH_HEAD.match(key)
     assert first is not None
@@ -1,10 +1,22 @@
 import copy
 import sys
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from antlr4 import ParserRuleContext
 
@@ -14,13 +26,13 @@ from ._utils import (
     ValueKind,
     _get_value,
     _is_interpolation,
-    _is_missing_value,
+    _is_missing_literal,
     _is_special,
+    _split_key,
     format_and_raise,
     get_value_kind,
     is_union_annotation,
     is_valid_value_annotation,
-    split_key,
     type_str,
 )
 from .errors import (
@@ -34,13 +46,476 @@ from .errors import (
     UnsupportedInterpolationType,
     ValidationError,
 )
-from .grammar.gen.OmegaConfGrammarParser import OmegaConfGrammarParser
-from .grammar_parser import parse
-from .grammar_visitor import GrammarVisitor
+from .grammar_compiler import Program, compile_interpolation, compile_parse_tree
 
 DictKeyType = Union[str, bytes, int, Enum, float, bool]
 
 
+class _ResolutionPass(threading.local):
+    """
+    Interpolation results memoized during a resolution pass over a whole config (see
+    `_impl.resolution_pass()`), as `(node, resolved)` pairs indexed by `id(node)`.
+    """
+
+    results: Optional[Dict[int, Tuple["Node", "Node"]]] = None
+
+
+_resolution_pass = _ResolutionPass()
+
+
+def _format_cycle(memo: Dict[int, "Node"], node: "Node") -> str:
+    """Format the cycle closed by `node` in the resolution stack `memo`"""
+    stack = list(memo.values())
+    cycle = stack[list(memo).index(id(node)) :] + [node]
+    return " -> ".join(n._get_full_key(None) for n in cycle)
+
+
+class _Dependencies:
+    """The nodes an interpolation being resolved has accessed so far."""
+
+    __slots__ = ("nodes", "containers", "cacheable")
+
+    def __init__(self) -> None:
+        # Nodes whose identity or value the result depends on.
+        self.nodes: List["Node"] = []
+        # Containers whose whole content the result may depend on.
+        self.containers: List["Container"] = []
+        # Results of custom resolvers are never cached.
+        self.cacheable = True
+
+    def merge(self, other: "_Dependencies") -> None:
+        self.nodes.extend(other.nodes)
+        self.containers.extend(other.containers)
+        self.cacheable = self.cacheable and other.cacheable
+
+
+class _DependencyRecorder(threading.local):
+    """Dependencies of the interpolations being resolved by the current thread."""
+
+    def __init__(self) -> None:
+        self.stack: List[_Dependencies] = []
+
+    def current(self) -> Optional[_Dependencies]:
+        return self.stack[-1] if self.stack else None
+
+
+_dependency_recorder = _DependencyRecorder()
+
+# Set once any config has an interpolation cache, so that writes to configs do not
+# need to look for a cache to invalidate until then.
+_interpolation_caches_exist = False
+
+
+class _InterpolationCache:
+    """
+    Resolved interpolations of a config whose nodes have the `cache_interpolations`
+    flag set. The cache is stored on the root of the config.
+
+    Each result is associated to the nodes it depends on, so that a change to one
+    of them (see `Node._invalidate_interpolations()`) only evicts its dependents.
+    """
+
+    def __init__(self) -> None:
+        # id(node) -> (node, resolved)
+        self.results: Dict[int, Tuple["Node", "Node"]] = {}
+        # id(node) -> ids of the cached nodes depending on it
+        self.dependents: Dict[int, Set[int]] = {}
+        # id(container) -> ids of the cached nodes depending on its whole content
+        self.content_dependents: Dict[int, Set[int]] = {}
+        # Incremented on each invalidation, to discard results computed meanwhile.
+        self.version = 0
+        self.lock = threading.Lock()
+
+    def get(self, node: "Node") -> Optional["Node"]:
+        entry = self.results.get(id(node))
+        return None if entry is None else entry[1]
+
+    def put(
+        self, node: "Node", resolved: "Node", deps: _Dependencies, version: int
+    ) -> None:
+        # The result also depends on the position of `node` in the config.
+        nodes: Dict[int, Node] = {}
+        for dep in [node, *deps.nodes]:
+            n: Optional[Node] = dep
+            while n is not None and id(n) not in nodes:
+                nodes[id(n)] = n
+                n = n._get_parent()
+
+        with self.lock:
+            if version != self.version:
+                return
+            nid = id(node)
+            self.results[nid] = (node, resolved)
+            for dep_id in nodes:
+                self.dependents.setdefault(dep_id, set()).add(nid)
+            for container in deps.containers:
+                self.content_dependents.setdefault(id(container), set()).add(nid)
+
+    def invalidate(self, node: "Node", content_only: bool) -> None:
+        with self.lock:
+            self.version += 1
+            evicted: Set[int] = set()
+            if not content_only:
+                evicted.update(self.dependents.pop(id(node), ()))
+            n: Optional[Node] = node
+            while n is not None:
+                evicted.update(self.content_dependents.pop(id(n), ()))
+                n = n._get_parent()
+
+            # Evict the dependents of evicted results as well.
+            pending = list(evicted)
+            while pending:
+                nid = pending.pop()
+                if self.results.pop(nid, None) is not None:
+                    pending.extend(self.dependents.pop(nid, ()))
+                    pending.extend(self.content_dependents.pop(nid, ()))
+
+
+def _get_interpolation_cache(root: "Container") -> _InterpolationCache:
+    global _interpolation_caches_exist
+
+    cache = root.__dict__.get("_interpolation_cache")
+    if cache is None:
+        cache = root.__dict__["_interpolation_cache"] = _InterpolationCache()
+        _interpolation_caches_exist = True
+    assert isinstance(cache, _InterpolationCache)
+    return cache
+
+
+# Set once any config has a key index, so that writes to configs do not need to
+# look for an index to update until then.
+_key_indexes_exist = False
+
+
+def _join_full_key(full_key: str, key: Any, in_list: bool) -> str:
+    """The full key of the child `key` of the container whose full key is `full_key`"""
+    if in_list:
+        return f"{full_key}[{key}]"
+    key_str: str = key.name if isinstance(key, Enum) else str(key)
+    return f"{full_key}.{key_str}" if full_key else key_str
+
+
+def _iter_children(container: "Container") -> Iterator[Tuple[Any, "Node", bool]]:
+    """The `(key, child, in_list)` of a container, without resolving anything"""
+    content = container.__dict__["_content"]
+    if isinstance(content, dict):
+        for key, child in content.items():
+            yield key, child, False
+    elif isinstance(content, list):
+        for key, child in enumerate(content):
+            if child is not None:
+                yield key, child, True
+
+
+def _iter_full_keys(container: "Container", full_key: str) -> Iterator[str]:
+    """The full keys of all the nodes below `container`, depth first"""
+    for key, child, in_list in _iter_children(container):
+        child_key = _join_full_key(full_key, key, in_list)
+        yield child_key
+        if isinstance(child, Container):
+            yield from _iter_full_keys(child, child_key)
+
+
+class _KeyIndexEntry:
+    __slots__ = ("node", "full_key", "parent", "key", "selectable")
+
+    def __init__(
+        self,
+        node: "Node",
+        full_key: str,
+        parent: Optional["Container"],
+        key: Any,
+        selectable: bool,
+    ) -> None:
+        self.node = node
+        self.full_key = full_key
+        # The container holding the node in its content, under `key`.
+        self.parent = parent
+        self.key = key
+        # Whether `OmegaConf.select()` finds the node under `full_key`.
+        self.selectable = selectable
+
+
+class _KeyIndex:
+    """
+    Full keys of the nodes of a config whose root has the `index_keys` flag set.
+    The index is stored on the root of the config.
+
+    Interpolations are not resolved: the nodes below an interpolation are not
+    indexed. Modified nodes (see `Node._invalidate_interpolations()`) are only
+    recorded, and the parts of the index they affect are updated on next use.
+    """
+
+    def __init__(self, root: "Container") -> None:
+        self.root = root
+        # id(node) -> entry
+        self.entries: Dict[int, _KeyIndexEntry] = {}
+        # full key -> node, for the nodes `OmegaConf.select()` finds by full key
+        self.nodes: Dict[str, "Node"] = {}
+        # id(container) -> children of the container, in content order
+        self.children: Dict[int, List["Node"]] = {}
+        # id(node) -> modified nodes the index was not updated for yet
+        self.modified: Dict[int, "Node"] = {}
+        self.lock = threading.Lock()
+        self._add(root, "", None, None, True)
+
+    def find_parent(self, full_key: str) -> Optional["Container"]:
+        """The container holding the node found by `OmegaConf.select()` at `full_key`"""
+        with self.lock:
+            self._update()
+            node = self.nodes.get(full_key)
+            return None if node is None else self.entries[id(node)].parent
+
+    def full_key(self, node: "Node") -> Optional[str]:
+        with self.lock:
+            self._update()
+            entry = self.entries.get(id(node))
+            return None if entry is None or entry.node is not node else entry.full_key
+
+    def full_keys(self, container: "Container") -> Optional[List[str]]:
+        """The full keys of all the nodes below `container`, depth first"""
+        with self.lock:
+            self._update()
+            entry = self.entries.get(id(container))
+            if entry is None or entry.node is not container:
+                return None
+            keys: List[str] = []
+            pending = list(reversed(self.children.get(id(container), ())))
+            while pending:
+                node = pending.pop()
+                keys.append(self.entries[id(node)].full_key)
+                pending.extend(reversed(self.children.get(id(node), ())))
+            return keys
+
+    def invalidate(self, node: "Node") -> None:
+        with self.lock:
+            self.modified[id(node)] = node
+
+    def _update(self) -> None:
+        while self.modified:
+            _, node = self.modified.popitem()
+            self._update_node(node)
+
+    def _update_node(self, node: "Node") -> None:
+        entry = self.entries.get(id(node))
+        if entry is None or entry.node is not node:
+            # Not indexed: a new node is indexed when its parent is updated.
+            return
+        if not self._is_in_place(entry):
+            # Moved or removed: its parent is updated instead.
+            assert entry.parent is not None
+            self._update_node(entry.parent)
+        elif isinstance(node, Container):
+            self._update_children(node, entry)
+
+    def _is_in_place(self, entry: _KeyIndexEntry) -> bool:
+        """Whether the node of `entry` is still in the content of its parent"""
+        if entry.parent is None:
+            return entry.node is self.root
+        content = entry.parent.__dict__["_content"]
+        if isinstance(content, dict):
+            return content.get(entry.key) is entry.node
+        if isinstance(content, list):
+            return entry.key < len(content) and content[entry.key] is entry.node
+        return False
+
+    def _update_children(self, container: "Container", entry: _KeyIndexEntry) -> None:
+        # Drop the children that are not in place anymore before indexing the new
+        # ones, as a child moved within a list is dropped then indexed again.
+        in_place = set()
+        for child in self.children.pop(id(container), ()):
+            child_entry = self.entries.get(id(child))
+            if child_entry is not None and self._is_in_place(child_entry):
+                in_place.add(id(child))
+            else:
+                self._drop(child)
+        children = []
+        for key, child, in_list in _iter_children(container):
+            if id(child) not in in_place:
+                self._add_child(child, key, in_list, entry)
+            children.append(child)
+        self.children[id(container)] = children
+
+    def _add_child(
+        self, node: "Node", key: Any, in_list: bool, parent: _KeyIndexEntry
+    ) -> None:
+        # Keys that cannot be written in a full key are not found by `select()`.
+        selectable = parent.selectable and (
+            in_list
+            or (
+                type(key) is str
+                and key != ""
+                and "." not in key
+                and "[" not in key
+                and "]" not in key
+            )
+        )
+        full_key = _join_full_key(parent.full_key, key, in_list)
+        assert isinstance(parent.node, Container)
+        self._add(node, full_key, parent.node, key, selectable)
+
+    def _add(
+        self,
+        node: "Node",
+        full_key: str,
+        parent: Optional["Container"],
+        key: Any,
+        selectable: bool,
+    ) -> None:
+        entry = _KeyIndexEntry(node, full_key, parent, key, selectable)
+        self.entries[id(node)] = entry
+        if selectable:
+            self.nodes[full_key] = node
+        if isinstance(node, Container):
+            children = []
+            for child_key, child, in_list in _iter_children(node):
+                self._add_child(child, child_key, in_list, entry)
+                children.append(child)
+            self.children[id(node)] = children
+
+    def _drop(self, node: "Node") -> None:
+        entry = self.entries.pop(id(node), None)
+        if entry is None:
+            return
+        if entry.selectable and self.nodes.get(entry.full_key) is node:
+            del self.nodes[entry.full_key]
+        for child in self.children.pop(id(node), ()):
+            self._drop(child)
+
+
+def _get_key_index(root: "Container") -> Optional[_KeyIndex]:
+    """The key index of `root`, if it is the root of a config with `index_keys` set"""
+    global _key_indexes_exist
+
+    if root._get_parent() is not None or root._key() is not None:
+        # The full keys of a config with a key start with it.
+        return None
+    index = root.__dict__.get("_key_index")
+    if index is None:
+        if not root._get_node_flag("index_keys"):
+            return None
+        index = root.__dict__["_key_index"] = _KeyIndex(root)
+        _key_indexes_exist = True
+    assert isinstance(index, _KeyIndex)
+    return index
+
+
+def _find_key_index(node: "Node") -> Optional[_KeyIndex]:
+    """The key index of the root of `node`, if it was created already"""
+    if not _key_indexes_exist:
+        return None
+    seen = {id(node)}
+    parent = node._get_parent()
+    while parent is not None:
+        if id(parent) in seen:
+            return None
+        seen.add(id(parent))
+        node, parent = parent, parent._get_parent()
+    assert isinstance(node, Container)
+    return _get_key_index(node)
+
+
+def _invalidation_needed() -> bool:
+    """Whether modified nodes may have interpolation cache or key index entries"""
+    return _interpolation_caches_exist or _key_indexes_exist
+
+
+# Set once any container was copied lazily, so that nodes do not need to look for
+# lazy copies to detach before being modified until then.
+_lazy_copies_exist = False
+_lazy_copies_lock = threading.RLock()
+
+
+class _LazyContent(Dict[str, Any]):
+    """
+    `__dict__` of a container whose content is only created when first accessed.
+    The content of a container copied lazily (see `Container._copy_content_lazily()`)
+    is copied from the source container, subclasses create it in `_create_content()`.
+    """
+
+    __slots__ = ("owner", "source", "memo")
+
+    owner: Optional["Container"]
+    source: Optional["Container"]
+    # The memo of the deep copy, with which the children of `source` are copied
+    memo: Optional[Dict[int, Any]]
+
+    def __missing__(self, key: str) -> Any:
+        if key != "_content":
+            raise KeyError(key)
+        with _lazy_copies_lock:
+            if key not in self:
+                owner = self.owner
+                assert owner is not None
+                self.owner = None
+                self._create_content(owner)
+        return self[key]
+
+    def _create_content(self, owner: "Container") -> None:
+        source = self.source
+        assert source is not None
+        self.source = None
+        memo, self.memo = self.memo, None
+        owner._copy_content(source, memo)
+
+
+class _ContentAttribute:
+    """
+    The `_content` attribute of containers, only looked up (as a non-data descriptor)
+    when it is not in their `__dict__`: read it from `__dict__`, where it is created if
+    it is a `_LazyContent`.
+    """
+
+    def __get__(self, instance: Optional["Container"], owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__["_content"]
+        except KeyError:
+            raise AttributeError("_content") from None
+
+
+def _copies_lazily(memo: Dict[int, Any]) -> bool:
+    """
+    Whether a deep copy with `memo` may copy the content of containers lazily (see
+    `Container._copy_content_lazily()`), i.e. if the memo holds no copies yet, or only
+    those made by lazy copies (which are marked in the memo). Otherwise, the copy of
+    a node shared with other objects copied with the memo could be made twice.
+    """
+    if not memo:
+        memo[id(_LazyContent)] = _LazyContent
+        return True
+    return id(_LazyContent) in memo
+
+
+class _EmptyFlags(Dict[str, bool]):
+    """
+    Type of `_EMPTY_FLAGS`, the `Metadata.flags` shared by all the nodes without flags.
+    It cannot be modified: `Node._set_flag()` replaces it with a new dict instead.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("The shared empty flags cannot be modified")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore
+
+    def __copy__(self) -> "_EmptyFlags":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_EmptyFlags":
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickled as a regular dict (see `Metadata.__setstate__()`).
+        return dict, ()
+
+
+_EMPTY_FLAGS = _EmptyFlags()
+
+
 @dataclass
 class Metadata:
 
@@ -62,11 +537,20 @@ class Metadata:
     # otherwise, the parent node is queried.
     flags_root: bool = False
 
-    resolver_cache: Dict[str, Any] = field(default_factory=lambda: defaultdict(dict))
+    # Allocated on first use (see `OmegaConf.get_cache()`).
+    resolver_cache: Optional[Dict[str, Any]] = None
 
     def __post_init__(self) -> None:
         if self.flags is None:
-            self.flags = {}
+            self.flags = _EMPTY_FLAGS
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        # Older pickles (and empty flags) store empty dicts for these fields.
+        if not self.flags:
+            self.flags = _EMPTY_FLAGS
+        if not self.resolver_cache:
+            self.resolver_cache = None
 
     @property
     def type_hint(self) -> Union[Type[Any], Any]:
@@ -80,6 +564,75 @@ class Metadata:
             return self.ref_type
 
 
+class _SharedMetadata(Metadata):
+    """
+    Metadata shared by all the value nodes with the same type and without flags (see
+    `_shared_metadata()`). It cannot be modified: nodes replace it with
+    their own copy before modifying it (see `Node._own_metadata()`).
+    """
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise TypeError("Shared metadata cannot be modified")
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) in (Metadata, _SharedMetadata):
+            return vars(self) == vars(other)
+        return NotImplemented
+
+    def __copy__(self) -> Metadata:
+        return Metadata(**vars(self))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_SharedMetadata":
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickled as regular metadata.
+        return Metadata, (self.ref_type, self.object_type, self.optional, self.key)
+
+
+# Weak references, so that metadata no longer used by any node is released.
+_shared_metadata_cache: "weakref.WeakValueDictionary[Tuple[Any, ...], _SharedMetadata]"
+_shared_metadata_cache = weakref.WeakValueDictionary()
+
+
+def _shared_metadata(
+    ref_type: Union[Type[Any], Any],
+    object_type: Union[Type[Any], Any],
+    optional: bool,
+    flags: Optional[Dict[str, bool]] = None,
+) -> Metadata:
+    """
+    Metadata for a value node, shared with all the other value nodes with the same
+    type if it does not have flags. The key of a value node is stored on the node
+    (see `ValueNode._key()`), so the key of the metadata is always None.
+    """
+    if not flags:
+        cache_key = (ref_type, object_type, optional)
+        try:
+            metadata = _shared_metadata_cache.get(cache_key)
+        except TypeError:  # unhashable type
+            pass
+        else:
+            if metadata is None:
+                new = Metadata(
+                    ref_type=ref_type,
+                    object_type=object_type,
+                    optional=optional,
+                    key=None,
+                )
+                object.__setattr__(new, "__class__", _SharedMetadata)
+                assert isinstance(new, _SharedMetadata)
+                metadata = _shared_metadata_cache.setdefault(cache_key, new)
+            return metadata
+    return Metadata(
+        ref_type=ref_type,
+        object_type=object_type,
+        optional=optional,
+        key=None,
+        flags=flags,
+    )
+
+
 @dataclass
 class ContainerMetadata(Metadata):
     key_type: Any = None
@@ -96,19 +649,23 @@ class ContainerMetadata(Metadata):
                 )
 
         if self.flags is None:
-            self.flags = {}
+            self.flags = _EMPTY_FLAGS
 
 
 class Node(ABC):
+    # Containers store their attributes in `__dict__`, while value nodes (which can
+    # be very numerous) store them in slots: `Node` must work with both layouts.
+    __slots__ = ()
+
     _metadata: Metadata
 
     _parent: Optional["Box"]
     _flags_cache: Optional[Dict[str, Optional[bool]]]
 
     def __init__(self, parent: Optional["Box"], metadata: Metadata):
-        self.__dict__["_metadata"] = metadata
-        self.__dict__["_parent"] = parent
-        self.__dict__["_flags_cache"] = None
+        object.__setattr__(self, "_metadata", metadata)
+        object.__setattr__(self, "_parent", parent)
+        object.__setattr__(self, "_flags_cache", None)
 
     def __getstate__(self) -> Dict[str, Any]:
         # Overridden to ensure that the flags cache is cleared on serialization.
@@ -120,16 +677,69 @@ class Node(ABC):
         self.__dict__.update(state_dict)
         self.__dict__["_flags_cache"] = None
 
+    def _detach_lazy_copies(self) -> None:
+        """
+        Must be called before modifying this node: the lazy copies of this node and
+        of its parents (see `Container._copy_content_lazily()`) first copy the
+        content they share with them.
+        """
+        if not _lazy_copies_exist:
+            return
+        path = []
+        node: Optional[Node] = self
+        while node is not None:
+            path.append(node)
+            node = node._get_parent()
+        # Copying the content of a container lazily copies its children: start from
+        # the root so that copies of the nodes below are created before being detached.
+        for node in reversed(path):
+            if isinstance(node, Container):
+                for ref in node.__dict__.pop("_lazy_copies", ()):
+                    lazy_copy = ref()
+                    if lazy_copy is not None:
+                        lazy_copy.__dict__["_content"]
+
+    def _own_metadata(self) -> Metadata:
+        """The metadata of this node, after copying it if it is shared"""
+        self._detach_lazy_copies()
+        metadata = self._metadata
+        if isinstance(metadata, _SharedMetadata):
+            metadata = copy.copy(metadata)
+            object.__setattr__(self, "_metadata", metadata)
+        return metadata
+
     def _set_parent(self, parent: Optional["Box"]) -> None:
         assert parent is None or isinstance(parent, Box)
-        self.__dict__["_parent"] = parent
+        object.__setattr__(self, "_parent", parent)
         self._invalidate_flags_cache()
 
     def _invalidate_flags_cache(self) -> None:
-        self.__dict__["_flags_cache"] = None
+        object.__setattr__(self, "_flags_cache", None)
+
+    def _invalidate_interpolations(self, content_only: bool = False) -> None:
+        """
+        Evict the cached interpolations depending on this node, after it was modified
+        (see `_InterpolationCache`). With `content_only`, only those depending on
+        the whole content of this container are evicted (e.g. when adding a key).
+        The key index of the root (see `_KeyIndex`) is updated as well.
+        """
+        if not (_interpolation_caches_exist or _key_indexes_exist):
+            return
+        root: Node = self
+        parent = root._get_parent()
+        while parent is not None:
+            root = parent
+            parent = root._get_parent()
+        if isinstance(root, Container):
+            cache = root.__dict__.get("_interpolation_cache")
+            if cache is not None:
+                cache.invalidate(self, content_only)
+            index = root.__dict__.get("_key_index")
+            if index is not None:
+                index.invalidate(self)
 
     def _get_parent(self) -> Optional["Box"]:
-        parent = self.__dict__["_parent"]
+        parent = self._parent
         assert parent is None or isinstance(parent, Box)
         return parent
 
@@ -138,7 +748,7 @@ class Node(ABC):
         Like _get_parent, but returns the grandparent
         in the case where `self` is wrapped by a UnionNode.
         """
-        parent = self.__dict__["_parent"]
+        parent = self._parent
         assert parent is None or isinstance(parent, Box)
 
         if isinstance(parent, UnionNode):
@@ -166,15 +776,21 @@ class Node(ABC):
         if len(flags) != len(values):
             raise ValueError("Inconsistent lengths of input flag names and values")
 
+        self._detach_lazy_copies()
         for idx, flag in enumerate(flags):
             value = values[idx]
             if value is None:
                 assert self._metadata.flags is not None
                 if flag in self._metadata.flags:
                     del self._metadata.flags[flag]
+                    if not self._metadata.flags:
+                        self._metadata.flags = _EMPTY_FLAGS
             else:
-                assert self._metadata.flags is not None
-                self._metadata.flags[flag] = value
+                metadata = self._own_metadata()
+                assert metadata.flags is not None
+                if metadata.flags is _EMPTY_FLAGS:
+                    metadata.flags = {}
+                metadata.flags[flag] = value
         self._invalidate_flags_cache()
         return self
 
@@ -187,9 +803,10 @@ class Node(ABC):
         return self._metadata.flags.get(flag)
 
     def _get_flag(self, flag: str) -> Optional[bool]:
-        cache = self.__dict__["_flags_cache"]
+        cache = self._flags_cache
         if cache is None:
-            cache = self.__dict__["_flags_cache"] = {}
+            cache = {}
+            object.__setattr__(self, "_flags_cache", cache)
 
         ret = cache.get(flag, _DEFAULT_MARKER_)
         if ret is _DEFAULT_MARKER_:
@@ -250,7 +867,7 @@ class Node(ABC):
     def _maybe_dereference_node(
         self,
         throw_on_resolution_failure: bool = False,
-        memo: Optional[Set[int]] = None,
+        memo: Optional[Dict[int, "Node"]] = None,
     ) -> Optional["Node"]:
         return self._dereference_node_impl(
             throw_on_resolution_failure=throw_on_resolution_failure,
@@ -260,7 +877,7 @@ class Node(ABC):
     def _dereference_node_impl(
         self,
         throw_on_resolution_failure: bool,
-        memo: Optional[Set[int]] = None,
+        memo: Optional[Dict[int, "Node"]] = None,
     ) -> Optional["Node"]:
         if not self._is_interpolation():
             return self
@@ -274,11 +891,11 @@ class Node(ABC):
             return None
         assert parent is not None
         key = self._key()
-        return parent._resolve_interpolation_from_parse_tree(
+        return parent._resolve_interpolation_from_program(
             parent=parent,
             key=key,
             value=self,
-            parse_tree=parse(_get_value(self)),
+            program=self._get_program(),
             throw_on_resolution_failure=throw_on_resolution_failure,
             memo=memo,
         )
@@ -299,7 +916,7 @@ class Node(ABC):
         """
         Check if the node's value is `???` (does *not* resolve interpolations).
         """
-        return _is_missing_value(self)
+        return _is_missing_literal(self._value())
 
     def _is_none(self) -> bool:
         """
@@ -335,10 +952,39 @@ class Node(ABC):
     def _is_interpolation(self) -> bool:
         ...
 
+    def _value_kind(self) -> ValueKind:
+        """The kind of this node's value, see `get_value_kind()`"""
+        return get_value_kind(self._value())
+
+    def _get_program(self) -> Program:
+        """The compiled interpolation of this node (which must be an interpolation)"""
+        return compile_interpolation(_get_value(self))
+
     def _key(self) -> Any:
-        return self._metadata.key
+        key = self._metadata.key
+        if type(key) is int and self._parent is not None and self._key_moved(key):
+            key = self._metadata.key
+        return key
+
+    def _key_moved(self, key: int) -> bool:
+        """
+        The keys of list items moved by an insertion or a deletion are updated when
+        first read (see `ListConfig._move_keys()`): if `key` is one of them, update
+        the keys of the parent list and return True.
+        """
+        parent = self._parent
+        assert parent is not None
+        keys_moved_from = parent.__dict__.get("_keys_moved_from")
+        if keys_moved_from is None or key < keys_moved_from:
+            return False
+        from omegaconf import ListConfig
+
+        assert isinstance(parent, ListConfig)
+        parent._update_keys()
+        return True
 
     def _set_key(self, key: Any) -> None:
+        self._detach_lazy_copies()
         self._metadata.key = key
 
     def _is_flags_root(self) -> bool:
@@ -346,7 +992,7 @@ class Node(ABC):
 
     def _set_flags_root(self, flags_root: bool) -> None:
         if self._metadata.flags_root != flags_root:
-            self._metadata.flags_root = flags_root
+            self._own_metadata().flags_root = flags_root
             self._invalidate_flags_cache()
 
     def _has_ref_type(self) -> bool:
@@ -375,21 +1021,23 @@ class Box(Node):
 
         # update parents of first level Config nodes to self
 
+        # The content of lazy containers (see `_LazyContent`) is not created yet: its
+        # children will have the right parent when it is.
         if isinstance(self, DictConfig):
-            content = self.__dict__["_content"]
+            content = self.__dict__.get("_content")
             if isinstance(content, dict):
                 for _key, value in self.__dict__["_content"].items():
                     if value is not None:
                         value._set_parent(self)
-                    if isinstance(value, Box):
+                    if isinstance(value, Box) and "_content" in value.__dict__:
                         value._re_parent()
         elif isinstance(self, ListConfig):
-            content = self.__dict__["_content"]
+            content = self.__dict__.get("_content")
             if isinstance(content, list):
                 for item in self.__dict__["_content"]:
                     if item is not None:
                         item._set_parent(self)
-                    if isinstance(item, Box):
+                    if isinstance(item, Box) and "_content" in item.__dict__:
                         item._re_parent()
         elif isinstance(self, UnionNode):
             content = self.__dict__["_content"]
@@ -407,6 +1055,57 @@ class Container(Box):
     """
 
     _metadata: ContainerMetadata
+    _content: Any = _ContentAttribute()
+
+    def _set_parent(self, parent: Optional["Box"]) -> None:
+        super()._set_parent(parent)
+        if parent is not None:
+            # The key index of a root is not updated once it is part of another config.
+            self.__dict__.pop("_key_index", None)
+
+    @abstractmethod
+    def _copy_content(
+        self, src: "Container", memo: Optional[Dict[int, Any]] = None
+    ) -> None:
+        """
+        Set the content of this container to a copy of the content of `src`, whose
+        children are deep copied with `memo`
+        """
+        ...
+
+    def _copy_content_lazily(self, src: "Container", memo: Dict[int, Any]) -> None:
+        """
+        Make the content of this container a copy-on-write copy of the content of `src`:
+        it is only copied when first accessed, or before `src` is modified (see
+        `Node._detach_lazy_copies()`). Copying the content copies the children of `src`
+        lazily in turn (with `memo`, see `_copies_lazily()`), so that only the accessed
+        or modified parts of a config are actually copied.
+        """
+        global _lazy_copies_exist
+
+        lazy = src.__dict__
+        if type(lazy) is _LazyContent and "_content" not in lazy:
+            # `src` is itself an unmodified lazy copy: share its source. The children
+            # of `src` are not created yet, but `memo` may hold copies of those of the
+            # source, which are not the same nodes.
+            assert lazy.source is not None
+            src = lazy.source
+            memo = {}
+            _copies_lazily(memo)
+        content = src.__dict__["_content"]
+        if not isinstance(content, (dict, list)):
+            self._copy_content(src, memo)
+            return
+
+        state = _LazyContent(self.__dict__)
+        del state["_content"]
+        state.owner, state.source, state.memo = self, src, memo
+        object.__setattr__(self, "__dict__", state)
+        with _lazy_copies_lock:
+            copies = src.__dict__.setdefault("_lazy_copies", [])
+            copies[:] = [ref for ref in copies if ref() is not None]
+            copies.append(weakref.ref(self))
+            _lazy_copies_exist = True
 
     @abstractmethod
     def _get_child(
@@ -469,7 +1168,7 @@ class Container(Box):
         key: str,
         throw_on_missing: bool,
         throw_on_resolution_failure: bool,
-        memo: Optional[Set[int]] = None,
+        memo: Optional[Dict[int, "Node"]] = None,
     ) -> Tuple[Optional["Container"], Optional[str], Optional[Node]]:
         """
         Select a value using dot separated key sequence
@@ -479,8 +1178,14 @@ class Container(Box):
         if key == "":
             return self, "", self
 
-        split = split_key(key)
+        split = _split_key(key)
         root: Optional[Container] = self
+        index = _get_key_index(self) if len(split) > 1 else None
+        parent = None if index is None else index.find_parent(key)
+        if parent is not None:
+            # The nodes above an indexed node are neither interpolations nor missing.
+            root = parent
+            split = split[-1:]
         for i in range(len(split) - 1):
             if root is None:
                 break
@@ -520,42 +1225,29 @@ class Container(Box):
         if value is None:
             return root, last_key, None
 
-        if memo is not None:
-            vid = id(value)
-            if vid in memo:
-                raise InterpolationResolutionError("Recursive interpolation detected")
-            # push to memo "stack"
-            memo.add(vid)
-
-        try:
-            value = root._maybe_resolve_interpolation(
-                parent=root,
-                key=last_key,
-                value=value,
-                throw_on_resolution_failure=throw_on_resolution_failure,
-                memo=memo,
-            )
-        finally:
-            if memo is not None:
-                # pop from memo "stack"
-                memo.remove(vid)
-
+        value = root._maybe_resolve_interpolation(
+            parent=root,
+            key=last_key,
+            value=value,
+            throw_on_resolution_failure=throw_on_resolution_failure,
+            memo=memo,
+        )
         return root, last_key, value
 
-    def _resolve_interpolation_from_parse_tree(
+    def _resolve_interpolation_from_program(
         self,
         parent: Optional["Container"],
         value: "Node",
         key: Any,
-        parse_tree: OmegaConfGrammarParser.ConfigValueContext,
+        program: Program,
         throw_on_resolution_failure: bool,
-        memo: Optional[Set[int]],
+        memo: Optional[Dict[int, "Node"]],
     ) -> Optional["Node"]:
         """
         Resolve an interpolation.
 
         This happens in two steps:
-            1. The parse tree is visited, which outputs either a `Node` (e.g.,
+            1. The compiled interpolation is evaluated, which outputs either a `Node` (e.g.,
                for node interpolations "${foo}"), a string (e.g., for string
                interpolations "hello ${name}", or any other arbitrary value
                (e.g., or custom interpolations "${foo:bar}").
@@ -569,10 +1261,13 @@ class Container(Box):
         :param parent: Parent of the node being resolved.
         :param value: Node being resolved.
         :param key: The associated key in the parent.
-        :param parse_tree: The parse tree as obtained from `grammar_parser.parse()`.
+        :param program: The compiled interpolation, as obtained from
+            `grammar_compiler.compile_interpolation()`.
         :param throw_on_resolution_failure: If `False`, then exceptions raised during
             the resolution of the interpolation are silenced, and instead `None` is
             returned.
+        :param memo: The nodes whose interpolation is currently being resolved (in
+            order), used to detect cycles.
 
         :return: A `Node` that contains the interpolation result. This may be an existing
             node in the config (in the case of a node interpolation "${foo}"), or a new
@@ -580,22 +1275,74 @@ class Container(Box):
             `throw_on_resolution_failure` is `False` and an error occurs during resolution.
         """
 
+        outer = _dependency_recorder.current()
+        if outer is None:
+            results = _resolution_pass.results
+            if results is not None:
+                cached = results.get(id(value))
+                if cached is not None:
+                    return cached[1]
+        else:
+            # Part of the resolution of another interpolation, which depends on it.
+            # The resolution pass memo is bypassed as it does not track dependencies.
+            outer.nodes.append(value)
+            results = None
+
+        cache: Optional[_InterpolationCache] = None
+        if parent is not None and value._get_flag("cache_interpolations"):
+            cache = _get_interpolation_cache(parent._get_root())
+            cached_res = cache.get(value)
+            if cached_res is not None:
+                return cached_res
+
+        deps: Optional[_Dependencies] = None
+        if cache is not None or outer is not None:
+            deps = _Dependencies()
+            version = 0 if cache is None else cache.version
+            _dependency_recorder.stack.append(deps)
+
+        if memo is None:
+            memo = {}
+        vid = id(value)
         try:
-            resolved = self.resolve_parse_tree(
-                parse_tree=parse_tree, node=value, key=key, memo=memo
-            )
+            if vid in memo:
+                raise InterpolationResolutionError(
+                    f"Recursive interpolation detected: {_format_cycle(memo, value)}"
+                )
+            # push to memo "stack"
+            memo[vid] = value
+            try:
+                resolved = self._evaluate_program(
+                    program=program, node=value, key=key, memo=memo
+                )
+            finally:
+                # pop from memo "stack"
+                del memo[vid]
         except InterpolationResolutionError:
             if throw_on_resolution_failure:
                 raise
             return None
+        finally:
+            if deps is not None:
+                _dependency_recorder.stack.pop()
 
-        return self._validate_and_convert_interpolation_result(
+        res = self._validate_and_convert_interpolation_result(
             parent=parent,
             value=value,
             key=key,
             resolved=resolved,
             throw_on_resolution_failure=throw_on_resolution_failure,
         )
+        if res is not None:
+            if results is not None:
+                # Keeping a reference to `value` ensures its id is not reused.
+                results[vid] = (value, res)
+            if deps is not None:
+                if outer is not None:
+                    outer.merge(deps)
+                if cache is not None and deps.cacheable:
+                    cache.put(value, res, deps, version)
+        return res
 
     def _validate_and_convert_interpolation_result(
         self,
@@ -650,7 +1397,7 @@ class Container(Box):
             parent = parent._get_parent()
 
     def _resolve_node_interpolation(
-        self, inter_key: str, memo: Optional[Set[int]]
+        self, inter_key: str, memo: Optional[Dict[int, "Node"]]
     ) -> "Node":
         """A node interpolation is of the form `${foo.bar}`"""
         try:
@@ -676,6 +1423,11 @@ class Container(Box):
             raise InterpolationKeyError(f"Interpolation key '{inter_key}' not found")
         else:
             self._validate_not_dereferencing_to_parent(node=self, target=value)
+            deps = _dependency_recorder.current()
+            if deps is not None:
+                deps.nodes.append(value)
+                if isinstance(value, Container):
+                    deps.containers.append(value)
             return value
 
     def _evaluate_custom_resolver(
@@ -688,6 +1440,10 @@ class Container(Box):
     ) -> Any:
         from omegaconf import OmegaConf
 
+        deps = _dependency_recorder.current()
+        if deps is not None:
+            deps.cacheable = False
+
         resolver = OmegaConf._get_resolver(inter_type)
         if resolver is not None:
             root_node = self._get_root()
@@ -709,27 +1465,25 @@ class Container(Box):
         key: Any,
         value: Node,
         throw_on_resolution_failure: bool,
-        memo: Optional[Set[int]] = None,
+        memo: Optional[Dict[int, "Node"]] = None,
     ) -> Optional[Node]:
-        value_kind = get_value_kind(value)
-        if value_kind != ValueKind.INTERPOLATION:
+        if value._value_kind() is not ValueKind.INTERPOLATION:
             return value
 
-        parse_tree = parse(_get_value(value))
-        return self._resolve_interpolation_from_parse_tree(
+        return self._resolve_interpolation_from_program(
             parent=parent,
             value=value,
             key=key,
-            parse_tree=parse_tree,
+            program=value._get_program(),
             throw_on_resolution_failure=throw_on_resolution_failure,
-            memo=memo if memo is not None else set(),
+            memo=memo,
         )
 
     def resolve_parse_tree(
         self,
         parse_tree: ParserRuleContext,
         node: Node,
-        memo: Optional[Set[int]] = None,
+        memo: Optional[Dict[int, "Node"]] = None,
         key: Optional[Any] = None,
     ) -> Any:
         """
@@ -738,9 +1492,21 @@ class Container(Box):
         We make no assumption here on the type of the tree's root, so that the
         return value may be of any type.
         """
+        return self._evaluate_program(
+            program=compile_parse_tree(parse_tree), node=node, memo=memo, key=key
+        )
+
+    def _evaluate_program(
+        self,
+        program: Program,
+        node: Node,
+        memo: Optional[Dict[int, "Node"]] = None,
+        key: Optional[Any] = None,
+    ) -> Any:
+        """Evaluate a compiled interpolation (see `resolve_parse_tree()`)"""
 
         def node_interpolation_callback(
-            inter_key: str, memo: Optional[Set[int]]
+            inter_key: str, memo: Optional[Dict[int, "Node"]]
         ) -> Optional["Node"]:
             return self._resolve_node_interpolation(inter_key=inter_key, memo=memo)
 
@@ -755,13 +1521,10 @@ class Container(Box):
                 inter_args_str=args_str,
             )
 
-        visitor = GrammarVisitor(
-            node_interpolation_callback=node_interpolation_callback,
-            resolver_interpolation_callback=resolver_interpolation_callback,
-            memo=memo,
-        )
         try:
-            return visitor.visit(parse_tree)
+            return program(
+                node_interpolation_callback, resolver_interpolation_callback, memo
+            )
         except InterpolationResolutionError:
             raise
         except Exception as exc:
@@ -778,13 +1541,13 @@ class Container(Box):
 
         if self.__dict__["_flags_cache"] is not None:
             self.__dict__["_flags_cache"] = None
+            # `get()` does not create the children of lazy copies.
+            content = self.__dict__.get("_content")
             if isinstance(self, DictConfig):
-                content = self.__dict__["_content"]
                 if isinstance(content, dict):
                     for value in self.__dict__["_content"].values():
                         value._invalidate_flags_cache()
             elif isinstance(self, ListConfig):
-                content = self.__dict__["_content"]
                 if isinstance(content, list):
                     for item in self.__dict__["_content"]:
                         item._invalidate_flags_cache()
@@ -850,7 +1613,7 @@ class UnionNode(Box):
             else:
                 return str(self._metadata.key)
         else:
-            return parent._get_full_key(self._metadata.key)
+            return parent._get_full_key(self._key())
 
     def __eq__(self, other: Any) -> bool:
         content = self.__dict__["_content"]
@@ -878,6 +1641,7 @@ class UnionNode(Box):
         return content
 
     def _set_value(self, value: Any, flags: Optional[Dict[str, bool]] = None) -> None:
+        self._detach_lazy_copies()
         previous_content = self.__dict__["_content"]
         previous_metadata = self.__dict__["_metadata"]
         try:
@@ -886,6 +1650,7 @@ class UnionNode(Box):
             self.__dict__["_content"] = previous_content
             self.__dict__["_metadata"] = previous_metadata
             raise e
+        self._invalidate_interpolations()
 
     def _set_value_impl(
         self, value: Any, flags: Optional[Dict[str, bool]] = None
@@ -946,13 +1711,13 @@ class UnionNode(Box):
 
         src_content = self.__dict__["_content"]
         if isinstance(src_content, Node):
-            old_parent = src_content.__dict__["_parent"]
+            old_parent = src_content._parent
             try:
-                src_content.__dict__["_parent"] = None
+                object.__setattr__(src_content, "_parent", None)
                 content_copy = copy.deepcopy(src_content, memo=memo)
-                content_copy.__dict__["_parent"] = res
+                object.__setattr__(content_copy, "_parent", res)
             finally:
-                src_content.__dict__["_parent"] = old_parent
+                object.__setattr__(src_content, "_parent", old_parent)
         else:
             # None and strings can be assigned as is
             content_copy = src_content
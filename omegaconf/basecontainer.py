@@ -2,7 +2,19 @@ import copy
 import sys
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import yaml
 
@@ -12,6 +24,7 @@ from ._utils import (
     _ensure_container,
     _get_value,
     _is_interpolation,
+    _is_missing_literal,
     _is_missing_value,
     _is_none,
     _is_special,
@@ -19,7 +32,6 @@ from ._utils import (
     get_structured_config_data,
     get_type_hint,
     get_value_kind,
-    get_yaml_loader,
     is_container_annotation,
     is_dict_annotation,
     is_list_annotation,
@@ -28,6 +40,8 @@ from ._utils import (
     is_structured_config,
     is_tuple_annotation,
     is_union_annotation,
+    load_dotlist_value,
+    split_key,
 )
 from .base import (
     Box,
@@ -37,10 +51,13 @@ from .base import (
     Node,
     SCMode,
     UnionNode,
+    _find_key_index,
+    _join_full_key,
 )
 from .errors import (
     ConfigCycleDetectedException,
     ConfigTypeError,
+    GrammarParseError,
     InterpolationResolutionError,
     KeyValidationError,
     MissingMandatoryValue,
@@ -52,6 +69,224 @@ from .errors import (
 if TYPE_CHECKING:
     from .dictconfig import DictConfig  # pragma: no cover
 
+# Types of the keys and (non-string) values of plain data, see `_is_plain_value()`.
+_PLAIN_KEY_TYPES = frozenset({str, int})
+_PLAIN_VALUE_TYPES = frozenset({type(None), bool, int, float, bytes, dict, list})
+
+
+def _is_plain_value(value: Any) -> bool:
+    """
+    True if `value` is plain data (as loaded from YAML or JSON), which untyped
+    containers accept as is. Strings are plain if their interpolations are valid.
+    """
+    if type(value) is str:
+        try:
+            get_value_kind(value, strict_interpolation_validation=True)
+        except GrammarParseError:
+            return False
+        return True
+    return type(value) in _PLAIN_VALUE_TYPES
+
+
+class _NotCombinable(Exception):
+    """Merge sources that can only be merged one at a time, see `_plan_merge()`"""
+
+
+def _check_plain_data(value: Any) -> None:
+    """Raise `_NotCombinable` unless `value` is plain data, recursively"""
+    value_type = type(value)
+    if value_type is dict:
+        for key, item in value.items():
+            if type(key) not in _PLAIN_KEY_TYPES:
+                raise _NotCombinable
+            _check_plain_data(item)
+    elif value_type is list:
+        for item in value:
+            _check_plain_data(item)
+    elif not _is_plain_value(value):
+        raise _NotCombinable
+
+
+def _config_plain_data(cfg: Container) -> Any:
+    """
+    The content of `cfg` as plain data, or raise `_NotCombinable` if `cfg` or any of its
+    nodes is typed, has flags or holds a value that is not plain data.
+    """
+    from .dictconfig import DictConfig
+    from .listconfig import ListConfig
+    from .nodes import AnyNode
+
+    def untyped(node: Node) -> bool:
+        md = node._metadata
+        return (
+            md.ref_type is Any
+            and md.optional
+            and not md.flags
+            and not md.flags_root
+            and getattr(md, "element_type", Any) is Any
+        )
+
+    def to_data(node: Node) -> Any:
+        if not untyped(node):
+            raise _NotCombinable
+        node_type = type(node)
+        if node_type is AnyNode:
+            value = node._value()
+            if type(value) not in _PLAIN_VALUE_TYPES and type(value) is not str:
+                raise _NotCombinable
+            return value
+        if node_type is DictConfig:
+            assert isinstance(node, DictConfig)
+            content = node._content
+            if node._metadata.object_type is not dict or type(content) is not dict:
+                raise _NotCombinable
+            data = {}
+            for key, child in content.items():
+                if type(key) not in _PLAIN_KEY_TYPES:
+                    raise _NotCombinable
+                data[key] = to_data(child)
+            return data
+        if node_type is ListConfig:
+            assert isinstance(node, ListConfig)
+            items = node._content
+            if node._metadata.object_type is not list or type(items) is not list:
+                raise _NotCombinable
+            return [to_data(child) for child in items]
+        raise _NotCombinable
+
+    return to_data(cfg)
+
+
+def _combine_plain_data(dest: Dict[Any, Any], src: Dict[Any, Any]) -> Dict[Any, Any]:
+    """
+    Combine the plain data of two merge sources into a single one, such that merging it
+    gives the same result as merging `dest` then `src`. Neither input is modified.
+    Raise `_NotCombinable` when that is not possible:
+      - `src` merges a container over a value of `dest` (e.g. None or "???"), which
+        replaces the value, while merging the combined container would not.
+      - `src` merges a value or a container of a different kind over a container of
+        `dest`, which would hide errors from merging the latter.
+      - `src` overrides an interpolation of `dest`, which might expand to a copy of
+        the container it points to.
+    """
+    result = dict(dest)
+    for key, src_value in src.items():
+        if key not in result:
+            result[key] = src_value
+            continue
+        dest_value = result[key]
+        if _is_interpolation(dest_value):
+            raise _NotCombinable
+        src_type = type(src_value)
+        if src_type is dict or src_type is list:
+            if type(dest_value) is not src_type:
+                raise _NotCombinable
+            if src_type is dict:
+                result[key] = _combine_plain_data(dest_value, src_value)
+            else:
+                # lists are not merged item by item: they replace each other
+                result[key] = src_value
+        elif not _is_missing_literal(src_value):
+            if type(dest_value) is dict or type(dest_value) is list:
+                raise _NotCombinable
+            result[key] = src_value
+    return result
+
+
+def _check_untyped_dest(dest: "DictConfig", data: Dict[Any, Any]) -> None:
+    """
+    Raise `_NotCombinable` unless `dest` and its nodes that `data` is merged into are
+    untyped and neither struct nor read-only: merging combined data into them could
+    validate (and reject) different values than merging the sources one at a time.
+    """
+    from .dictconfig import DictConfig
+    from .listconfig import ListConfig
+    from .nodes import AnyNode
+
+    md = dest._metadata
+    if (
+        md.ref_type is not Any
+        or md.object_type is not dict
+        or md.key_type is not Any
+        or md.element_type is not Any
+        or type(dest._value()) is not dict
+        or dest._get_flag("struct")
+        or dest._get_flag("readonly")
+    ):
+        raise _NotCombinable
+    for key, value in data.items():
+        node = dest._get_node(key, validate_access=False)
+        if node is None:
+            continue
+        if node._get_flag("readonly"):
+            raise _NotCombinable
+        if node._is_interpolation() and type(value) in (dict, list):
+            # Merging a container expands the interpolation into a copy of the node it
+            # points to, which the previous sources of the run may have modified.
+            raise _NotCombinable
+        if type(node) is AnyNode:
+            continue
+        if type(node) is DictConfig:
+            assert isinstance(node, DictConfig)
+            if type(value) is dict:
+                _check_untyped_dest(node, value)
+            elif node._metadata.ref_type is not Any:
+                raise _NotCombinable
+        elif type(node) is ListConfig:
+            md = node._metadata
+            if (
+                md.ref_type is not Any
+                or md.element_type is not Any
+                or type(node._value()) is not list
+            ):
+                raise _NotCombinable
+        else:
+            raise _NotCombinable
+
+
+def _check_resolution_cycle(
+    conf: Container, key: Any, resolved: Node, memo: Set[int]
+) -> None:
+    """
+    Raise if the resolved value of the interpolation `key` of `conf` is a container
+    being traversed (in `memo`): traversing it would never end.
+    """
+    if isinstance(resolved, Container) and id(resolved) in memo:
+        conf._format_and_raise(
+            key=key,
+            value=None,
+            cause=InterpolationResolutionError(
+                "Recursive interpolation detected: the resolved value contains this node"
+            ),
+        )
+
+
+def _yaml_node_events(dumper: Any, node: yaml.Node) -> Iterator[yaml.Event]:
+    """The events emitted by `dumper` to serialize `node` (without aliases)"""
+    if isinstance(node, yaml.ScalarNode):
+        detected_tag = dumper.resolve(yaml.ScalarNode, node.value, (True, False))
+        default_tag = dumper.resolve(yaml.ScalarNode, node.value, (False, True))
+        implicit = (node.tag == detected_tag), (node.tag == default_tag)
+        yield yaml.ScalarEvent(None, node.tag, implicit, node.value, style=node.style)
+    elif isinstance(node, yaml.SequenceNode):
+        implicit = node.tag == dumper.resolve(yaml.SequenceNode, node.value, True)
+        yield yaml.SequenceStartEvent(
+            None, node.tag, implicit, flow_style=node.flow_style
+        )
+        for item in node.value:
+            yield from _yaml_node_events(dumper, item)
+        yield yaml.SequenceEndEvent()
+    else:
+        assert isinstance(node, yaml.MappingNode)
+        implicit = node.tag == dumper.resolve(yaml.MappingNode, node.value, True)
+        yield yaml.MappingStartEvent(
+            None, node.tag, implicit, flow_style=node.flow_style
+        )
+        for key, value in node.value:
+            yield from _yaml_node_events(dumper, key)
+            yield from _yaml_node_events(dumper, value)
+        yield yaml.MappingEndEvent()
+
 
 class BaseContainer(Container, ABC):
     _resolvers: ClassVar[Dict[str, Any]] = {}
@@ -118,10 +353,16 @@ class BaseContainer(Container, ABC):
 
     # Support pickle
     def __getstate__(self) -> Dict[str, Any]:
-        dict_copy = copy.copy(self.__dict__)
+        # Copy the content of lazy copies first, and always return a plain dict.
+        self.__dict__["_content"]
+        dict_copy = dict(self.__dict__)
 
-        # no need to serialize the flags cache, it can be re-constructed later
+        # no need to serialize the flags, interpolation caches and key index, they can be
+        # re-constructed later
         dict_copy.pop("_flags_cache", None)
+        dict_copy.pop("_interpolation_cache", None)
+        dict_copy.pop("_key_index", None)
+        dict_copy.pop("_lazy_copies", None)
 
         dict_copy["_metadata"] = copy.copy(dict_copy["_metadata"])
         ref_type = self._metadata.ref_type
@@ -187,7 +428,7 @@ class BaseContainer(Container, ABC):
         self.merge_with_dotlist(args_list)
 
     def merge_with_dotlist(self, dotlist: List[str]) -> None:
-        from omegaconf import OmegaConf
+        from .omegaconf import _update
 
         def fail() -> None:
             raise ValueError("Input list must be a list or a tuple of strings")
@@ -195,6 +436,7 @@ class BaseContainer(Container, ABC):
         if not isinstance(dotlist, (list, tuple)):
             fail()
 
+        overrides = []
         for arg in dotlist:
             if not isinstance(arg, str):
                 fail()
@@ -205,10 +447,13 @@ class BaseContainer(Container, ABC):
                 value = None
             else:
                 key = arg[0:idx]
-                value = arg[idx + 1 :]
-                value = yaml.load(value, Loader=get_yaml_loader())
+                value = load_dotlist_value(arg[idx + 1 :])
+            overrides.append((split_key(key), value))
 
-            OmegaConf.update(self, key, value)
+        # Overrides sharing a prefix walk it once, see `_update()`.
+        trie: Dict[str, Any] = {}
+        for split, value in overrides:
+            _update(self, split, value, merge=True, force_add=False, trie=trie)
 
     def is_empty(self) -> bool:
         """return true if config is empty"""
@@ -221,9 +466,16 @@ class BaseContainer(Container, ABC):
         throw_on_missing: bool,
         enum_to_str: bool = False,
         structured_config_mode: SCMode = SCMode.DICT,
+        memo: Optional[Set[int]] = None,
     ) -> Union[None, Any, str, Dict[DictKeyType, Any], List[Any]]:
+        """
+        :param memo: The ids of the containers being converted, used to detect
+            interpolations resolving to a container that contains them.
+        """
         from omegaconf import MISSING, DictConfig, ListConfig
 
+        stack: Set[int] = set() if memo is None else memo
+
         def convert(val: Node) -> Any:
             value = val._value()
             if enum_to_str and isinstance(value, Enum):
@@ -242,6 +494,7 @@ class BaseContainer(Container, ABC):
                     node = node._dereference_node()
                 except InterpolationResolutionError as e:
                     conf._format_and_raise(key=key, value=None, cause=e)
+                _check_resolution_cycle(conf, key, node, stack)
 
             if isinstance(node, Container):
                 value = BaseContainer._to_content(
@@ -250,6 +503,7 @@ class BaseContainer(Container, ABC):
                     throw_on_missing=throw_on_missing,
                     enum_to_str=enum_to_str,
                     structured_config_mode=structured_config_mode,
+                    memo=stack,
                 )
             else:
                 value = convert(node)
@@ -287,22 +541,119 @@ class BaseContainer(Container, ABC):
             ):
                 return conf._to_object()
 
+            # push to memo "stack"
+            stack.add(id(conf))
             retdict: Dict[DictKeyType, Any] = {}
             for key in conf.keys():
                 value = get_node_value(key)
                 if enum_to_str and isinstance(key, Enum):
                     key = f"{key.name}"
                 retdict[key] = value
+            # pop from memo "stack"
+            stack.remove(id(conf))
             return retdict
         elif isinstance(conf, ListConfig):
+            values = conf._numeric_values()
+            if values is not None:
+                return values.tolist()
+            stack.add(id(conf))
             retlist: List[Any] = []
             for index in range(len(conf)):
                 item = get_node_value(index)
                 retlist.append(item)
 
+            stack.remove(id(conf))
             return retlist
         assert False
 
+    @staticmethod
+    def _to_yaml_events(
+        conf: Container, resolve: bool, dumper: Any, memo: Optional[Set[int]] = None
+    ) -> Iterator[yaml.Event]:
+        """
+        The YAML events of the dump of `conf`, generated node by node: same result as
+        dumping `_to_content(conf, resolve=resolve, throw_on_missing=False,
+        enum_to_str=True)` with `dumper`, without building the content first.
+        """
+        from omegaconf import MISSING, DictConfig, ListConfig
+
+        stack: Set[int] = set() if memo is None else memo
+
+        def node_events(val: Node) -> Iterator[yaml.Event]:
+            if isinstance(val, Container):
+                yield from BaseContainer._to_yaml_events(val, resolve, dumper, stack)
+            else:
+                yield from data_events(val._value())
+
+        def data_events(data: Any) -> Iterator[yaml.Event]:
+            if isinstance(data, Enum):
+                data = f"{data.name}"
+            yield from _yaml_node_events(dumper, dumper.represent_data(data))
+            # Forget the represented objects, they are not needed for aliases.
+            dumper.represented_objects = {}
+            dumper.object_keeper = []
+
+        def get_node(key: Union[DictKeyType, int]) -> Node:
+            node = conf._get_child(key, throw_on_missing_value=False)
+            assert isinstance(node, Node)
+            if resolve:
+                try:
+                    node = node._dereference_node()
+                except InterpolationResolutionError as e:
+                    conf._format_and_raise(key=key, value=None, cause=e)
+                _check_resolution_cycle(conf, key, node, stack)
+            return node
+
+        if conf._is_none():
+            yield from data_events(None)
+            return
+        elif conf._is_missing():
+            yield from data_events(MISSING)
+            return
+        elif not resolve and conf._is_interpolation():
+            yield from data_events(conf._value())
+            return
+
+        if resolve:
+            _conf = conf._dereference_node()
+            assert isinstance(_conf, Container)
+            conf = _conf
+
+        # push to memo "stack"
+        stack.add(id(conf))
+        if isinstance(conf, DictConfig):
+            yield yaml.MappingStartEvent(
+                None, "tag:yaml.org,2002:map", True, flow_style=False
+            )
+            keys: List[Any] = list(conf.keys())
+            if dumper.sort_keys:
+                try:
+                    keys = sorted(
+                        keys, key=lambda k: k.name if isinstance(k, Enum) else k
+                    )
+                except TypeError:
+                    pass
+            for key in keys:
+                yield from data_events(key)
+                yield from node_events(get_node(key))
+            yield yaml.MappingEndEvent()
+        elif isinstance(conf, ListConfig):
+            yield yaml.SequenceStartEvent(
+                None, "tag:yaml.org,2002:seq", True, flow_style=False
+            )
+            values = conf._numeric_values()
+            if values is not None:
+                for value in values:
+                    yield from data_events(value)
+            else:
+                for index in range(len(conf)):
+                    yield from node_events(get_node(index))
+            yield yaml.SequenceEndEvent()
+        else:
+            assert False
+        # pop from memo "stack"
+        stack.remove(id(conf))
+
     @staticmethod
     def _map_merge(dest: "BaseContainer", src: "BaseContainer") -> None:
         """merge src into dest and return a new copy, does not modified input"""
@@ -454,6 +805,7 @@ class BaseContainer(Container, ABC):
         assert isinstance(dest, ListConfig)
         assert isinstance(src, ListConfig)
 
+        dest._detach_lazy_copies()
         if src._is_none():
             dest._set_value(None)
         elif src._is_missing():
@@ -463,22 +815,26 @@ class BaseContainer(Container, ABC):
         elif src._is_interpolation():
             dest._set_value(src._value())
         else:
-            temp_target = ListConfig(content=[], parent=dest._get_parent())
-            temp_target.__dict__["_metadata"] = copy.deepcopy(
-                dest.__dict__["_metadata"]
-            )
-            is_optional, et = _resolve_optional(dest._metadata.element_type)
-            if is_structured_config(et):
-                prototype = DictConfig(et, ref_type=et, is_optional=is_optional)
-                for item in src._iter_ex(resolve=False):
-                    if isinstance(item, DictConfig):
-                        item = OmegaConf.merge(prototype, item)
-                    temp_target.append(item)
-            else:
-                for item in src._iter_ex(resolve=False):
-                    temp_target.append(item)
+            items = list(src._iter_ex(resolve=False))
+            # A read-only dest is left to `append()` to reject, like smaller lists.
+            if dest._get_flag("readonly") or not dest._set_numeric_items(items):
+                temp_target = ListConfig(content=[], parent=dest._get_parent())
+                temp_target.__dict__["_metadata"] = copy.deepcopy(
+                    dest.__dict__["_metadata"]
+                )
+                is_optional, et = _resolve_optional(dest._metadata.element_type)
+                if is_structured_config(et):
+                    prototype = DictConfig(et, ref_type=et, is_optional=is_optional)
+                    for item in items:
+                        if isinstance(item, DictConfig):
+                            item = OmegaConf.merge(prototype, item)
+                        temp_target.append(item)
+                else:
+                    for item in items:
+                        temp_target.append(item)
 
-            dest.__dict__["_content"] = temp_target.__dict__["_content"]
+                dest.__dict__["_content"] = temp_target.__dict__["_content"]
+            dest._invalidate_interpolations()
 
         # explicit flags on the source config are replacing the flag values in the destination
         flags = src._metadata.flags
@@ -508,7 +864,7 @@ class BaseContainer(Container, ABC):
         from .listconfig import ListConfig
 
         """merge a list of other Config objects into this one, overriding as needed"""
-        for other in others:
+        for other in self._plan_merge(others):
             if other is None:
                 raise ValueError("Cannot merge with a None config")
 
@@ -527,6 +883,138 @@ class BaseContainer(Container, ABC):
         # recursively correct the parent hierarchy after the merge
         self._re_parent()
 
+    def _plan_merge(self, others: Tuple[Any, ...]) -> Iterator[Any]:
+        """
+        The sources to merge into this container, such that merging them one at a time
+        gives the same result as merging `others` one at a time.
+        Each run of consecutive plain sources (untyped, without flags) is combined into
+        a single one by tree reduction, so that this container is walked once for the
+        whole run instead of once per source. A run is merged as is when combining it
+        would not give the same result, see `_combine_plain_data()` and
+        `_check_untyped_dest()`.
+        The sources must be merged as they are generated: a run is checked against this
+        container as it is once the previous sources are merged.
+        """
+        from .dictconfig import DictConfig
+
+        if len(others) < 2 or not isinstance(self, DictConfig):
+            yield from others
+            return
+
+        run: List[Any] = []
+        run_data: List[Dict[Any, Any]] = []
+
+        def flush() -> Iterator[Any]:
+            if len(run) > 1:
+                try:
+                    data = run_data
+                    while len(data) > 1:
+                        data = [
+                            _combine_plain_data(*data[i : i + 2])
+                            if i + 1 < len(data)
+                            else data[i]
+                            for i in range(0, len(data), 2)
+                        ]
+                    assert isinstance(self, DictConfig)
+                    _check_untyped_dest(self, data[0])
+                    run[:] = data
+                except _NotCombinable:
+                    pass
+            yield from run
+            run.clear()
+            run_data.clear()
+
+        for other in others:
+            try:
+                if type(other) is dict:
+                    _check_plain_data(other)
+                    data = other
+                elif type(other) is DictConfig:
+                    data = _config_plain_data(other)
+                else:
+                    raise _NotCombinable
+            except _NotCombinable:
+                yield from flush()
+                yield other
+                continue
+            run.append(other)
+            run_data.append(data)
+        yield from flush()
+
+    def _are_plain_items(self, items: Iterable[Tuple[Any, Any]]) -> bool:
+        """
+        True if `items`, the (key, value) pairs of the new content of this container,
+        can be wrapped with `_wrap_plain_items()`: the container must be untyped and
+        the items must be plain data.
+        """
+        if self._metadata.element_type is not Any:
+            return False
+        return all(
+            type(key) in _PLAIN_KEY_TYPES and _is_plain_value(value)
+            for key, value in items
+        )
+
+    def _wrap_plain_items(
+        self, items: Iterable[Tuple[Any, Any]]
+    ) -> Iterator[Tuple[Any, Node]]:
+        """
+        Wrap the values of `items` (see `_are_plain_items()`) in the child nodes of
+        this container. This builds the same nodes as setting the items one at a time,
+        but without validating them again, which makes `OmegaConf.create()` much faster.
+        """
+        from .nodes import AnyNode
+
+        for key, value in items:
+            value_type = type(value)
+            node: Node
+            if value_type is dict or value_type is list:
+                node = self._wrap_plain_container(key, value)
+            else:
+                node = AnyNode._create_valid(value=value, key=key, parent=self)
+            yield key, node
+
+    def _wrap_plain_container(
+        self, key: Any, value: Union[Dict[Any, Any], List[Any]]
+    ) -> "BaseContainer":
+        """
+        Same as `DictConfig(value, key, self)` or `ListConfig(value, key, self)`,
+        without the checks of their constructors when `value` holds plain items.
+        """
+        from .dictconfig import DictConfig
+        from .listconfig import ListConfig
+
+        node: BaseContainer
+        object_type: Any
+        items: Iterable[Tuple[Any, Any]]
+        if isinstance(value, dict):
+            node = DictConfig.__new__(DictConfig)
+            object_type, key_type, items = dict, Any, value.items()
+        else:
+            node = ListConfig.__new__(ListConfig)
+            object_type, key_type, items = list, int, list(enumerate(value))
+        BaseContainer.__init__(
+            node,
+            parent=self,
+            metadata=ContainerMetadata(
+                ref_type=Any,
+                object_type=object_type,
+                key=key,
+                optional=True,
+                key_type=key_type,
+                element_type=Any,
+            ),
+        )
+        if not node._are_plain_items(items):
+            # The constructors validate the items and report errors.
+            if isinstance(value, dict):
+                return DictConfig(content=value, key=key, parent=self)
+            return ListConfig(content=value, key=key, parent=self)
+        if isinstance(value, dict):
+            node.__dict__["_content"] = dict(node._wrap_plain_items(items))
+        else:
+            node.__dict__["_content"] = [n for _, n in node._wrap_plain_items(items)]
+        return node
+
     # noinspection PyProtectedMember
     def _set_item_impl(self, key: Any, value: Any) -> None:
         """
@@ -558,6 +1046,7 @@ class BaseContainer(Container, ABC):
         if self._get_flag("readonly"):
             raise ReadonlyConfigError("Cannot change read-only config container")
 
+        self._detach_lazy_copies()
         input_is_node = isinstance(value, Node)
         target_node_ref = self._get_node(key)
         assert target_node_ref is None or isinstance(target_node_ref, Node)
@@ -626,6 +1115,11 @@ class BaseContainer(Container, ABC):
             else:
                 self._wrap_value_and_set(key, value, target_type_hint)
 
+        if target_node_ref is None:
+            self._invalidate_interpolations(content_only=True)
+        elif self.__dict__["_content"][key] is not target_node_ref:
+            target_node_ref._invalidate_interpolations()
+
     def _wrap_value_and_set(self, key: Any, val: Any, type_hint: Any) -> None:
         from omegaconf.omegaconf import _maybe_wrap
 
@@ -700,8 +1194,20 @@ class BaseContainer(Container, ABC):
     def _is_optional(self) -> bool:
         return self.__dict__["_metadata"].optional is True
 
+    # The content created lazily (see `_LazyContent`) is always a dict or a list: `get()`
+    # tells None, "???" and interpolations apart without creating it.
+
+    def _is_none(self) -> bool:
+        return self.__dict__.get("_content", ()) is None
+
+    def _is_missing(self) -> bool:
+        return _is_missing_literal(self.__dict__.get("_content"))
+
     def _is_interpolation(self) -> bool:
-        return _is_interpolation(self.__dict__["_content"])
+        return _is_interpolation(self.__dict__.get("_content"))
+
+    def _value_kind(self) -> ValueKind:
+        return get_value_kind(self.__dict__.get("_content"))
 
     @abstractmethod
     def _validate_get(self, key: Any, value: Any = None) -> None:
@@ -721,6 +1227,15 @@ class BaseContainer(Container, ABC):
         if not isinstance(key, (int, str, Enum, float, bool, slice, bytes, type(None))):
             return ""
 
+        index = None if key is None or key == "" else _find_key_index(self)
+        indexed_key = None if index is None else index.full_key(self)
+        if indexed_key is not None:
+            if isinstance(self, ListConfig):
+                if type(key) is int:
+                    return _join_full_key(indexed_key, key, in_list=True)
+            elif type(key) is str and self._metadata.key_type in (Any, str):
+                return _join_full_key(indexed_key, key, in_list=False)
+
         def _slice_to_str(x: slice) -> str:
             if x.step is not None:
                 return f"{x.start}:{x.stop}:{x.step}"
@@ -819,7 +1334,7 @@ def _create_structured_with_missing_fields(
 
 def _update_types(node: Node, ref_type: Any, object_type: Optional[type]) -> None:
     if object_type is not None and not is_primitive_dict(object_type):
-        node._metadata.object_type = object_type
+        node._own_metadata().object_type = object_type
 
     if node._metadata.ref_type is Any:
         _deep_update_type_hint(node, ref_type)
@@ -837,8 +1352,9 @@ def _deep_update_type_hint(node: Node, type_hint: Any) -> None:
     _shallow_validate_type_hint(node, type_hint)
 
     new_is_optional, new_ref_type = _resolve_optional(type_hint)
-    node._metadata.ref_type = new_ref_type
-    node._metadata.optional = new_is_optional
+    metadata = node._own_metadata()
+    metadata.ref_type = new_ref_type
+    metadata.optional = new_is_optional
 
     if is_list_annotation(new_ref_type) and isinstance(node, ListConfig):
         new_element_type = get_list_element_type(new_ref_type)
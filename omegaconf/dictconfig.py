@@ -38,7 +38,7 @@ from ._utils import (
     is_structured_config_frozen,
     type_str,
 )
-from .base import Box, Container, ContainerMetadata, DictKeyType, Node
+from .base import Box, Container, ContainerMetadata, DictKeyType, Node, _copies_lazily
 from .basecontainer import BaseContainer
 from .errors import (
     ConfigAttributeError,
@@ -111,32 +111,42 @@ class DictConfig(BaseContainer, MutableMapping[Any, Any]):
             format_and_raise(node=None, key=key, value=None, cause=ex, msg=str(ex))
 
     def __deepcopy__(self, memo: Dict[int, Any]) -> "DictConfig":
+        lazy = _copies_lazily(memo)
         res = DictConfig(None)
         res.__dict__["_metadata"] = copy.deepcopy(self.__dict__["_metadata"], memo=memo)
         res.__dict__["_flags_cache"] = copy.deepcopy(
             self.__dict__["_flags_cache"], memo=memo
         )
+        # parent is retained, but not copied
+        res.__dict__["_parent"] = self.__dict__["_parent"]
+        if lazy:
+            res._copy_content_lazily(self, memo)
+        else:
+            res._copy_content(self, memo)
+        return res
 
-        src_content = self.__dict__["_content"]
+    def _copy_content(
+        self, src: Container, memo: Optional[Dict[int, Any]] = None
+    ) -> None:
+        src_content = src.__dict__["_content"]
         if isinstance(src_content, dict):
             content_copy = {}
             for k, v in src_content.items():
-                old_parent = v.__dict__["_parent"]
+                old_parent = v._parent
                 try:
-                    v.__dict__["_parent"] = None
-                    vc = copy.deepcopy(v, memo=memo)
-                    vc.__dict__["_parent"] = res
+                    object.__setattr__(v, "_parent", None)
+                    vc = copy.deepcopy(v, memo)
+                    object.__setattr__(vc, "_parent", self)
+                    # the flags of this container may have changed since it was copied
+                    vc._invalidate_flags_cache()
                     content_copy[k] = vc
                 finally:
-                    v.__dict__["_parent"] = old_parent
+                    object.__setattr__(v, "_parent", old_parent)
         else:
             # None and strings can be assigned as is
             content_copy = src_content
 
-        res.__dict__["_content"] = content_copy
-        # parent is retained, but not copied
-        res.__dict__["_parent"] = self.__dict__["_parent"]
-        return res
+        self.__dict__["_content"] = content_copy
 
     def copy(self) -> "DictConfig":
         return copy.copy(self)
@@ -388,11 +398,13 @@ class DictConfig(BaseContainer, MutableMapping[Any, Any]):
                     "DictConfig in read-only mode does not support deletion"
                 ),
             )
+        self._detach_lazy_copies()
         try:
-            del self.__dict__["_content"][key]
+            node = self.__dict__["_content"].pop(key)
         except KeyError:
             msg = "Attribute not found: '$KEY'"
             self._format_and_raise(key=key, value=None, cause=ConfigAttributeError(msg))
+        node._invalidate_interpolations()
 
     def __delitem__(self, key: DictKeyType) -> None:
         key = self._validate_and_normalize_key(key)
@@ -421,11 +433,13 @@ class DictConfig(BaseContainer, MutableMapping[Any, Any]):
                 ),
             )
 
+        self._detach_lazy_copies()
         try:
-            del self.__dict__["_content"][key]
+            node = self.__dict__["_content"].pop(key)
         except KeyError:
             msg = "Key not found: '$KEY'"
             self._format_and_raise(key=key, value=None, cause=ConfigKeyError(msg))
+        node._invalidate_interpolations()
 
     def get(self, key: DictKeyType, default_value: Any = None) -> Any:
         """Return the value for `key` if `key` is in the dictionary, else
@@ -639,12 +653,14 @@ class DictConfig(BaseContainer, MutableMapping[Any, Any]):
         self._metadata.object_type = object_type
 
     def _set_value(self, value: Any, flags: Optional[Dict[str, bool]] = None) -> None:
+        self._detach_lazy_copies()
         try:
             previous_content = self.__dict__["_content"]
             self._set_value_impl(value, flags)
         except Exception as e:
             self.__dict__["_content"] = previous_content
             raise e
+        self._invalidate_interpolations()
 
     def _set_value_impl(
         self, value: Any, flags: Optional[Dict[str, bool]] = None
@@ -685,9 +701,16 @@ class DictConfig(BaseContainer, MutableMapping[Any, Any]):
                 self._metadata.object_type = value._metadata.object_type
 
             elif isinstance(value, dict):
-                with flag_override(self, ["struct", "readonly"], False):
-                    for k, v in value.items():
-                        self.__setitem__(k, v)
+                if self._metadata.key_type is Any and self._are_plain_items(
+                    value.items()
+                ):
+                    self.__dict__["_content"] = dict(
+                        self._wrap_plain_items(value.items())
+                    )
+                else:
+                    with flag_override(self, ["struct", "readonly"], False):
+                        for k, v in value.items():
+                            self.__setitem__(k, v)
                 self._metadata.object_type = dict
 
             else:  # pragma: no cover
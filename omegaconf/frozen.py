@@ -0,0 +1,168 @@
+"""
+Immutable, fully resolved snapshots of configs (see `OmegaConf.freeze()`).
+
+Snapshots only hold the resolved values: there are no nodes, parents, metadata or
+flags to go through when reading them, which makes them much faster to read and
+much smaller than the configs they were created from.
+"""
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    NoReturn,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+from .errors import ConfigAttributeError, ConfigKeyError, ReadonlyConfigError
+
+
+class _Frozen:
+    __slots__ = ()
+
+    def __setattr__(self, key: str, value: Any) -> NoReturn:
+        raise ReadonlyConfigError("Cannot modify a frozen config")
+
+    def __delattr__(self, key: str) -> NoReturn:
+        raise ReadonlyConfigError("Cannot modify a frozen config")
+
+    def __setitem__(self, key: Any, value: Any) -> NoReturn:
+        raise ReadonlyConfigError("Cannot modify a frozen config")
+
+    def __delitem__(self, key: Any) -> NoReturn:
+        raise ReadonlyConfigError("Cannot modify a frozen config")
+
+    def __copy__(self) -> Any:
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Any:
+        return self
+
+
+class FrozenDict(_Frozen, Mapping[Any, Any]):
+    """
+    Immutable mapping, whose values can also be accessed as attributes (like with
+    a `DictConfig`).
+    """
+
+    __slots__ = ("_content",)
+
+    _content: Dict[Any, Any]
+
+    def __init__(self, content: Mapping[Any, Any]) -> None:
+        object.__setattr__(self, "_content", dict(content))
+
+    def __getattr__(self, key: str) -> Any:
+        if key.startswith("__"):
+            raise AttributeError(key)
+        try:
+            return self._content[key]
+        except KeyError:
+            raise ConfigAttributeError(f"Missing key {key}") from None
+
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            return self._content[key]
+        except KeyError:
+            raise ConfigKeyError(f"Missing key {key!s}") from None
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._content)
+
+    def __len__(self) -> int:
+        return len(self._content)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._content
+
+    def get(self, key: Any, default_value: Any = None) -> Any:
+        return self._content.get(key, default_value)
+
+    def __dir__(self) -> Iterable[str]:
+        return [key for key in self._content if isinstance(key, str)]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, FrozenDict):
+            return self._content == other._content
+        if isinstance(other, Mapping):
+            return self._content == dict(other)
+        return NotImplemented
+
+    def __ne__(self, other: Any) -> bool:
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self._content.items()))
+
+    def __repr__(self) -> str:
+        return repr(self._content)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return FrozenDict, (self._content,)
+
+
+class FrozenList(_Frozen, Sequence[Any]):
+    """Immutable sequence, compared equal to lists with the same items."""
+
+    __slots__ = ("_content",)
+
+    _content: Tuple[Any, ...]
+
+    def __init__(self, content: Iterable[Any]) -> None:
+        object.__setattr__(self, "_content", tuple(content))
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "FrozenList":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return FrozenList(self._content[index])
+        return self._content[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._content)
+
+    def __len__(self) -> int:
+        return len(self._content)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._content
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, FrozenList):
+            return self._content == other._content
+        if isinstance(other, (list, tuple, Sequence)) and not isinstance(other, str):
+            return self._content == tuple(other)
+        return NotImplemented
+
+    def __ne__(self, other: Any) -> bool:
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    def __hash__(self) -> int:
+        return hash(self._content)
+
+    def __repr__(self) -> str:
+        return repr(list(self._content))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return FrozenList, (self._content,)
+
+
+def freeze_content(value: Any) -> Any:
+    """Recursively turn the output of `OmegaConf.to_container()` into a snapshot"""
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze_content(v) for key, v in value.items()})
+    elif isinstance(value, (list, tuple)):
+        return FrozenList(freeze_content(v) for v in value)
+    return value
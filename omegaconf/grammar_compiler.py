@@ -0,0 +1,761 @@
+"""
+Compilation of interpolation parse trees into reusable evaluation programs.
+
+`GrammarVisitor` walks the ANTLR parse tree each time an interpolation is resolved.
+The compiler below walks it only once, and lowers it into a tree of small closures
+in which everything that does not depend on the config (literal chunks, constant
+keys, un-escaped strings, resolver names and constant resolver arguments) has
+already been computed. Evaluating the resulting `Program` has the same semantics as
+visiting the parse tree with `GrammarVisitor`.
+
+The most common interpolations (those matched by `SIMPLE_INTERPOLATION_PATTERN`)
+are compiled directly from the string, without running the ANTLR lexer / parser.
+"""
+import re
+import threading
+import warnings
+import weakref
+from itertools import zip_longest
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from antlr4 import ParserRuleContext, TerminalNode
+
+from ._utils import _get_value
+from .errors import InterpolationResolutionError
+from .grammar.gen.OmegaConfGrammarLexer import OmegaConfGrammarLexer
+from .grammar.gen.OmegaConfGrammarParser import OmegaConfGrammarParser
+from .grammar_parser import (
+    DEFAULT_PARSE_CACHE_SIZE,
+    SIMPLE_INTERPOLATION_PATTERN,
+    CacheInfo,
+    LRUCache,
+    parse,
+)
+
+if TYPE_CHECKING:
+    from .base import Node  # noqa F401
+
+NodeInterpolationCallback = Callable[
+    [str, Optional[Dict[int, "Node"]]], Optional["Node"]
+]
+ResolverInterpolationCallback = Callable[..., Any]
+
+
+class _Env:
+    """Runtime environment of a program evaluation."""
+
+    __slots__ = (
+        "node_interpolation_callback",
+        "resolver_interpolation_callback",
+        "memo",
+    )
+
+    def __init__(
+        self,
+        node_interpolation_callback: NodeInterpolationCallback,
+        resolver_interpolation_callback: ResolverInterpolationCallback,
+        memo: Optional[Dict[int, "Node"]],
+    ) -> None:
+        self.node_interpolation_callback = node_interpolation_callback
+        self.resolver_interpolation_callback = resolver_interpolation_callback
+        self.memo = memo
+
+
+Evaluator = Callable[[_Env], Any]
+
+
+class _Const:
+    """A compiled sub-expression whose value does not depend on the config."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+# A compiled sub-expression.
+_Code = Union[_Const, Evaluator]
+
+
+class Program:
+    """
+    The compiled form of an interpolation parse tree.
+
+    Calling a program with the same callbacks as `GrammarVisitor` returns the same
+    result as `GrammarVisitor(...).visit(parse_tree)`.
+
+    `node_keys` holds the constant keys of the node interpolations found in the
+    program (e.g. `("foo", "bar")` for `"${foo}_${bar}"`), i.e. the config nodes it
+    is known to depend on before being evaluated.
+    """
+
+    __slots__ = ("_code", "node_keys")
+
+    def __init__(self, code: _Code, node_keys: Tuple[str, ...] = ()) -> None:
+        self._code = code
+        self.node_keys = node_keys
+
+    def __call__(
+        self,
+        node_interpolation_callback: NodeInterpolationCallback,
+        resolver_interpolation_callback: ResolverInterpolationCallback,
+        memo: Optional[Dict[int, "Node"]],
+    ) -> Any:
+        code = self._code
+        if isinstance(code, _Const):
+            return code.value
+        return code(
+            _Env(node_interpolation_callback, resolver_interpolation_callback, memo)
+        )
+
+
+def _evaluator(code: _Code) -> Evaluator:
+    if isinstance(code, _Const):
+        value = code.value
+        return lambda env: value
+    return code
+
+
+def _empty_str_warning(text: str) -> None:
+    # DEPRECATED: remove in 2.2 (revert #571)
+    warnings.warn(
+        f"In the sequence `{text}` some elements are missing: please replace "
+        f"them with empty quoted strings. "
+        f"See https://github.com/omry/omegaconf/issues/572 for details.",
+        category=UserWarning,
+    )
+
+
+class GrammarCompiler:
+    """
+    Lower a parse tree into a `Program`.
+
+    The methods of this class mirror the `visit*()` methods of `GrammarVisitor`.
+    """
+
+    def __init__(self) -> None:
+        self._node_keys: List[str] = []
+
+    def compile(self, ctx: ParserRuleContext) -> Program:
+        self._node_keys = []
+        code = self._compile(ctx)
+        return Program(code, tuple(self._node_keys))
+
+    def _compile(self, ctx: Any) -> _Code:
+        if isinstance(ctx, OmegaConfGrammarParser.ConfigValueContext):
+            # text EOF
+            assert ctx.getChildCount() == 2
+            return self._compile(ctx.getChild(0))
+        elif isinstance(ctx, OmegaConfGrammarParser.SingleElementContext):
+            # element EOF
+            assert ctx.getChildCount() == 2
+            return self._compile(ctx.getChild(0))
+        elif isinstance(ctx, OmegaConfGrammarParser.TextContext):
+            return self._compile_text(ctx)
+        elif isinstance(ctx, OmegaConfGrammarParser.ElementContext):
+            # primitive | quotedValue | listContainer | dictContainer
+            assert ctx.getChildCount() == 1
+            return self._compile(ctx.getChild(0))
+        elif isinstance(
+            ctx,
+            (
+                OmegaConfGrammarParser.PrimitiveContext,
+                OmegaConfGrammarParser.DictKeyContext,
+            ),
+        ):
+            return self._compile_primitive(ctx)
+        elif isinstance(ctx, OmegaConfGrammarParser.QuotedValueContext):
+            return self._compile_quoted_value(ctx)
+        elif isinstance(ctx, OmegaConfGrammarParser.ListContainerContext):
+            return self._compile_list_container(ctx)
+        elif isinstance(ctx, OmegaConfGrammarParser.DictContainerContext):
+            return self._compile_dict_container(ctx)
+        elif isinstance(ctx, OmegaConfGrammarParser.InterpolationContext):
+            return self._compile_interpolation(ctx)
+        else:  # pragma: no cover
+            raise NotImplementedError(type(ctx).__name__)
+
+    def _compile_text(self, ctx: OmegaConfGrammarParser.TextContext) -> _Code:
+        # (interpolation | ANY_STR | ESC | ESC_INTER | TOP_ESC | QUOTED_ESC)+
+
+        # Single interpolation? If yes, its resolved value is returned "as is".
+        if ctx.getChildCount() == 1:
+            c = ctx.getChild(0)
+            if isinstance(c, OmegaConfGrammarParser.InterpolationContext):
+                return self._compile_interpolation(c)
+
+        # Otherwise, concatenate string representations together.
+        return self._compile_unescape(list(ctx.getChildren()))
+
+    def _compile_interpolation(
+        self, ctx: OmegaConfGrammarParser.InterpolationContext
+    ) -> Evaluator:
+        assert ctx.getChildCount() == 1  # interpolationNode | interpolationResolver
+        child = ctx.getChild(0)
+        if isinstance(child, OmegaConfGrammarParser.InterpolationNodeContext):
+            return self._compile_interpolation_node(child)
+        else:
+            assert isinstance(
+                child, OmegaConfGrammarParser.InterpolationResolverContext
+            )
+            return self._compile_interpolation_resolver(child)
+
+    def _compile_interpolation_node(
+        self, ctx: OmegaConfGrammarParser.InterpolationNodeContext
+    ) -> Evaluator:
+        # INTER_OPEN
+        # DOT*                                                     // relative interpolation?
+        # (configKey | BRACKET_OPEN configKey BRACKET_CLOSE)       // foo, [foo]
+        # (DOT configKey | BRACKET_OPEN configKey BRACKET_CLOSE)*  // .foo, [foo], .foo[bar], [foo].bar[baz]
+        # INTER_CLOSE;
+        assert ctx.getChildCount() >= 3
+
+        tokens: List[_Code] = []  # parsed elements of the dot path
+        for child in ctx.getChildren():
+            if isinstance(child, TerminalNode):
+                s = child.symbol
+                if s.type in [
+                    OmegaConfGrammarLexer.DOT,
+                    OmegaConfGrammarLexer.BRACKET_OPEN,
+                    OmegaConfGrammarLexer.BRACKET_CLOSE,
+                ]:
+                    tokens.append(_Const(s.text))
+                else:
+                    assert s.type in (
+                        OmegaConfGrammarLexer.INTER_OPEN,
+                        OmegaConfGrammarLexer.INTER_CLOSE,
+                    )
+            else:
+                assert isinstance(child, OmegaConfGrammarParser.ConfigKeyContext)
+                tokens.append(self._compile_config_key(child))
+
+        inter_key = _compile_join(tokens)
+        if isinstance(inter_key, _Const):
+            self._node_keys.append(inter_key.value)
+            return _node_interpolation(inter_key.value)
+
+        get_key = inter_key
+
+        def resolve_key(env: _Env) -> Any:
+            return env.node_interpolation_callback(get_key(env), env.memo)
+
+        return resolve_key
+
+    def _compile_config_key(
+        self, ctx: OmegaConfGrammarParser.ConfigKeyContext
+    ) -> _Code:
+        # interpolation | ID | INTER_KEY
+        assert ctx.getChildCount() == 1
+        child = ctx.getChild(0)
+        if isinstance(child, OmegaConfGrammarParser.InterpolationContext):
+            inter = self._compile_interpolation(child)
+            text = child.getText()
+
+            def config_key(env: _Env) -> str:
+                res = _get_value(inter(env))
+                if not isinstance(res, str):
+                    raise InterpolationResolutionError(
+                        f"The following interpolation is used to denote a config key "
+                        f"and thus should return a string, but instead returned "
+                        f"`{res}` of type `{type(res)}`: {text}"
+                    )
+                return res
+
+            return config_key
+        else:
+            assert isinstance(child, TerminalNode) and isinstance(
+                child.symbol.text, str
+            )
+            return _Const(child.symbol.text)
+
+    def _compile_interpolation_resolver(
+        self, ctx: OmegaConfGrammarParser.InterpolationResolverContext
+    ) -> Evaluator:
+        # INTER_OPEN resolverName COLON sequence? BRACE_CLOSE
+        assert 4 <= ctx.getChildCount() <= 5
+
+        name = self._compile_resolver_name(ctx.getChild(1))
+        maybe_seq = ctx.getChild(3)
+        if isinstance(maybe_seq, TerminalNode):  # means there are no args
+            assert maybe_seq.symbol.type == OmegaConfGrammarLexer.BRACE_CLOSE
+            seq: _Code = _Const(())
+            args_str: Tuple[str, ...] = ()
+        else:
+            assert isinstance(maybe_seq, OmegaConfGrammarParser.SequenceContext)
+            seq, args_str = self._compile_sequence(maybe_seq)
+
+        if isinstance(name, _Const) and isinstance(seq, _Const):
+            return _resolver_interpolation(name.value, seq.value, args_str)
+
+        get_name, get_args = _evaluator(name), _evaluator(seq)
+
+        def call(env: _Env) -> Any:
+            resolver_name = get_name(env)
+            return env.resolver_interpolation_callback(
+                name=resolver_name, args=get_args(env), args_str=args_str
+            )
+
+        return call
+
+    def _compile_resolver_name(
+        self, ctx: OmegaConfGrammarParser.ResolverNameContext
+    ) -> _Code:
+        # (interpolation | ID) (DOT (interpolation | ID))*
+        assert ctx.getChildCount() >= 1
+        items: List[_Code] = []
+        for child in list(ctx.getChildren())[::2]:
+            if isinstance(child, TerminalNode):
+                assert child.symbol.type == OmegaConfGrammarLexer.ID
+                items.append(_Const(child.symbol.text))
+            else:
+                assert isinstance(child, OmegaConfGrammarParser.InterpolationContext)
+                items.append(self._compile_resolver_name_item(child))
+
+        if all(isinstance(item, _Const) for item in items):
+            return _Const(".".join(item.value for item in items))  # type: ignore
+        evaluators = [_evaluator(item) for item in items]
+
+        def resolver_name(env: _Env) -> str:
+            return ".".join([ev(env) for ev in evaluators])
+
+        return resolver_name
+
+    def _compile_sequence(
+        self, ctx: OmegaConfGrammarParser.SequenceContext
+    ) -> Tuple[_Code, Tuple[str, ...]]:
+        """
+        Compile a sequence into an expression evaluating to the tuple of its values.
+
+        Also return the original text representation of each element (see
+        `GrammarVisitor.visitSequence()`).
+        """
+        # (element (COMMA element?)*) | (COMMA element?)+
+        assert ctx.getChildCount() >= 1
+
+        # Each item is either a compiled element, or None for a missing element.
+        items: List[Optional[_Code]] = []
+        texts: List[str] = []
+        is_previous_comma = True  # whether previous child was a comma (init to True)
+        for child in ctx.getChildren():
+            if isinstance(child, OmegaConfGrammarParser.ElementContext):
+                items.append(self._compile_element_value(child))
+                texts.append(child.getText())
+                is_previous_comma = False
+            else:
+                assert (
+                    isinstance(child, TerminalNode)
+                    and child.symbol.type == OmegaConfGrammarLexer.COMMA
+                )
+                if is_previous_comma:
+                    items.append(None)
+                    texts.append("")
+                else:
+                    is_previous_comma = True
+        if is_previous_comma:
+            # Trailing comma.
+            items.append(None)
+            texts.append("")
+
+        if all(isinstance(item, _Const) for item in items):
+            return _Const(tuple(item.value for item in items)), tuple(texts)  # type: ignore
+
+        seq_text = ctx.getText()
+        steps = [None if item is None else _evaluator(item) for item in items]
+
+        def sequence(env: _Env) -> Tuple[Any, ...]:
+            values = []
+            for step in steps:
+                if step is None:
+                    _empty_str_warning(seq_text)
+                    values.append("")
+                else:
+                    values.append(step(env))
+            return tuple(values)
+
+        return sequence, tuple(texts)
+
+    def _compile_list_container(
+        self, ctx: OmegaConfGrammarParser.ListContainerContext
+    ) -> Evaluator:
+        # BRACKET_OPEN sequence? BRACKET_CLOSE;
+        assert ctx.getChildCount() in (2, 3)
+        if ctx.getChildCount() == 2:
+            return lambda env: []
+        sequence = ctx.getChild(1)
+        assert isinstance(sequence, OmegaConfGrammarParser.SequenceContext)
+        # A new list must be created on each evaluation, since it is mutable.
+        get_values = _evaluator(self._compile_sequence(sequence)[0])
+        return lambda env: list(get_values(env))
+
+    def _compile_dict_container(
+        self, ctx: OmegaConfGrammarParser.DictContainerContext
+    ) -> Evaluator:
+        # BRACE_OPEN (dictKeyValuePair (COMMA dictKeyValuePair)*)? BRACE_CLOSE
+        assert ctx.getChildCount() >= 2
+        pairs: List[Tuple[Evaluator, Evaluator]] = []
+        for i in range(1, ctx.getChildCount() - 1, 2):
+            pair = ctx.getChild(i)
+            # dictKey COLON element
+            assert pair.getChildCount() == 3
+            colon = pair.getChild(1)
+            assert (
+                isinstance(colon, TerminalNode)
+                and colon.symbol.type == OmegaConfGrammarLexer.COLON
+            )
+            pairs.append(
+                (
+                    _evaluator(self._compile(pair.getChild(0))),
+                    _evaluator(self._compile_element_value(pair.getChild(2))),
+                )
+            )
+
+        # A new dict must be created on each evaluation, since it is mutable.
+        def dict_container(env: _Env) -> Dict[Any, Any]:
+            return dict((key(env), value(env)) for key, value in pairs)
+
+        return dict_container
+
+    def _compile_quoted_value(
+        self, ctx: OmegaConfGrammarParser.QuotedValueContext
+    ) -> _Code:
+        # (QUOTE_OPEN_SINGLE | QUOTE_OPEN_DOUBLE) text? MATCHING_QUOTE_CLOSE
+        n = ctx.getChildCount()
+        assert n in [2, 3]
+        if n == 2:
+            return _Const("")
+        text = self._compile(ctx.getChild(1))
+        if isinstance(text, _Const):
+            return _Const(str(text.value))
+        return lambda env: str(text(env))  # type: ignore
+
+    def _compile_primitive(
+        self,
+        ctx: Union[
+            OmegaConfGrammarParser.PrimitiveContext,
+            OmegaConfGrammarParser.DictKeyContext,
+        ],
+    ) -> _Code:
+        # (ID | NULL | INT | FLOAT | BOOL | UNQUOTED_CHAR | COLON | ESC | WS | interpolation)+
+        if ctx.getChildCount() == 1:
+            child = ctx.getChild(0)
+            if isinstance(child, OmegaConfGrammarParser.InterpolationContext):
+                return self._compile_interpolation(child)
+            assert isinstance(child, TerminalNode)
+            symbol = child.symbol
+            # Parse primitive types.
+            if symbol.type in (
+                OmegaConfGrammarLexer.ID,
+                OmegaConfGrammarLexer.UNQUOTED_CHAR,
+                OmegaConfGrammarLexer.COLON,
+            ):
+                return _Const(symbol.text)
+            elif symbol.type == OmegaConfGrammarLexer.NULL:
+                return _Const(None)
+            elif symbol.type == OmegaConfGrammarLexer.INT:
+                return _Const(int(symbol.text))
+            elif symbol.type == OmegaConfGrammarLexer.FLOAT:
+                return _Const(float(symbol.text))
+            elif symbol.type == OmegaConfGrammarLexer.BOOL:
+                return _Const(symbol.text.lower() == "true")
+            elif symbol.type == OmegaConfGrammarLexer.ESC:
+                return self._compile_unescape([child])
+            elif symbol.type == OmegaConfGrammarLexer.WS:  # pragma: no cover
+                # A single WS should have been "consumed" by another token.
+                raise AssertionError("WS should never be reached")
+            assert False, symbol.type
+        # Concatenation of multiple items ==> un-escape the concatenation.
+        return self._compile_unescape(list(ctx.getChildren()))
+
+    def _compile_unescape(
+        self,
+        seq: List[Union[TerminalNode, OmegaConfGrammarParser.InterpolationContext]],
+    ) -> _Code:
+        """
+        Compile the concatenation of all symbols / interpolations in `seq`.
+
+        Symbols are un-escaped at compile time (see `GrammarVisitor._unescape()`), and
+        consecutive symbols are merged into a single literal chunk.
+        """
+        chunks: List[_Code] = []
+        for node, next_node in zip_longest(seq, seq[1:]):
+            if isinstance(node, TerminalNode):
+                s = node.symbol
+                if s.type == OmegaConfGrammarLexer.ESC_INTER:
+                    # `ESC_INTER` is of the form `\\...\${`: the formula below computes
+                    # the number of characters to keep at the end of the string to remove
+                    # the correct number of backslashes.
+                    text = s.text[-(len(s.text) // 2 + 1) :]
+                elif (
+                    # Character sequence identified as requiring un-escaping.
+                    s.type == OmegaConfGrammarLexer.ESC
+                    or (
+                        # At top level, we need to un-escape backslashes that precede
+                        # an interpolation.
+                        s.type == OmegaConfGrammarLexer.TOP_ESC
+                        and isinstance(
+                            next_node, OmegaConfGrammarParser.InterpolationContext
+                        )
+                    )
+                    or (
+                        # In a quoted sring, we need to un-escape backslashes that
+                        # either end the string, or are followed by an interpolation.
+                        s.type == OmegaConfGrammarLexer.QUOTED_ESC
+                        and (
+                            next_node is None
+                            or isinstance(
+                                next_node, OmegaConfGrammarParser.InterpolationContext
+                            )
+                        )
+                    )
+                ):
+                    text = s.text[1::2]  # un-escape the sequence
+                else:
+                    text = s.text  # keep the original text
+                chunks.append(_Const(text))
+            else:
+                assert isinstance(node, OmegaConfGrammarParser.InterpolationContext)
+                chunks.append(_compile_str(self._compile_interpolation(node)))
+
+        return _compile_join(chunks)
+
+    def _compile_element_value(
+        self, ctx: OmegaConfGrammarParser.ElementContext
+    ) -> _Code:
+        """Compile an element, whose value is extracted from its node (if any)"""
+        element = self._compile(ctx)
+        if isinstance(element, _Const):
+            return element
+        return lambda env: _get_value(element(env))  # type: ignore
+
+    def _compile_resolver_name_item(
+        self, ctx: OmegaConfGrammarParser.InterpolationContext
+    ) -> Evaluator:
+        inter = self._compile_interpolation(ctx)
+        text = ctx.getText()
+
+        def resolver_name_item(env: _Env) -> str:
+            item = _get_value(inter(env))
+            if not isinstance(item, str):
+                raise InterpolationResolutionError(
+                    f"The name of a resolver must be a string, but the interpolation "
+                    f"{text} resolved to `{item}` which is of type {type(item)}"
+                )
+            return item
+
+        return resolver_name_item
+
+
+def _node_interpolation(key: str) -> Evaluator:
+    """Node interpolation with a constant key, e.g. `${foo.bar}`"""
+
+    def node_interpolation(env: _Env) -> Any:
+        return env.node_interpolation_callback(key, env.memo)
+
+    return node_interpolation
+
+
+def _resolver_interpolation(
+    name: str, args: Tuple[Any, ...], args_str: Tuple[str, ...]
+) -> Evaluator:
+    """Resolver interpolation with constant name and arguments, e.g. `${foo:1,bar}`"""
+
+    def resolver_interpolation(env: _Env) -> Any:
+        return env.resolver_interpolation_callback(
+            name=name, args=args, args_str=args_str
+        )
+
+    return resolver_interpolation
+
+
+def _compile_str(inter: Evaluator) -> Evaluator:
+    """Interpolations are cast to string *WITHOUT* escaping their result"""
+    return lambda env: str(inter(env))
+
+
+def _compile_join(chunks: List[_Code]) -> _Code:
+    """Compile the concatenation of string expressions, merging literal chunks"""
+    merged: List[Union[str, Evaluator]] = []
+    for chunk in chunks:
+        if isinstance(chunk, _Const):
+            if merged and isinstance(merged[-1], str):
+                merged[-1] += chunk.value
+            else:
+                merged.append(chunk.value)
+        else:
+            merged.append(chunk)
+
+    if not merged:
+        return _Const("")
+    if len(merged) == 1 and isinstance(merged[0], str):
+        return _Const(merged[0])
+
+    parts = tuple(merged)
+
+    def join(env: _Env) -> str:
+        return "".join([p if type(p) is str else p(env) for p in parts])  # type: ignore
+
+    return join
+
+
+# Compiled programs, attached to the (shared, see `grammar_parser.parse()`) parse
+# trees they were compiled from.
+_programs: MutableMapping[ParserRuleContext, Program] = weakref.WeakKeyDictionary()
+_programs_lock = threading.Lock()
+
+
+def compile_parse_tree(parse_tree: ParserRuleContext) -> Program:
+    """
+    Return the program compiled from `parse_tree`.
+
+    Programs are cached for as long as their parse tree is alive.
+    """
+    program = _programs.get(parse_tree)
+    if program is None:
+        program = GrammarCompiler().compile(parse_tree)
+        with _programs_lock:
+            _programs[parse_tree] = program
+    return program
+
+
+# Building blocks of the lexer rules (see `OmegaConfGrammarLexer.g4`) needed to
+# decode the arguments of simple resolver interpolations.
+_digits = "[0-9](_?[0-9])*"
+_int_unsigned = "(0|[1-9](_?[0-9])*)"
+_point_float = f"({_int_unsigned}\\.|{_int_unsigned}?\\.{_digits})"
+_exponent_float = f"(({_int_unsigned}|{_point_float})[eE][+-]?{_digits})"
+_ARG_TOKENS: Tuple[Tuple["re.Pattern[str]", Callable[[str], Any]], ...] = (
+    # Rules are listed in the same order as in the lexer, since the first one wins
+    # when several rules match the whole argument.
+    (
+        re.compile(
+            f"[+-]?({_point_float}|{_exponent_float}|[Ii][Nn][Ff]|[Nn][Aa][Nn])",
+            flags=re.ASCII,
+        ),
+        float,
+    ),
+    (re.compile(f"[+-]?{_int_unsigned}", flags=re.ASCII), int),
+    (
+        re.compile("[Tt][Rr][Uu][Ee]|[Ff][Aa][Ll][Ss][Ee]", flags=re.ASCII),
+        lambda text: text.lower() == "true",
+    ),
+    (re.compile("[Nn][Uu][Ll][Ll]", flags=re.ASCII), lambda text: None),
+)
+
+# A single simple interpolation (see `SIMPLE_INTERPOLATION_PATTERN`). Contrary to
+# `SIMPLE_INTERPOLATION_PATTERN`, only whitespaces recognized by the lexer (spaces
+# and tabs) are accepted.
+_key = r"[$\w]+"
+_key_maybe_brackets = f"{_key}|\\[{_key}\\]"
+_id = "[a-zA-Z_][\\w\\-]*"
+_arg = r"[a-zA-Z_0-9/\-\+.$%*@?|]+"
+_SIMPLE_INTERPOLATION = re.compile(
+    "\\${[ \t]*(?:"
+    f"(?P<key>\\.*({_key_maybe_brackets})(\\.{_key_maybe_brackets})*)"
+    "|"
+    f"(?P<name>{_id}(\\.{_id})*)[ \t]*:[ \t]*(?P<args>{_arg}([ \t]*,[ \t]*{_arg})*)?"
+    ")[ \t]*}",
+    flags=re.ASCII,
+)
+_ARGS_SEPARATOR = re.compile("[ \t]*,[ \t]*")
+
+
+def _decode_simple_arg(text: str) -> Any:
+    """Decode a resolver argument matched by `_SIMPLE_INTERPOLATION`"""
+    for regex, decode in _ARG_TOKENS:
+        if regex.fullmatch(text):
+            return decode(text)
+    # Either a single ID / UNQUOTED_CHAR token, or the concatenation of multiple
+    # tokens: in both cases the value is the original text.
+    return text
+
+
+def _compile_simple(value: str) -> Optional[Program]:
+    """
+    Compile `value` without going through ANTLR.
+
+    Return None if `value` is not a simple interpolation string that this fast path
+    handles (in which case the full parser must be used).
+    """
+    if "\\" in value or SIMPLE_INTERPOLATION_PATTERN.match(value) is None:
+        # Backslashes may escape interpolations, leave it to the parser.
+        return None
+
+    chunks: List[_Code] = []
+    node_keys: List[str] = []
+    pos = 0
+    for match in _SIMPLE_INTERPOLATION.finditer(value):
+        if match.start() > pos:
+            chunks.append(_Const(value[pos : match.start()]))
+        pos = match.end()
+
+        key = match.group("key")
+        if key is not None:
+            node_keys.append(key)
+            chunks.append(_node_interpolation(key))
+        else:
+            args_text = match.group("args")
+            args_str = (
+                () if args_text is None else tuple(_ARGS_SEPARATOR.split(args_text))
+            )
+            args = tuple(_decode_simple_arg(arg) for arg in args_str)
+            chunks.append(_resolver_interpolation(match.group("name"), args, args_str))
+    if pos < len(value):
+        chunks.append(_Const(value[pos:]))
+
+    if any(isinstance(chunk, _Const) and "${" in chunk.value for chunk in chunks):
+        # Some interpolation was not recognized (e.g., due to a newline).
+        return None
+    if len(chunks) == 1 and not isinstance(chunks[0], _Const):
+        # Single interpolation: its resolved value is returned "as is".
+        return Program(chunks[0], tuple(node_keys))
+    return Program(
+        _compile_join(
+            [
+                chunk if isinstance(chunk, _Const) else _compile_str(chunk)
+                for chunk in chunks
+            ]
+        ),
+        tuple(node_keys),
+    )
+
+
+# Compiled programs of interpolation strings found in config values.
+_program_cache = LRUCache(DEFAULT_PARSE_CACHE_SIZE)
+
+
+def program_cache_info() -> CacheInfo:
+    """Return hit / miss / eviction statistics of the cache of compiled programs."""
+    return _program_cache.info()
+
+
+def set_program_cache_size(maxsize: int) -> None:
+    _program_cache.resize(maxsize)
+
+
+def clear_program_cache() -> None:
+    _program_cache.clear()
+
+
+def compile_interpolation(value: str) -> Program:
+    """
+    Return the program evaluating the interpolation string `value`.
+
+    Simple interpolations are compiled directly, others are parsed first.
+    """
+    program = _program_cache.get(value)
+    if program is None:
+        program = _compile_simple(value)
+        if program is None:
+            program = compile_parse_tree(parse(value))
+        _program_cache.put(value, program)
+    return program
@@ -1,6 +1,7 @@
 import re
 import threading
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional, Tuple
 
 from antlr4 import CommonTokenStream, InputStream, ParserRuleContext
 from antlr4.error.ErrorListener import ErrorListener
@@ -18,6 +19,9 @@ from .grammar_visitor import (  # type: ignore
 # We use a per-thread cache to make it thread-safe.
 _grammar_cache = threading.local()
 
+# Default number of parse trees kept in the process-wide parse cache.
+DEFAULT_PARSE_CACHE_SIZE = 4096
+
 # Build regex pattern to efficiently identify typical interpolations.
 # See test `test_match_simple_interpolation_pattern` for examples.
 _config_key = r"[$\w]+"  # foo, $0, $bar, $foo_$bar123$
@@ -93,12 +97,117 @@ class OmegaConfErrorListener(ErrorListener):  # type: ignore
         raise GrammarParseError("ANTLR error: ContextSensitivity")  # pragma: no cover
 
 
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """
+    A bounded, thread-safe least-recently-used cache.
+
+    Setting `maxsize` to 0 disables the cache (lookups always miss and nothing
+    is stored).
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._maxsize = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.resize(maxsize)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for `key`, or None if it is not cached."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            if self._maxsize == 0:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int) -> None:
+        if not isinstance(maxsize, int) or maxsize < 0:
+            raise ValueError(f"Invalid cache size: {maxsize!r}")
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop all cached values and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._data),
+            )
+
+    def _evict(self) -> None:
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+
+# Process-wide cache of parse trees, keyed on `(value, parser_rule, lexer_mode)`.
+# Parse trees are never modified once built, so they can be shared across threads.
+_parse_cache = LRUCache(DEFAULT_PARSE_CACHE_SIZE)
+
+
+def parse_cache_info() -> CacheInfo:
+    """Return hit / miss / eviction statistics of the parse cache."""
+    return _parse_cache.info()
+
+
+def set_parse_cache_size(maxsize: int) -> None:
+    """Set the maximum number of cached parse trees (0 disables the cache)."""
+    _parse_cache.resize(maxsize)
+
+
+def clear_parse_cache() -> None:
+    _parse_cache.clear()
+
+
 def parse(
     value: str, parser_rule: str = "configValue", lexer_mode: str = "DEFAULT_MODE"
 ) -> ParserRuleContext:
     """
     Parse interpolated string `value` (and return the parse tree).
+
+    Parse trees are cached: parsing the same string again (with the same rule and
+    lexer mode) returns the same, shared, parse tree.
     """
+    key: Tuple[str, str, str] = (value, parser_rule, lexer_mode)
+    tree = _parse_cache.get(key)
+    if tree is None:
+        tree = _parse(value, parser_rule, lexer_mode)
+        _parse_cache.put(key, tree)
+    return tree
+
+
+def _parse(value: str, parser_rule: str, lexer_mode: str) -> ParserRuleContext:
     l_mode = getattr(OmegaConfGrammarLexer, lexer_mode)
     istream = InputStream(value)
 
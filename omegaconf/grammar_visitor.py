@@ -9,7 +9,6 @@ from typing import (
     Generator,
     List,
     Optional,
-    Set,
     Tuple,
     Union,
 )
@@ -40,11 +39,11 @@ class GrammarVisitor(OmegaConfGrammarParserVisitor):
     def __init__(
         self,
         node_interpolation_callback: Callable[
-            [str, Optional[Set[int]]],
+            [str, Optional[Dict[int, "Node"]]],
             Optional["Node"],
         ],
         resolver_interpolation_callback: Callable[..., Any],
-        memo: Optional[Set[int]],
+        memo: Optional[Dict[int, "Node"]],
         **kw: Dict[Any, Any],
     ):
         """
@@ -1,5 +1,7 @@
 import copy
 import itertools
+import math
+from array import array
 from typing import (
     Any,
     Callable,
@@ -9,6 +11,7 @@ from typing import (
     List,
     MutableSequence,
     Optional,
+    Sequence,
     Tuple,
     Type,
     Union,
@@ -26,7 +29,15 @@ from ._utils import (
     is_structured_config,
     type_str,
 )
-from .base import Box, ContainerMetadata, Node
+from .base import (
+    Box,
+    Container,
+    ContainerMetadata,
+    Node,
+    _copies_lazily,
+    _invalidation_needed,
+    _LazyContent,
+)
 from .basecontainer import BaseContainer
 from .errors import (
     ConfigAttributeError,
@@ -38,6 +49,41 @@ from .errors import (
     ValidationError,
 )
 
+# Lists of ints or floats with fewer items keep them in nodes (see `_NumericContent`).
+_MIN_NUMERIC_ARRAY_SIZE = 64
+
+
+class _NumericContent(_LazyContent):
+    """
+    `__dict__` of a large `List[int]` or `List[float]` ListConfig whose items are held
+    in a typed array rather than in nodes. The nodes are only created when the content
+    is first accessed: reading, iterating, slicing or converting the list, and
+    assigning valid items, use the array instead.
+    """
+
+    __slots__ = ("numbers",)
+
+    numbers: Optional["array[Any]"]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "_content":
+            # The items are held in the content from now on.
+            self.numbers = None
+        super().__setitem__(key, value)
+
+    def _create_content(self, owner: Container) -> None:
+        from .nodes import FloatNode, IntegerNode
+
+        values = self.numbers
+        assert values is not None
+        is_optional, _ = _resolve_optional(owner._metadata.element_type)
+        node_type: Union[Type[IntegerNode], Type[FloatNode]]
+        node_type = IntegerNode if values.typecode == "q" else FloatNode
+        self["_content"] = [
+            node_type(value=value, key=key, parent=owner, is_optional=is_optional)
+            for key, value in enumerate(values)
+        ]
+
 
 class ListConfig(BaseContainer, MutableSequence[Any]):
 
@@ -123,32 +169,48 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
                 raise ValidationError(msg)
 
     def __deepcopy__(self, memo: Dict[int, Any]) -> "ListConfig":
+        lazy = _copies_lazily(memo)
         res = ListConfig(None)
         res.__dict__["_metadata"] = copy.deepcopy(self.__dict__["_metadata"], memo=memo)
         res.__dict__["_flags_cache"] = copy.deepcopy(
             self.__dict__["_flags_cache"], memo=memo
         )
+        res.__dict__["_parent"] = self.__dict__["_parent"]
+        values = self._numeric_values()
+        if values is not None:
+            res._set_numeric_values(array(values.typecode, values))
+        elif lazy:
+            res._copy_content_lazily(self, memo)
+        else:
+            res._copy_content(self, memo)
+
+        return res
 
-        src_content = self.__dict__["_content"]
+    def _copy_content(
+        self, src: Container, memo: Optional[Dict[int, Any]] = None
+    ) -> None:
+        src_content = src.__dict__["_content"]
         if isinstance(src_content, list):
             content_copy: List[Optional[Node]] = []
             for v in src_content:
-                old_parent = v.__dict__["_parent"]
+                old_parent = v._parent
                 try:
-                    v.__dict__["_parent"] = None
-                    vc = copy.deepcopy(v, memo=memo)
-                    vc.__dict__["_parent"] = res
+                    object.__setattr__(v, "_parent", None)
+                    vc = copy.deepcopy(v, memo)
+                    object.__setattr__(vc, "_parent", self)
+                    # the flags of this container may have changed since it was copied
+                    vc._invalidate_flags_cache()
                     content_copy.append(vc)
                 finally:
-                    v.__dict__["_parent"] = old_parent
+                    object.__setattr__(v, "_parent", old_parent)
         else:
             # None and strings can be assigned as is
             content_copy = src_content
 
-        res.__dict__["_content"] = content_copy
-        res.__dict__["_parent"] = self.__dict__["_parent"]
-
-        return res
+        self.__dict__["_content"] = content_copy
+        keys_moved_from = src.__dict__.get("_keys_moved_from")
+        if keys_moved_from is not None:
+            self.__dict__["_keys_moved_from"] = keys_moved_from
 
     def copy(self) -> "ListConfig":
         return copy.copy(self)
@@ -196,13 +258,17 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
                     "ListConfig object representing None is not subscriptable"
                 )
 
-            assert isinstance(self.__dict__["_content"], list)
+            values = self._numeric_values()
             if isinstance(index, slice):
                 result = []
                 start, stop, step = self._correct_index_params(index)
                 for slice_idx in itertools.islice(
                     range(0, len(self)), start, stop, step
                 ):
+                    if values is not None:
+                        result.append(values[slice_idx])
+                        continue
+                    assert isinstance(self.__dict__["_content"], list)
                     val = self._resolve_with_default(
                         key=slice_idx, value=self.__dict__["_content"][slice_idx]
                     )
@@ -210,7 +276,10 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
                 if index.step and index.step < 0:
                     result.reverse()
                 return result
+            elif values is not None:
+                return values[index]
             else:
+                assert isinstance(self.__dict__["_content"], list)
                 return self._resolve_with_default(
                     key=index, value=self.__dict__["_content"][index]
                 )
@@ -243,10 +312,15 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
         return start, stop, step
 
     def _set_at_index(self, index: Union[int, slice], value: Any) -> None:
+        if isinstance(index, int) and -len(self) <= index < 0:
+            # The key of the new node is its position.
+            index += len(self)
         self._set_item_impl(index, value)
 
     def __setitem__(self, index: Union[int, slice], value: Any) -> None:
         try:
+            if self._set_numeric_item(index, value):
+                return
             if isinstance(index, slice):
                 _ = iter(value)  # check iterable
                 self_indices = index.indices(len(self))
@@ -290,7 +364,39 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
         except Exception as e:
             self._format_and_raise(key=index, value=value, cause=e)
 
+    def _set_numeric_item(self, index: Union[int, slice], value: Any) -> bool:
+        """
+        Assign `value` at `index` in the typed array holding the items of this list
+        (see `_NumericContent`), if they are valid items. Return False if this cannot be
+        done without creating the nodes.
+        """
+        values = self._numeric_values()
+        if values is None or self._get_flag("readonly"):
+            return False
+        if isinstance(index, slice):
+            if not isinstance(value, (list, tuple)):
+                return False
+            new_values = self._to_numeric_array(value)
+            if new_values is None:
+                return False
+            if index.step not in (None, 1):
+                if len(range(*index.indices(len(values)))) != len(new_values):
+                    return False
+            self._detach_lazy_copies()
+            values[index] = new_values
+        else:
+            if not isinstance(index, int) or not -len(values) <= index < len(values):
+                return False
+            new_values = self._to_numeric_array([value])
+            if new_values is None:
+                return False
+            self._detach_lazy_copies()
+            values[index] = new_values[0]
+        self._invalidate_interpolations()
+        return True
+
     def append(self, item: Any) -> None:
+        self._detach_lazy_copies()
         content = self.__dict__["_content"]
         index = len(content)
         content.append(None)
@@ -301,12 +407,38 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
             self._format_and_raise(key=index, value=item, cause=e)
             assert False
 
+    def _invalidate_items(self, items: List[Optional[Node]]) -> None:
+        for node in items:
+            if node is not None:
+                node._invalidate_interpolations()
+
+    def _move_keys(self, index: int) -> None:
+        """
+        Record that the items from `index` on were moved by inserting or deleting the
+        item at `index`: they keep their previous keys, which are at least `index`,
+        until one of them is read (see `Node._key()`). This way, the cost of inserting
+        or deleting an item does not depend on the number of items after it.
+        """
+        if index >= len(self.__dict__["_content"]):
+            return
+        keys_moved_from = self.__dict__.get("_keys_moved_from")
+        if keys_moved_from is None or index < keys_moved_from:
+            self.__dict__["_keys_moved_from"] = index
+
     def _update_keys(self) -> None:
-        for i in range(len(self)):
-            node = self._get_node(i)
+        """Update the keys of the items moved since the last update"""
+        if "_keys_moved_from" not in self.__dict__:
+            return
+        # Lazy copies of this list copy the keys to update along with its items.
+        self._detach_lazy_copies()
+        start = self.__dict__.pop("_keys_moved_from")
+        content = self.__dict__["_content"]
+        if not isinstance(content, list):
+            return
+        for i in range(start, len(content)):
+            node = content[i]
             if node is not None:
-                assert isinstance(node, Node)
-                node._metadata.key = i
+                node._set_key(i)
 
     def insert(self, index: int, item: Any) -> None:
         from omegaconf.omegaconf import _maybe_wrap
@@ -321,10 +453,16 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
             if self._is_missing():
                 raise MissingMandatoryValue("Cannot insert into missing ListConfig")
 
+            self._detach_lazy_copies()
+            content = self.__dict__["_content"]
+            assert isinstance(content, list)
+            # Use the position of the new item, as `list.insert()` does.
+            index = min(
+                max(index + len(content), 0) if index < 0 else index, len(content)
+            )
             try:
-                assert isinstance(self.__dict__["_content"], list)
                 # insert place holder
-                self.__dict__["_content"].insert(index, None)
+                content.insert(index, None)
                 is_optional, ref_type = _resolve_optional(self._metadata.element_type)
                 node = _maybe_wrap(
                     ref_type=ref_type,
@@ -335,10 +473,12 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
                 )
                 self._validate_set(key=index, value=node)
                 self._set_at_index(index, node)
-                self._update_keys()
+                self._move_keys(index)
+                if _invalidation_needed():
+                    # Items after the new one have moved.
+                    self._invalidate_items(content[index + 1 :])
             except Exception:
-                del self.__dict__["_content"][index]
-                self._update_keys()
+                del content[index]
                 raise
         except Exception as e:
             self._format_and_raise(key=index, value=item, cause=e)
@@ -361,8 +501,17 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
                     "Cannot delete item from read-only ListConfig"
                 ),
             )
-        del self.__dict__["_content"][key]
-        self._update_keys()
+        self._detach_lazy_copies()
+        content = self.__dict__["_content"]
+        if isinstance(key, slice):
+            removed = range(*key.indices(len(content)))
+            start = min(removed[0], removed[-1]) if removed else len(content)
+        else:
+            start = key + len(content) if key < 0 else key
+        moved = content[start:] if _invalidation_needed() else []
+        del content[key]
+        self._move_keys(start)
+        self._invalidate_items(moved)
 
     def clear(self) -> None:
         del self[:]
@@ -393,6 +542,9 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
             assert False
 
     def count(self, x: Any) -> int:
+        values = self._numeric_values()
+        if values is not None:
+            return values.count(x)
         c = 0
         for item in self:
             if item == x:
@@ -446,6 +598,9 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
             if self._is_missing():
                 raise MissingMandatoryValue("Cannot get from a missing ListConfig")
             self._validate_get(index, None)
+            values = self._numeric_values()
+            if values is not None:
+                return values[index]
             assert isinstance(self.__dict__["_content"], list)
             return self._resolve_with_default(
                 key=index,
@@ -469,8 +624,12 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
             node = self._get_child(index)
             assert isinstance(node, Node)
             ret = self._resolve_with_default(key=index, value=node, default_value=None)
-            del self.__dict__["_content"][index]
-            self._update_keys()
+            self._detach_lazy_copies()
+            content = self.__dict__["_content"]
+            moved = content[index:] if _invalidation_needed() else []
+            del content[index]
+            self._move_keys(index + len(content) + 1 if index < 0 else index)
+            self._invalidate_items(moved)
             return ret
         except KeyValidationError as e:
             self._format_and_raise(
@@ -503,7 +662,9 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
                     return key(x._value())  # type: ignore
 
             assert isinstance(self.__dict__["_content"], list)
+            self._detach_lazy_copies()
             self.__dict__["_content"].sort(key=key1, reverse=reverse)
+            self._invalidate_items(self.__dict__["_content"])
 
         except Exception as e:
             self._format_and_raise(key=None, value=None, cause=e)
@@ -567,6 +728,9 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
             if self._is_missing():
                 raise MissingMandatoryValue("Cannot iterate a missing ListConfig")
 
+            values = self._numeric_values()
+            if values is not None:
+                return iter(values)
             return ListConfig.ListIterator(self, resolve)
         except (TypeError, MissingMandatoryValue) as e:
             self._format_and_raise(key=None, value=None, cause=e)
@@ -600,6 +764,13 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
                 "Cannot check if an item is in missing ListConfig"
             )
 
+        values = self._numeric_values()
+        if values is not None:
+            if isinstance(item, float) and math.isnan(item):
+                # nan items are equal, as with `FloatNode`
+                return any(math.isnan(value) for value in values)
+            return item in values
+
         lst = self.__dict__["_content"]
         for x in lst:
             x = x._dereference_node()
@@ -608,14 +779,21 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
         return False
 
     def _set_value(self, value: Any, flags: Optional[Dict[str, bool]] = None) -> None:
+        self._detach_lazy_copies()
+        previous_values = self._numeric_values()
         try:
-            previous_content = self.__dict__["_content"]
+            if previous_values is None:
+                previous_content = self.__dict__["_content"]
             previous_metadata = self.__dict__["_metadata"]
             self._set_value_impl(value, flags)
         except Exception as e:
-            self.__dict__["_content"] = previous_content
+            if previous_values is not None:
+                self._set_numeric_values(previous_values)
+            else:
+                self.__dict__["_content"] = previous_content
             self.__dict__["_metadata"] = previous_metadata
             raise e
+        self._invalidate_interpolations()
 
     def _set_value_impl(
         self, value: Any, flags: Optional[Dict[str, bool]] = None
@@ -648,17 +826,88 @@ class ListConfig(BaseContainer, MutableSequence[Any]):
             self.__dict__["_content"] = []
             if isinstance(value, ListConfig):
                 self._metadata.flags = copy.deepcopy(flags)
-                # disable struct and readonly for the construction phase
-                # retaining other flags like allow_objects. The real flags are restored at the end of this function
-                with flag_override(self, ["struct", "readonly"], False):
-                    for item in value._iter_ex(resolve=False):
-                        self.append(item)
+                items = list(value._iter_ex(resolve=False))
+                if not self._set_numeric_items(items):
+                    # disable struct and readonly for the construction phase
+                    # retaining other flags like allow_objects. The real flags are restored at the end of this function
+                    with flag_override(self, ["struct", "readonly"], False):
+                        for item in items:
+                            self.append(item)
             elif is_primitive_list(value):
-                with flag_override(self, ["struct", "readonly"], False):
-                    for item in value:
-                        self.append(item)
+                if self._are_plain_items(enumerate(value)):
+                    self.__dict__["_content"] = [
+                        node for _, node in self._wrap_plain_items(enumerate(value))
+                    ]
+                elif not self._set_numeric_items(value):
+                    with flag_override(self, ["struct", "readonly"], False):
+                        for item in value:
+                            self.append(item)
             self._metadata.object_type = list
 
+    def _numeric_values(self) -> Optional["array[Any]"]:
+        """
+        The typed array holding the items of this list while their nodes are not
+        created (see `_NumericContent`), None otherwise.
+        """
+        state = self.__dict__
+        if type(state) is _NumericContent and "_content" not in state:
+            return state.numbers
+        return None
+
+    def _to_numeric_array(self, items: Sequence[Any]) -> Optional["array[Any]"]:
+        """
+        `items` in a typed array, if this is a list of ints or floats and `items` are
+        valid items, that its nodes would hold as is. None otherwise.
+        """
+        _, element_type = _resolve_optional(self._metadata.element_type)
+        types: Tuple[type, ...]
+        if element_type is int:
+            typecode, types = "q", (int,)
+        elif element_type is float:
+            # As with `FloatNode`, ints are converted unless conversion is disabled.
+            typecode = "d"
+            types = (float,) if self._get_flag("convert") is False else (float, int)
+        else:
+            return None
+        if not all(type(item) in types for item in items):
+            return None
+        try:
+            return array(typecode, items)
+        except OverflowError:
+            return None
+
+    def _set_numeric_items(self, items: Sequence[Any]) -> bool:
+        """
+        Hold `items`, the new content of this list, in a typed array rather than in
+        nodes if there are enough of them (see `_NumericContent`). Return False if they
+        cannot be, without changing this list.
+        """
+        if len(items) < _MIN_NUMERIC_ARRAY_SIZE:
+            return False
+        values = self._to_numeric_array(items)
+        if values is None:
+            return False
+        self._set_numeric_values(values)
+        return True
+
+    def _set_numeric_values(self, values: "array[Any]") -> None:
+        state = _NumericContent(self.__dict__)
+        state.pop("_content", None)
+        state.owner, state.source, state.numbers = self, None, values
+        object.__setattr__(self, "__dict__", state)
+
+    def __len__(self) -> int:
+        values = self._numeric_values()
+        if values is not None:
+            return len(values)
+        return super().__len__()
+
+    def __repr__(self) -> str:
+        values = self._numeric_values()
+        if values is not None:
+            return repr(values.tolist())
+        return super().__repr__()
+
     @staticmethod
     def _list_eq(l1: Optional["ListConfig"], l2: Optional["ListConfig"]) -> bool:
         l1_none = l1.__dict__["_content"] is None
@@ -8,42 +8,85 @@ from typing import Any, Dict, Optional, Type, Union
 
 from omegaconf._utils import (
     ValueKind,
-    _is_interpolation,
     get_type_of,
     get_value_kind,
     is_primitive_container,
     type_str,
 )
-from omegaconf.base import Box, DictKeyType, Metadata, Node
+from omegaconf.base import Box, DictKeyType, Metadata, Node, _shared_metadata
 from omegaconf.errors import ReadonlyConfigError, UnsupportedValueType, ValidationError
+from omegaconf.grammar_compiler import Program, compile_interpolation
 
 
 class ValueNode(Node):
-    _val: Any
+    __slots__ = ("_metadata", "_parent", "_flags_cache", "_val", "_kind", "_node_key")
 
-    def __init__(self, parent: Optional[Box], value: Any, metadata: Metadata):
-        from omegaconf import read_write
+    _val: Any
+    # The key of a value node is not stored in its metadata, which is shared with the
+    # other value nodes of the same type (see `_shared_metadata()`).
+    _node_key: Any
+    # The kind of `_val`, or its compiled program once an interpolation has been
+    # resolved. `None` (or unset, for nodes created without `__init__()`) until it
+    # is first needed.
+    _kind: Union[ValueKind, Program, None]
 
+    def __init__(
+        self, parent: Optional[Box], value: Any, metadata: Metadata, key: Any = None
+    ):
         super().__init__(parent=parent, metadata=metadata)
-        with read_write(self):
-            self._set_value(value)  # lgtm [py/init-calls-subclass]
+        self._node_key = key
+        # Unlike `_set_value()`, this ignores the readonly flag of the parents.
+        self._set_value_impl(value)  # lgtm [py/init-calls-subclass]
+        # Flags looked up during validation are not worth keeping on every leaf.
+        self._flags_cache = None
 
     def _value(self) -> Any:
         return self._val
 
+    def _key(self) -> Any:
+        key = self._node_key
+        if type(key) is int and self._parent is not None and self._key_moved(key):
+            key = self._node_key
+        return key
+
+    def _set_key(self, key: Any) -> None:
+        self._detach_lazy_copies()
+        self._node_key = key
+
     def _set_value(self, value: Any, flags: Optional[Dict[str, bool]] = None) -> None:
         if self._get_flag("readonly"):
             raise ReadonlyConfigError("Cannot set value of read-only config node")
-
-        if isinstance(value, str) and get_value_kind(
-            value, strict_interpolation_validation=True
-        ) in (
-            ValueKind.INTERPOLATION,
-            ValueKind.MANDATORY_MISSING,
-        ):
-            self._val = value
-        else:
-            self._val = self.validate_and_convert(value)
+        self._detach_lazy_copies()
+        self._set_value_impl(value, flags)
+        self._invalidate_interpolations()
+
+    def _set_value_impl(
+        self, value: Any, flags: Optional[Dict[str, bool]] = None
+    ) -> None:
+        if isinstance(value, str):
+            kind = get_value_kind(value, strict_interpolation_validation=True)
+            if kind is not ValueKind.VALUE:
+                self._val = value
+                self._kind = kind
+                return
+        self._val = self.validate_and_convert(value)
+        # The converted value is classified on demand (see `_value_kind()`).
+        self._kind = None
+
+    def _value_kind(self) -> ValueKind:
+        kind = getattr(self, "_kind", None)
+        if kind is None:
+            kind = self._kind = get_value_kind(self._val)
+        elif isinstance(kind, Program):
+            return ValueKind.INTERPOLATION
+        return kind
+
+    def _get_program(self) -> Program:
+        kind = getattr(self, "_kind", None)
+        if isinstance(kind, Program):
+            return kind
+        program = self._kind = compile_interpolation(self._val)
+        return program
 
     def _strict_validate_type(self, value: Any) -> None:
         ref_type = self._metadata.ref_type
@@ -99,32 +142,66 @@ class ValueNode(Node):
     def __hash__(self) -> int:
         return hash(self._val)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Same state as when value nodes were stored in `__dict__` with their key in
+        # their metadata, so that pickles remain compatible with older versions.
+        state_dict = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name not in ("_flags_cache", "_kind") and hasattr(self, name):
+                    state_dict[name] = getattr(self, name)
+        metadata = state_dict["_metadata"] = copy.copy(self._metadata)
+        metadata.key = state_dict.pop("_node_key", None)
+        return state_dict
+
+    def __setstate__(self, state_dict: Dict[str, Any]) -> None:
+        for name, value in state_dict.items():
+            object.__setattr__(self, name, value)
+        self._flags_cache = None
+        metadata = self._metadata
+        self._node_key = metadata.key
+        # Share the metadata again (see `_shared_metadata()`).
+        if (
+            type(metadata) is Metadata
+            and not metadata.flags
+            and not metadata.flags_root
+        ):
+            self._metadata = _shared_metadata(
+                metadata.ref_type, metadata.object_type, metadata.optional
+            )
+        else:
+            metadata.key = None
+
     def _deepcopy_impl(self, res: Any, memo: Dict[int, Any]) -> None:
-        res.__dict__["_metadata"] = copy.deepcopy(self._metadata, memo=memo)
+        res._metadata = copy.deepcopy(self._metadata, memo=memo)
+        res._node_key = self._node_key
         # shallow copy for value to support non-copyable value
-        res.__dict__["_val"] = self._val
+        res._val = self._val
+        res._kind = getattr(self, "_kind", None)
 
         # parent is retained, but not copied
-        res.__dict__["_parent"] = self._parent
+        res._parent = self._parent
 
     def _is_optional(self) -> bool:
         return self._metadata.optional
 
     def _is_interpolation(self) -> bool:
-        return _is_interpolation(self._value())
+        return self._value_kind() is ValueKind.INTERPOLATION
 
     def _get_full_key(self, key: Optional[Union[DictKeyType, int]]) -> str:
         parent = self._get_parent()
         if parent is None:
-            if self._metadata.key is None:
+            if self._node_key is None:
                 return ""
             else:
-                return str(self._metadata.key)
+                return str(self._node_key)
         else:
-            return parent._get_full_key(self._metadata.key)
+            return parent._get_full_key(self._key())
 
 
 class AnyNode(ValueNode):
+    __slots__ = ()
+
     def __init__(
         self,
         value: Any = None,
@@ -135,8 +212,9 @@ class AnyNode(ValueNode):
         super().__init__(
             parent=parent,
             value=value,
-            metadata=Metadata(
-                ref_type=Any, object_type=None, key=key, optional=True, flags=flags
+            key=key,
+            metadata=_shared_metadata(
+                ref_type=Any, object_type=None, optional=True, flags=flags
             ),
         )
 
@@ -156,6 +234,22 @@ class AnyNode(ValueNode):
             )
         return value
 
+    @classmethod
+    def _create_valid(cls, value: Any, key: Any, parent: Optional[Box]) -> "AnyNode":
+        """
+        Same as `AnyNode(value, key, parent)`, for a `value` known to be valid
+        (a primitive, or a string with valid interpolations): it is not validated again.
+        """
+        node = cls.__new__(cls)
+        Node.__init__(
+            node,
+            parent=parent,
+            metadata=_shared_metadata(ref_type=Any, object_type=None, optional=True),
+        )
+        node._val = value
+        node._node_key = key
+        return node
+
     def __deepcopy__(self, memo: Dict[int, Any]) -> "AnyNode":
         res = AnyNode()
         self._deepcopy_impl(res, memo)
@@ -163,6 +257,8 @@ class AnyNode(ValueNode):
 
 
 class StringNode(ValueNode):
+    __slots__ = ()
+
     def __init__(
         self,
         value: Any = None,
@@ -174,8 +270,8 @@ class StringNode(ValueNode):
         super().__init__(
             parent=parent,
             value=value,
-            metadata=Metadata(
-                key=key,
+            key=key,
+            metadata=_shared_metadata(
                 optional=is_optional,
                 ref_type=str,
                 object_type=str,
@@ -201,6 +297,8 @@ class StringNode(ValueNode):
 
 
 class PathNode(ValueNode):
+    __slots__ = ()
+
     def __init__(
         self,
         value: Any = None,
@@ -212,8 +310,8 @@ class PathNode(ValueNode):
         super().__init__(
             parent=parent,
             value=value,
-            metadata=Metadata(
-                key=key,
+            key=key,
+            metadata=_shared_metadata(
                 optional=is_optional,
                 ref_type=Path,
                 object_type=Path,
@@ -242,6 +340,8 @@ class PathNode(ValueNode):
 
 
 class IntegerNode(ValueNode):
+    __slots__ = ()
+
     def __init__(
         self,
         value: Any = None,
@@ -253,8 +353,8 @@ class IntegerNode(ValueNode):
         super().__init__(
             parent=parent,
             value=value,
-            metadata=Metadata(
-                key=key,
+            key=key,
+            metadata=_shared_metadata(
                 optional=is_optional,
                 ref_type=int,
                 object_type=int,
@@ -281,6 +381,8 @@ class IntegerNode(ValueNode):
 
 
 class BytesNode(ValueNode):
+    __slots__ = ()
+
     def __init__(
         self,
         value: Any = None,
@@ -292,8 +394,8 @@ class BytesNode(ValueNode):
         super().__init__(
             parent=parent,
             value=value,
-            metadata=Metadata(
-                key=key,
+            key=key,
+            metadata=_shared_metadata(
                 optional=is_optional,
                 ref_type=bytes,
                 object_type=bytes,
@@ -315,6 +417,8 @@ class BytesNode(ValueNode):
 
 
 class FloatNode(ValueNode):
+    __slots__ = ()
+
     def __init__(
         self,
         value: Any = None,
@@ -326,8 +430,8 @@ class FloatNode(ValueNode):
         super().__init__(
             parent=parent,
             value=value,
-            metadata=Metadata(
-                key=key,
+            key=key,
+            metadata=_shared_metadata(
                 optional=is_optional,
                 ref_type=float,
                 object_type=float,
@@ -371,6 +475,8 @@ class FloatNode(ValueNode):
 
 
 class BooleanNode(ValueNode):
+    __slots__ = ()
+
     def __init__(
         self,
         value: Any = None,
@@ -382,8 +488,8 @@ class BooleanNode(ValueNode):
         super().__init__(
             parent=parent,
             value=value,
-            metadata=Metadata(
-                key=key,
+            key=key,
+            metadata=_shared_metadata(
                 optional=is_optional,
                 ref_type=bool,
                 object_type=bool,
@@ -427,6 +533,8 @@ class EnumNode(ValueNode):  # lgtm [py/missing-equals] : Intentional.
     This is intentional, Please open an issue against OmegaConf if you wish to discuss this decision.
     """
 
+    __slots__ = ("enum_type",)
+
     def __init__(
         self,
         enum_type: Type[Enum],
@@ -440,15 +548,12 @@ class EnumNode(ValueNode):  # lgtm [py/missing-equals] : Intentional.
             raise ValidationError(
                 f"EnumNode can only operate on Enum subclasses ({enum_type})"
             )
-        self.fields: Dict[str, str] = {}
         self.enum_type: Type[Enum] = enum_type
-        for name, constant in enum_type.__members__.items():
-            self.fields[name] = constant.value
         super().__init__(
             parent=parent,
             value=value,
-            metadata=Metadata(
-                key=key,
+            key=key,
+            metadata=_shared_metadata(
                 optional=is_optional,
                 ref_type=enum_type,
                 object_type=enum_type,
@@ -456,6 +561,15 @@ class EnumNode(ValueNode):  # lgtm [py/missing-equals] : Intentional.
             ),
         )
 
+    @property
+    def fields(self) -> Dict[str, Any]:
+        return {name: c.value for name, c in self.enum_type.__members__.items()}
+
+    def __setstate__(self, state_dict: Dict[str, Any]) -> None:
+        # `fields` used to be stored on each node.
+        state_dict.pop("fields", None)
+        super().__setstate__(state_dict)
+
     def _strict_validate_type(self, value: Any) -> None:
         ref_type = self._metadata.ref_type
         if not isinstance(value, ref_type):
@@ -509,6 +623,8 @@ class InterpolationResultNode(ValueNode):
     Special node type, used to wrap interpolation results.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         value: Any,
@@ -519,18 +635,20 @@ class InterpolationResultNode(ValueNode):
         super().__init__(
             parent=parent,
             value=value,
+            key=key,
             metadata=Metadata(
-                ref_type=Any, object_type=None, key=key, optional=True, flags=flags
+                ref_type=Any, object_type=None, key=None, optional=True, flags=flags
             ),
         )
         # In general we should not try to write into interpolation results.
         if flags is None or "readonly" not in flags:
             self._set_flag("readonly", True)
 
-    def _set_value(self, value: Any, flags: Optional[Dict[str, bool]] = None) -> None:
-        if self._get_flag("readonly"):
-            raise ReadonlyConfigError("Cannot set value of read-only config node")
+    def _set_value_impl(
+        self, value: Any, flags: Optional[Dict[str, bool]] = None
+    ) -> None:
         self._val = self.validate_and_convert(value)
+        self._kind = None
 
     def _validate_and_convert_impl(self, value: Any) -> Any:
         # Interpolation results may be anything.
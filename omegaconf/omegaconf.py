@@ -1,14 +1,21 @@
 """OmegaConf module"""
+import concurrent.futures
 import copy
 import inspect
 import io
+import json
+import mmap
 import os
 import pathlib
+import secrets
+import shutil
+import stat
 import sys
 import warnings
 from collections import defaultdict
 from contextlib import contextmanager
 from enum import Enum
+from functools import partial
 from textwrap import dedent
 from typing import (
     IO,
@@ -29,10 +36,14 @@ from typing import (
 import yaml
 
 from . import DictConfig, DictKeyType, ListConfig
+from ._binary import config_from_bytes, config_to_bytes
 from ._utils import (
     _DEFAULT_MARKER_,
+    _check_libyaml_events,
     _ensure_container,
+    _get_omega_conf_fast_dumper,
     _get_value,
+    _LibyamlMismatch,
     format_and_raise,
     get_dict_key_value_types,
     get_list_element_type,
@@ -42,6 +53,7 @@ from ._utils import (
     is_dataclass,
     is_dict_annotation,
     is_int,
+    is_json_path,
     is_list_annotation,
     is_primitive_container,
     is_primitive_dict,
@@ -49,11 +61,20 @@ from ._utils import (
     is_structured_config,
     is_tuple_annotation,
     is_union_annotation,
+    load_json,
     nullcontext,
     split_key,
     type_str,
 )
-from .base import Box, Container, Node, SCMode, UnionNode
+from .base import (
+    Box,
+    Container,
+    Node,
+    SCMode,
+    UnionNode,
+    _get_key_index,
+    _iter_full_keys,
+)
 from .basecontainer import BaseContainer
 from .errors import (
     MissingMandatoryValue,
@@ -61,6 +82,18 @@ from .errors import (
     UnsupportedInterpolationType,
     ValidationError,
 )
+from .frozen import freeze_content
+from .grammar_compiler import (
+    clear_program_cache,
+    program_cache_info,
+    set_program_cache_size,
+)
+from .grammar_parser import (
+    CacheInfo,
+    clear_parse_cache,
+    parse_cache_info,
+    set_parse_cache_size,
+)
 from .nodes import (
     AnyNode,
     BooleanNode,
@@ -182,14 +215,49 @@ class OmegaConf:
         )
 
     @staticmethod
-    def load(file_: Union[str, pathlib.Path, IO[Any]]) -> Union[DictConfig, ListConfig]:
+    def load(
+        file_: Union[str, pathlib.Path, IO[Any]],
+        *,
+        lazy: bool = False,
+        format: Optional[str] = None,
+    ) -> Union[DictConfig, ListConfig]:
+        """
+        Load a config from a YAML or JSON file.
+
+        :param file_: filename or file object
+        :param format: "yaml" or "json". By default, files with a ``.json`` extension
+            are parsed as JSON (with the much faster parser of the standard library),
+            and other files as YAML.
+        :param lazy: If True, ``file_`` is a file written with the bytes returned by
+            ``OmegaConf.to_bytes(cfg, indexed=True)`` (opened in binary mode if it is a
+            file object). The file is memory-mapped, and the content of each container
+            is only decoded when first accessed.
+        :return: The loaded config object.
+        """
         from ._utils import get_yaml_loader
 
+        if lazy:
+            if isinstance(file_, (str, pathlib.Path)):
+                with io.open(os.path.abspath(file_), "rb") as f:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # In-memory streams (e.g. io.BytesIO) have no file descriptor.
+                try:
+                    fileno = file_.fileno()
+                except (AttributeError, io.UnsupportedOperation, OSError):
+                    raise TypeError("Unexpected file type") from None
+                data = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+            return OmegaConf.from_bytes(data)
+
+        if _get_file_format(file_, format) == "json":
+            load: Callable[[Any], Any] = load_json
+        else:
+            load = partial(yaml.load, Loader=get_yaml_loader())
         if isinstance(file_, (str, pathlib.Path)):
             with io.open(os.path.abspath(file_), "r", encoding="utf-8") as f:
-                obj = yaml.load(f, Loader=get_yaml_loader())
+                obj = load(f)
         elif getattr(file_, "read", None):
-            obj = yaml.load(file_, Loader=get_yaml_loader())
+            obj = load(file_)
         else:
             raise TypeError("Unexpected file type")
 
@@ -205,9 +273,45 @@ class OmegaConf:
             ret = OmegaConf.create(obj)
         return ret
 
+    @staticmethod
+    def load_many(
+        paths: Iterable[Union[str, pathlib.Path]], *, workers: Optional[int] = None
+    ) -> Union[DictConfig, ListConfig]:
+        """
+        Load config files and merge them in order. The result is the same as with
+        ``OmegaConf.merge(*[OmegaConf.load(path) for path in paths])``, but the files
+        are loaded in parallel, in a pool of worker processes.
+
+        :param paths: The paths of the files to load (YAML or JSON, see ``OmegaConf.load()``)
+        :param workers: The number of worker processes, by default the number of CPUs.
+            With 1 worker (or 1 file), the files are loaded in this process.
+        :return: The merged config object.
+        """
+        paths = list(paths)
+        if not paths:
+            raise ValueError("load_many() requires at least one path")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(paths))
+        if workers <= 1:
+            configs = [OmegaConf.load(path) for path in paths]
+        else:
+            # The workers send the loaded configs back in their binary encoding, which
+            # is compact and decoded without validating the values again.
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                configs = [
+                    OmegaConf.from_bytes(data)
+                    for data in pool.map(_load_to_bytes, paths)
+                ]
+        return OmegaConf.merge(*configs)
+
     @staticmethod
     def save(
-        config: Any, f: Union[str, pathlib.Path, IO[Any]], resolve: bool = False
+        config: Any,
+        f: Union[str, pathlib.Path, IO[Any]],
+        resolve: bool = False,
+        *,
+        format: Optional[str] = None,
     ) -> None:
         """
         Save as configuration object to a file
@@ -215,19 +319,90 @@ class OmegaConf:
         :param config: omegaconf.Config object (DictConfig or ListConfig).
         :param f: filename or file object
         :param resolve: True to save a resolved config (defaults to False)
+        :param format: "yaml" or "json". By default, the config is saved as JSON in
+            files with a ``.json`` extension, and as YAML otherwise. In JSON, the keys
+            are saved as strings, and the values must be JSON serializable (which NaN
+            and infinite floats are not).
         """
         if is_dataclass(config) or is_attr_class(config):
             config = OmegaConf.create(config)
-        data = OmegaConf.to_yaml(config, resolve=resolve)
+        format = _get_file_format(f, format)
         if isinstance(f, (str, pathlib.Path)):
-            with io.open(os.path.abspath(f), "w", encoding="utf-8") as file:
-                file.write(data)
+            _save_to_path(config, f, resolve, format)
         elif hasattr(f, "write"):
-            f.write(data)
+            _dump(config, f, resolve, format)
             f.flush()
         else:
             raise TypeError("Unexpected file type")
 
+    @staticmethod
+    def dump(
+        cfg: Any, stream: IO[Any], *, resolve: bool = False, sort_keys: bool = False
+    ) -> None:
+        """
+        Write the yaml dump of a config object to a stream, node by node: unlike
+        ``stream.write(OmegaConf.to_yaml(cfg))``, neither the dump nor a primitive
+        container is built in memory first.
+
+        :param cfg: Config object, Structured Config type or instance
+        :param stream: Text stream (e.g. a file opened in text mode)
+        :param resolve: if True, interpolations are resolved in the dump, otherwise
+            they are preserved
+        :param sort_keys: If True, will print dict keys in sorted order. default False.
+        """
+        cfg = _ensure_container(cfg)
+        fast_dumper = _get_omega_conf_fast_dumper()
+        dumper = get_omega_conf_dumper()
+        # The libyaml dumper does not emit all strings like the Python one: the dump
+        # is written again with the latter if needed, which requires a seekable stream.
+        seekable = getattr(stream, "seekable", None)
+        if fast_dumper is not dumper and seekable is not None and seekable():
+            start = stream.tell()
+            try:
+                _dump_yaml_events(cfg, stream, resolve, sort_keys, fast_dumper)
+                return
+            except _LibyamlMismatch:
+                stream.seek(start)
+                stream.truncate()
+        _dump_yaml_events(cfg, stream, resolve, sort_keys, dumper)
+
+    @staticmethod
+    def to_bytes(cfg: Any, *, indexed: bool = False) -> bytes:
+        """
+        Encode a config object in a compact binary format, which is faster to write
+        and read and smaller than a pickle of the config. Unlike a YAML dump, it
+        retains the type information and the flags of the nodes.
+
+        The parent of ``cfg`` (if any) is not encoded, nor are the caches of the
+        config (e.g. ``OmegaConf.get_cache()``).
+
+        :param cfg: Config object, Structured Config type or instance
+        :param indexed: If True, the content of each container is encoded separately,
+            and is only decoded when first accessed (see ``OmegaConf.load(lazy=True)``).
+            This makes the encoded config slightly larger.
+        :return: The encoded config, to decode with ``OmegaConf.from_bytes()``.
+        """
+        cfg = _ensure_container(cfg)
+        return config_to_bytes(cfg, indexed=indexed)
+
+    @staticmethod
+    def from_bytes(data: Union[bytes, mmap.mmap]) -> Union[DictConfig, ListConfig]:
+        """
+        Decode a config encoded by ``OmegaConf.to_bytes()``.
+
+        Like a pickle, the encoded config may refer to types and objects that are
+        imported or unpickled when decoding it: only decode trusted data.
+
+        :param data: The encoded config. If it was encoded with ``indexed=True``, it
+            is kept by the decoded config until the content of all its containers
+            is decoded.
+        :return: The decoded config object.
+        :raises ValueError: If ``data`` is not an encoded config.
+        """
+        cfg = config_from_bytes(data)
+        assert isinstance(cfg, (DictConfig, ListConfig))
+        return cfg
+
     @staticmethod
     def from_cli(args_list: Optional[List[str]] = None) -> DictConfig:
         if args_list is None:
@@ -486,7 +661,10 @@ class OmegaConf:
 
     @staticmethod
     def get_cache(conf: BaseContainer) -> Dict[str, Any]:
-        return conf._metadata.resolver_cache
+        cache = conf._metadata.resolver_cache
+        if cache is None:
+            cache = conf._metadata.resolver_cache = defaultdict(dict)
+        return cache
 
     @staticmethod
     def set_cache(conf: BaseContainer, cache: Dict[str, Any]) -> None:
@@ -500,6 +678,43 @@ class OmegaConf:
     def copy_cache(from_config: BaseContainer, to_config: BaseContainer) -> None:
         OmegaConf.set_cache(to_config, OmegaConf.get_cache(from_config))
 
+    @staticmethod
+    def parse_cache_info(*, compiled: bool = False) -> CacheInfo:
+        """
+        Return statistics about the process-wide cache of interpolation parse trees.
+
+        Interpolations are resolved with a compiled form of the string, which is kept
+        in a separate cache: a string is only parsed when it is first compiled, and
+        simple interpolations (e.g. ``${foo.bar}``) are compiled without parsing.
+        The parse cache statistics thus only cover parsing.
+
+        :param compiled: If True, return the statistics of the cache of compiled
+            interpolations instead, which every resolution goes through.
+        :return: A named tuple with fields `hits`, `misses`, `evictions`, `maxsize`
+            and `currsize`.
+        """
+        if compiled:
+            return program_cache_info()
+        return parse_cache_info()
+
+    @staticmethod
+    def set_parse_cache_size(maxsize: int) -> None:
+        """
+        Set the maximum number of parse trees kept in the interpolation parse cache.
+
+        This also applies to the cache of compiled interpolations.
+
+        :param maxsize: The new cache size. Use 0 to disable caching.
+        """
+        set_parse_cache_size(maxsize)
+        set_program_cache_size(maxsize)
+
+    @staticmethod
+    def clear_parse_cache() -> None:
+        """Empty the interpolation caches and reset the parse cache statistics."""
+        clear_parse_cache()
+        clear_program_cache()
+
     @staticmethod
     def set_readonly(conf: Node, value: Optional[bool]) -> None:
         # noinspection PyProtectedMember
@@ -570,13 +785,25 @@ class OmegaConf:
                 f"Input cfg is not an OmegaConf config object ({type_str(type(cfg))})"
             )
 
-        return BaseContainer._to_content(
-            cfg,
-            resolve=resolve,
-            throw_on_missing=throw_on_missing,
-            enum_to_str=enum_to_str,
-            structured_config_mode=structured_config_mode,
-        )
+        if not resolve:
+            return BaseContainer._to_content(
+                cfg,
+                resolve=False,
+                throw_on_missing=throw_on_missing,
+                enum_to_str=enum_to_str,
+                structured_config_mode=structured_config_mode,
+            )
+
+        from ._impl import resolution_pass
+
+        with resolution_pass(cfg):
+            return BaseContainer._to_content(
+                cfg,
+                resolve=True,
+                throw_on_missing=throw_on_missing,
+                enum_to_str=enum_to_str,
+                structured_config_mode=structured_config_mode,
+            )
 
     @staticmethod
     def to_object(cfg: Any) -> Union[Dict[DictKeyType, Any], List[Any], None, str, Any]:
@@ -599,6 +826,26 @@ class OmegaConf:
             structured_config_mode=SCMode.INSTANTIATE,
         )
 
+    @staticmethod
+    def freeze(cfg: Any) -> Any:
+        """
+        Create an immutable, fully resolved snapshot of a config.
+
+        The snapshot supports the same read access as the config (attributes, items,
+        iteration, ``len``, ``in`` and ``get``), but is much faster to read and much
+        smaller in memory. Nested dicts and lists are turned into ``FrozenDict`` and
+        ``FrozenList`` objects, and structured configs into ``FrozenDict`` objects.
+
+        :param cfg: the config to freeze, or an object convertible to one via
+            ``OmegaConf.create``
+        :return: A ``FrozenDict`` or ``FrozenList``
+        :raises MissingMandatoryValue: If any value is missing.
+        """
+        cfg = _ensure_container(cfg)
+        return freeze_content(
+            OmegaConf.to_container(cfg, resolve=True, throw_on_missing=True)
+        )
+
     @staticmethod
     def is_missing(cfg: Any, key: DictKeyType) -> bool:
         assert isinstance(cfg, Container)
@@ -702,48 +949,7 @@ class OmegaConf:
         :param force_add: insert the entire path regardless of Struct flag or Structured Config nodes.
         """
 
-        split = split_key(key)
-        root = cfg
-        for i in range(len(split) - 1):
-            k = split[i]
-            # if next_root is a primitive (string, int etc) replace it with an empty map
-            next_root, key_ = _select_one(root, k, throw_on_missing=False)
-            if not isinstance(next_root, Container):
-                if force_add:
-                    with flag_override(root, "struct", False):
-                        root[key_] = {}
-                else:
-                    root[key_] = {}
-            root = root[key_]
-
-        last = split[-1]
-
-        assert isinstance(
-            root, Container
-        ), f"Unexpected type for root: {type(root).__name__}"
-
-        last_key: Union[str, int] = last
-        if isinstance(root, ListConfig):
-            last_key = int(last)
-
-        ctx = flag_override(root, "struct", False) if force_add else nullcontext()
-        with ctx:
-            if merge and (OmegaConf.is_config(value) or is_primitive_container(value)):
-                assert isinstance(root, BaseContainer)
-                node = root._get_child(last_key)
-                if OmegaConf.is_config(node):
-                    assert isinstance(node, BaseContainer)
-                    node.merge_with(value)
-                    return
-
-            if OmegaConf.is_dict(root):
-                assert isinstance(last_key, str)
-                root.__setattr__(last_key, value)
-            elif OmegaConf.is_list(root):
-                assert isinstance(last_key, int)
-                root.__setitem__(last_key, value)
-            else:
-                assert False
+        _update(cfg, split_key(key), value, merge=merge, force_add=force_add)
 
     @staticmethod
     def to_yaml(cfg: Any, *, resolve: bool = False, sort_keys: bool = False) -> str:
@@ -758,13 +964,12 @@ class OmegaConf:
         """
         cfg = _ensure_container(cfg)
         container = OmegaConf.to_container(cfg, resolve=resolve, enum_to_str=True)
-        return yaml.dump(  # type: ignore
-            container,
-            default_flow_style=False,
-            allow_unicode=True,
-            sort_keys=sort_keys,
-            Dumper=get_omega_conf_dumper(),
-        )
+        try:
+            dumper = _get_omega_conf_fast_dumper()
+            return _dump_yaml(container, sort_keys, dumper)
+        except _LibyamlMismatch:
+            # Strings that libyaml does not emit like the Python dumper
+            return _dump_yaml(container, sort_keys, get_omega_conf_dumper())
 
     @staticmethod
     def resolve(cfg: Container) -> None:
@@ -782,7 +987,8 @@ class OmegaConf:
             raise ValueError(
                 f"Invalid config type ({type(cfg).__name__}), expected an OmegaConf Container"
             )
-        omegaconf._impl._resolve(cfg)
+        with omegaconf._impl.resolution_pass(cfg):
+            omegaconf._impl._resolve(cfg)
 
     @staticmethod
     def missing_keys(cfg: Any) -> Set[str]:
@@ -813,6 +1019,35 @@ class OmegaConf:
         gather(cfg)
         return missings
 
+    @staticmethod
+    def full_keys(cfg: Any, key: str = "") -> List[str]:
+        """
+        Returns the full keys of all the nodes below a config in a dotlist style,
+        depth first. Interpolations are not resolved: the keys below them are not listed.
+        This is faster on configs with the ``index_keys`` flag set on their root.
+
+        :param cfg: An ``OmegaConf.Container``,
+                    or a convertible object via ``OmegaConf.create`` (dict, list, ...).
+        :param key: Key of the node to list the keys below (as in ``OmegaConf.select``).
+                    Defaults to ``cfg`` itself.
+        :return: list of strings of the full keys.
+        :raises ValueError: On input not representing a config.
+        """
+        cfg = _ensure_container(cfg)
+        node = cfg if key == "" else OmegaConf.select(cfg, key)
+        if not isinstance(node, Container):
+            return []
+        index = _get_key_index(node._get_root())
+        keys = None if index is None else index.full_keys(node)
+        if keys is None:
+            parent = node._get_parent()
+            if parent is None:
+                full_key = node._get_full_key(None)
+            else:
+                full_key = parent._get_full_key(node._key())
+            keys = list(_iter_full_keys(node, full_key))
+        return keys
+
     # === private === #
 
     @staticmethod
@@ -822,14 +1057,13 @@ class OmegaConf:
         flags: Optional[Dict[str, bool]] = None,
     ) -> Union[DictConfig, ListConfig]:
         try:
-            from ._utils import get_yaml_loader
             from .dictconfig import DictConfig
             from .listconfig import ListConfig
 
             if obj is _DEFAULT_MARKER_:
                 obj = {}
             if isinstance(obj, str):
-                obj = yaml.load(obj, Loader=get_yaml_loader())
+                obj = _parse_str(obj)
                 if obj is None:
                     return OmegaConf.create({}, parent=parent, flags=flags)
                 elif isinstance(obj, str):
@@ -1111,12 +1345,194 @@ def _maybe_wrap(
         )
 
 
+def _load_to_bytes(path: Union[str, pathlib.Path]) -> bytes:
+    return OmegaConf.to_bytes(OmegaConf.load(path))
+
+
+def _get_file_format(file_: Any, format: Optional[str]) -> str:
+    if format is None:
+        name = getattr(file_, "name", file_)
+        if isinstance(name, (str, pathlib.Path)) and is_json_path(name):
+            return "json"
+        return "yaml"
+    if format not in ("yaml", "json"):
+        raise ValueError(f"Unsupported format '{format}', expected 'yaml' or 'json'")
+    return format
+
+
+def _dump_yaml(container: Any, sort_keys: bool, dumper: Any) -> str:
+    return yaml.dump(  # type: ignore
+        container,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=sort_keys,
+        Dumper=dumper,
+    )
+
+
+def _dump_yaml_events(
+    cfg: Container, stream: IO[Any], resolve: bool, sort_keys: bool, dumper_type: Any
+) -> None:
+    dumper = dumper_type(
+        stream, default_flow_style=False, allow_unicode=True, sort_keys=sort_keys
+    )
+    events = BaseContainer._to_yaml_events(cfg, resolve, dumper)
+    if dumper_type is not get_omega_conf_dumper():
+        events = _check_libyaml_events(events)
+    try:
+        dumper.open()
+        dumper.emit(yaml.DocumentStartEvent(explicit=False))
+        for event in events:
+            dumper.emit(event)
+        dumper.emit(yaml.DocumentEndEvent(explicit=False))
+        dumper.close()
+    finally:
+        dumper.dispose()
+
+
+def _dump(cfg: Any, stream: IO[Any], resolve: bool, format: str) -> None:
+    if format == "json":
+        container = OmegaConf.to_container(cfg, resolve=resolve, enum_to_str=True)
+        # Serialized before writing anything, so that an error leaves the stream as is
+        try:
+            text = json.dumps(container, ensure_ascii=False, allow_nan=False)
+        except ValueError as e:
+            # NaN and Infinity are not valid JSON, and would be loaded back as strings
+            raise ValueError(f"Cannot save the config as JSON: {e}") from e
+        stream.write(text)
+    else:
+        OmegaConf.dump(cfg, stream, resolve=resolve)
+
+
+def _save_to_path(
+    cfg: Any, path: Union[str, pathlib.Path], resolve: bool, format: str
+) -> None:
+    # The dump is streamed into a temporary file which only replaces the file once it
+    # is complete: an error (e.g. while resolving) does not leave a truncated file.
+    # Anything but a new path or a regular file with a single link (e.g. a device,
+    # a FIFO or a hard link) is written in place, as is a file whose directory does
+    # not allow creating the temporary file.
+    path = os.path.realpath(path)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    if st is None or (stat.S_ISREG(st.st_mode) and st.st_nlink == 1):
+        directory, name = os.path.split(path)
+        tmp_path = os.path.join(directory, f".{name}.{secrets.token_hex(8)}.tmp")
+        # Created like open() would create the file (i.e. subject to the umask)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(tmp_path, flags, 0o666)
+        except PermissionError:
+            pass
+        else:
+            try:
+                with io.open(fd, "w", encoding="utf-8") as file:
+                    _dump(cfg, file, resolve, format)
+                if st is not None:
+                    shutil.copymode(path, tmp_path)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            return
+    with io.open(path, "w", encoding="utf-8") as file:
+        _dump(cfg, file, resolve, format)
+
+
+def _parse_str(text: str) -> Any:
+    """Parse a YAML document, using the much faster JSON parser if it is JSON"""
+    from ._utils import get_yaml_loader
+
+    if text.lstrip()[:1] in ("{", "["):
+        try:
+            return load_json(text)
+        except json.JSONDecodeError:
+            pass  # YAML, such as flow style mappings with unquoted keys
+    return yaml.load(text, Loader=get_yaml_loader())
+
+
+def _update(
+    cfg: Container,
+    split: List[str],
+    value: Any,
+    *,
+    merge: bool,
+    force_add: bool,
+    trie: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Update the key at the path `split` to `value`, see `OmegaConf.update()`.
+    When updating many keys, `trie` caches the containers found along their paths
+    (as `{key: (container, {child_key: ...})}`) so that shared prefixes are walked once.
+    """
+    root = cfg
+    children: Dict[str, Any] = {} if trie is None else trie
+    for k in split[:-1]:
+        cached = children.get(k)
+        if cached is not None:
+            root, children = cached
+            continue
+        # if next_root is a primitive (string, int etc) replace it with an empty map
+        next_root, key_ = _select_one(root, k, throw_on_missing=False)
+        if not isinstance(next_root, Container):
+            if force_add:
+                with flag_override(root, "struct", False):
+                    root[key_] = {}
+            else:
+                root[key_] = {}
+        root = root[key_]
+        if isinstance(next_root, Container) and next_root._is_interpolation():
+            # The update may replace any node of the config through an interpolation
+            # (including cached ones): forget them all, and do not cache this one.
+            if trie is not None:
+                trie.clear()
+            children = {}
+        else:
+            children[k] = (root, {})
+            children = children[k][1]
+
+    last = split[-1]
+
+    assert isinstance(
+        root, Container
+    ), f"Unexpected type for root: {type(root).__name__}"
+
+    # The nodes under `last` may be replaced. Dict keys of other types than str
+    # and list indices can be spelled differently (e.g. "1" and "01"): forget them all.
+    if isinstance(root, DictConfig) and root._metadata.key_type in (Any, str):
+        children.pop(last, None)
+    else:
+        children.clear()
+
+    last_key: Union[str, int] = last
+    if isinstance(root, ListConfig):
+        last_key = int(last)
+
+    ctx = flag_override(root, "struct", False) if force_add else nullcontext()
+    with ctx:
+        if merge and (OmegaConf.is_config(value) or is_primitive_container(value)):
+            assert isinstance(root, BaseContainer)
+            node = root._get_child(last_key)
+            if OmegaConf.is_config(node):
+                assert isinstance(node, BaseContainer)
+                node.merge_with(value)
+                return
+
+        if OmegaConf.is_dict(root):
+            assert isinstance(last_key, str)
+            root.__setattr__(last_key, value)
+        elif OmegaConf.is_list(root):
+            assert isinstance(last_key, int)
+            root.__setitem__(last_key, value)
+        else:
+            assert False
+
+
 def _select_one(
     c: Container, key: str, throw_on_missing: bool, throw_on_type_error: bool = True
 ) -> Tuple[Optional[Node], Union[str, int]]:
-    from .dictconfig import DictConfig
-    from .listconfig import ListConfig
-
     ret_key: Union[str, int] = key
     assert isinstance(c, Container), f"Unexpected type: {c}"
     if c._is_none():
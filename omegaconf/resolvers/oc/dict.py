@@ -31,7 +31,7 @@ def values(key: str, _root_: BaseContainer, _parent_: Container) -> ListConfig:
         key, parent=_parent_, resolver_name="oc.dict.values"
     )
 
-    content = in_dict._content
+    content = in_dict.__dict__["_content"]
     assert isinstance(content, dict)
 
     ret = ListConfig([])
@@ -1,8 +1,9 @@
 import copy
+import io
 import re
 from pathlib import Path
 from textwrap import dedent
-from typing import Any, Tuple
+from typing import Any, List, Tuple
 
 from pytest import mark, param, raises
 
@@ -485,6 +486,93 @@ def test_circular_interpolation(cfg: Any, key: str, expected: Any) -> None:
         assert OmegaConf.select(cfg, key) == expected
 
 
+@mark.parametrize(
+    ("cfg", "key", "cycle"),
+    [
+        param({"a": "${a}"}, "a", "a -> a", id="self"),
+        param({"a": "${b}", "b": "${a}"}, "a", "a -> b -> a", id="two"),
+        param({"a": "${b}", "b": "${c}", "c": "${b}"}, "a", "b -> c -> b", id="tail"),
+        param(
+            {"a": {"a": "${b}"}, "b": "${a.a}"}, "a.a", "a.a -> b -> a.a", id="nested"
+        ),
+        param({"a": ["${.1}", "${.0}"]}, "a[0]", "a[0] -> a[1] -> a[0]", id="list"),
+    ],
+)
+def test_circular_interpolation_path(cfg: Any, key: str, cycle: str) -> None:
+    cfg = OmegaConf.create(cfg)
+    with raises(IRE, match=re.escape(f"Recursive interpolation detected: {cycle}")):
+        OmegaConf.select(cfg, key)
+
+
+@mark.parametrize(
+    "resolve",
+    [
+        param(OmegaConf.resolve, id="resolve"),
+        param(lambda cfg: OmegaConf.to_container(cfg, resolve=True), id="to_container"),
+    ],
+)
+def test_resolve_long_interpolation_chain(resolve: Any) -> None:
+    # Long enough to exceed the recursion limit if resolved recursively.
+    n = 2000
+    cfg = OmegaConf.create({f"k{i}": f"${{k{i + 1}}}" for i in range(n)})
+    cfg[f"k{n}"] = "x"
+    cfg.k = "${k0}_${k1}"
+    resolve(cfg)
+    assert OmegaConf.to_container(cfg, resolve=True) == {
+        **{f"k{i}": "x" for i in range(n + 1)},
+        "k": "x_x",
+    }
+
+
+def test_resolution_pass_memoizes_results(restore_resolvers: Any) -> None:
+    calls: List[int] = []
+
+    def count() -> int:
+        calls.append(1)
+        return len(calls)
+
+    OmegaConf.register_new_resolver("count", count)
+    cfg = OmegaConf.create({"a": "${count:}", "b": "${a}", "c": ["${b}", "${a}"]})
+    assert OmegaConf.to_container(cfg, resolve=True) == {"a": 1, "b": 1, "c": [1, 1]}
+    assert len(calls) == 1
+    # Results are only memoized for the duration of the pass.
+    assert cfg.b == 2
+
+
+def test_resolution_pass_reports_cycle() -> None:
+    cfg = OmegaConf.create({"x": 1, "a": "${b.c}", "b": {"c": "${d}"}, "d": "${a}"})
+    msg = "Recursive interpolation detected: a -> b.c -> d -> a"
+    with raises(IRE, match=re.escape(msg)):
+        OmegaConf.to_container(cfg, resolve=True)
+    with raises(IRE, match=re.escape(msg)):
+        OmegaConf.resolve(cfg)
+
+
+@mark.parametrize(
+    "resolve",
+    [
+        param(OmegaConf.resolve, id="resolve"),
+        param(lambda cfg: OmegaConf.to_container(cfg, resolve=True), id="to_container"),
+        param(lambda cfg: OmegaConf.to_yaml(cfg, resolve=True), id="to_yaml"),
+        param(lambda cfg: OmegaConf.dump(cfg, io.StringIO(), resolve=True), id="dump"),
+    ],
+)
+@mark.parametrize(
+    ("cfg", "key"),
+    [
+        param({"b": ["${oc.select:b,dflt}"]}, "b[0]", id="parent"),
+        param({"a": {"w": "${oc.select:b,dflt}"}, "b": "${a}"}, "a.w", id="indirect"),
+        param({"b": ["${oc.select:c}"], "c": ["${oc.select:b}"]}, "c[0]", id="mutual"),
+    ],
+)
+def test_resolve_value_containing_itself(resolve: Any, cfg: Any, key: str) -> None:
+    cfg = OmegaConf.create(cfg)
+    msg = "Recursive interpolation detected: the resolved value contains this node"
+    with raises(IRE, match=re.escape(msg)) as exc_info:
+        resolve(cfg)
+    assert exc_info.value.full_key == key
+
+
 @mark.parametrize(
     "node_type",
     [
@@ -0,0 +1,194 @@
+import copy
+import pickle
+from typing import Any, Callable, List
+
+from pytest import fixture, mark, param
+
+from omegaconf import DictConfig, ListConfig, OmegaConf
+from omegaconf.basecontainer import BaseContainer
+
+
+@fixture
+def cfg() -> DictConfig:
+    return OmegaConf.create(
+        {
+            "a": {"b": 1, "c": 2, "lst": [10, 20, 30]},
+            "other": 0,
+            "x": "${a.b}",
+            "y": "${x}_${a.lst[1]}",
+            "z": "${a.c}",
+            "s": "a=${a}",
+        },
+        flags={"cache_interpolations": True},
+    )
+
+
+def is_cached(cfg: DictConfig, key: str) -> bool:
+    cache = cfg.__dict__.get("_interpolation_cache")
+    return cache is not None and cache.get(cfg._get_node(key)) is not None
+
+
+def test_cached_results_are_reused(cfg: DictConfig, mocker: Any) -> None:
+    spy = mocker.spy(BaseContainer, "_evaluate_program")
+    assert cfg.y == "1_20"
+    assert spy.call_count == 2  # y and x
+    assert cfg.y == "1_20"
+    assert cfg.x == 1
+    assert spy.call_count == 2
+    assert is_cached(cfg, "x") and is_cached(cfg, "y")
+
+
+def test_not_cached_without_flag(mocker: Any) -> None:
+    cfg = OmegaConf.create({"a": 1, "b": "${a}"})
+    spy = mocker.spy(BaseContainer, "_evaluate_program")
+    assert cfg.b == 1
+    assert cfg.b == 1
+    assert spy.call_count == 2
+    assert "_interpolation_cache" not in cfg.__dict__
+
+
+def test_flag_on_subtree() -> None:
+    cfg = OmegaConf.create({"a": 1, "sub": {"b": "${a}"}, "c": "${a}"})
+    cfg.sub._set_flag("cache_interpolations", True)
+    assert cfg.sub.b == 1 and cfg.c == 1
+    # The cache is stored on the root.
+    cache = cfg.__dict__["_interpolation_cache"]
+    assert cache.get(cfg.sub._get_node("b")) is not None
+    assert cache.get(cfg._get_node("c")) is None
+    cfg.a = 2
+    assert cfg.sub.b == 2
+
+
+def set_item(cfg: DictConfig) -> None:
+    cfg.a["b"] = 5
+
+
+def set_attr(cfg: DictConfig) -> None:
+    cfg.a.b = 5
+
+
+def set_value(cfg: DictConfig) -> None:
+    cfg.a._get_node("b")._set_value(5)
+
+
+def merge_with(cfg: DictConfig) -> None:
+    cfg.merge_with({"a": {"b": 5}})
+
+
+def update(cfg: DictConfig) -> None:
+    OmegaConf.update(cfg, "a.b", 5)
+
+
+def replace_parent(cfg: DictConfig) -> None:
+    cfg.a = {"b": 5, "c": 2, "lst": [10, 20, 30]}
+
+
+def delete_and_add(cfg: DictConfig) -> None:
+    del cfg.a["b"]
+    cfg.a.b = 5
+
+
+def pop_and_add(cfg: DictConfig) -> None:
+    cfg.a.pop("b")
+    cfg.a.b = 5
+
+
+def update_interpolation(cfg: DictConfig) -> None:
+    cfg.x = "${a.c}"
+    cfg.a.c = 5
+
+
+@mark.parametrize(
+    "mutate",
+    [
+        param(set_item, id="setitem"),
+        param(set_attr, id="setattr"),
+        param(set_value, id="set_value"),
+        param(merge_with, id="merge_with"),
+        param(update, id="update"),
+        param(replace_parent, id="replace_parent"),
+        param(delete_and_add, id="delete"),
+        param(pop_and_add, id="pop"),
+        param(update_interpolation, id="update_interpolation"),
+    ],
+)
+def test_invalidation(cfg: DictConfig, mutate: Callable[[DictConfig], None]) -> None:
+    assert (cfg.x, cfg.y, cfg.z) == (1, "1_20", 2)
+    mutate(cfg)
+    assert cfg.x == 5
+    assert cfg.y == "5_20"
+
+
+def test_only_dependents_are_invalidated(cfg: DictConfig) -> None:
+    assert (cfg.x, cfg.y, cfg.z) == (1, "1_20", 2)
+    cfg.a.b = 5
+    assert not is_cached(cfg, "x")
+    assert not is_cached(cfg, "y")  # through `x`
+    assert is_cached(cfg, "z")
+    cfg.other = 1
+    assert is_cached(cfg, "z")
+    cfg.a.c = 3
+    assert not is_cached(cfg, "z")
+    assert cfg.z == 3
+
+
+def test_container_content_dependency(cfg: DictConfig) -> None:
+    assert cfg.s == "a={'b': 1, 'c': 2, 'lst': [10, 20, 30]}"
+    cfg.a.lst[0] = 0
+    assert cfg.s == "a={'b': 1, 'c': 2, 'lst': [0, 20, 30]}"
+    cfg.a.d = 4
+    assert cfg.s == "a={'b': 1, 'c': 2, 'lst': [0, 20, 30], 'd': 4}"
+
+
+@mark.parametrize(
+    ("mutate", "expected"),
+    [
+        param(lambda lst: lst.insert(0, 0), "1_10", id="insert"),
+        param(lambda lst: lst.append(0), "1_20", id="append"),
+        param(lambda lst: lst.pop(0), "1_30", id="pop"),
+        param(lambda lst: lst.__delitem__(0), "1_30", id="del"),
+        param(lambda lst: lst.__delitem__(slice(0, 2)), None, id="del_slice"),
+        param(lambda lst: lst.sort(reverse=True), "1_20", id="sort"),
+        param(lambda lst: lst.__setitem__(1, 0), "1_0", id="setitem"),
+        param(lambda lst: lst.__setitem__(slice(0, 2), [1, 2]), "1_2", id="slice"),
+        param(lambda lst: lst.clear(), None, id="clear"),
+    ],
+)
+def test_list_invalidation(
+    cfg: DictConfig, mutate: Callable[[ListConfig], None], expected: Any
+) -> None:
+    assert cfg.y == "1_20"
+    mutate(cfg.a.lst)
+    if expected is None:
+        assert OmegaConf.select(cfg, "y", throw_on_resolution_failure=False) is None
+    else:
+        assert cfg.y == expected
+
+
+def test_resolver_results_are_not_cached(restore_resolvers: Any) -> None:
+    calls: List[int] = []
+
+    def count() -> int:
+        calls.append(1)
+        return len(calls)
+
+    OmegaConf.register_new_resolver("count", count)
+    cfg = OmegaConf.create(
+        {"a": "${count:}", "b": "${a}", "c": "${oc.select:d,0}"},
+        flags={"cache_interpolations": True},
+    )
+    assert cfg.b == 1
+    assert cfg.b == 2
+    assert not is_cached(cfg, "a") and not is_cached(cfg, "b")
+    assert cfg.c == 0
+    cfg.d = 1
+    assert cfg.c == 1
+
+
+def test_cache_is_not_copied(cfg: DictConfig) -> None:
+    assert cfg.y == "1_20"
+    for cfg_copy in [copy.deepcopy(cfg), pickle.loads(pickle.dumps(cfg))]:
+        assert "_interpolation_cache" not in cfg_copy.__dict__
+        cfg_copy.a.b = 5
+        assert cfg_copy.y == "5_20"
+    assert cfg.y == "1_20"
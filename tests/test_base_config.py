@@ -1,4 +1,5 @@
 import copy
+import pickle
 from typing import Any, Dict, List, Optional, Union
 
 from pytest import mark, param, raises
@@ -209,9 +210,10 @@ class TestDeepCopy:
         c2 = copy.deepcopy(c1)
         assert c1 == c2
 
-        assert c1.__dict__.keys() == c2.__dict__.keys()
-        for k in c1.__dict__.keys():
-            assert c1.__dict__[k] == c2.__dict__[k]
+        state1, state2 = c1.__getstate__(), c2.__getstate__()
+        assert state1.keys() == state2.keys()
+        for k in state1.keys():
+            assert state1[k] == state2[k]
 
         assert id(c1) != id(c2)
 
@@ -293,6 +295,120 @@ def test_deepcopy_preserves_container_type(cfg: Container) -> None:
     assert cp._metadata.element_type == cfg._metadata.element_type
 
 
+def test_deepcopy_is_lazy() -> None:
+    c1 = OmegaConf.create({"a": {"b": [1, 2]}, "c": 3})
+    c2 = copy.deepcopy(c1)
+    assert "_content" not in c2.__dict__
+    assert c2.c == 3
+    assert "_content" not in c2._get_node("a").__dict__
+    assert c2.a.b == [1, 2]
+    assert c2.a._get_parent() is c2
+    assert c2.a.b._get_full_key(0) == "a.b[0]"
+    assert c2.a.b._get_root() is c2
+
+
+@mark.parametrize(
+    "func",
+    [
+        param(lambda c: c.a.__setattr__("b", 10), id="dict_setattr"),
+        param(lambda c: c.a.b.__setitem__(0, 10), id="list_setitem"),
+        param(lambda c: c.a.b.append(10), id="list_append"),
+        param(lambda c: c.a.b.insert(0, 10), id="list_insert"),
+        param(lambda c: c.a.b.pop(), id="list_pop"),
+        param(lambda c: c.a.b.sort(reverse=True), id="list_sort"),
+        param(lambda c: c.a.__delitem__("b"), id="dict_delitem"),
+        param(lambda c: c.a.__delattr__("b"), id="dict_delattr"),
+        param(lambda c: c.a._set_value({"x": 1}), id="dict_set_value"),
+        param(lambda c: c.a.b._set_value([3]), id="list_set_value"),
+        param(lambda c: c.a._get_node("c")._set_value(20), id="value_set_value"),
+        param(lambda c: c.merge_with({"a": {"b": [3], "x": 1}}), id="merge_with"),
+        param(lambda c: OmegaConf.set_readonly(c.a, True), id="set_readonly"),
+        param(lambda c: c.a._get_node("c")._set_key("d"), id="set_key"),
+    ],
+)
+@mark.parametrize("modified", ["source", "copy"])
+def test_deepcopy_is_independent(modified: str, func: Any) -> None:
+    data = {"a": {"b": [2, 1], "c": 3}, "d": [{"e": 4}]}
+    c1 = OmegaConf.create(data)
+    c2 = copy.deepcopy(c1)
+    if modified == "source":
+        func(c1)
+        unchanged = c2
+    else:
+        func(c2)
+        unchanged = c1
+    assert unchanged == data
+    assert not OmegaConf.is_readonly(unchanged.a)
+    assert unchanged.a._get_node("c")._key() == "c"
+    assert unchanged.a.b._get_full_key(0) == "a.b[0]"
+
+
+def test_deepcopy_of_lazy_copy() -> None:
+    c1 = OmegaConf.create({"a": {"b": 1}})
+    c2 = copy.deepcopy(c1)
+    c3 = copy.deepcopy(c2)
+    c1.a.b = 2
+    c2.a.b = 3
+    assert c3 == {"a": {"b": 1}}
+    assert c2 == {"a": {"b": 3}}
+
+
+@mark.parametrize("node_first", [False, True])
+def test_deepcopy_with_shared_nodes(node_first: bool) -> None:
+    c1 = OmegaConf.create({"a": {"b": [1, 2]}, "c": 3})
+    objs = {"node": c1.a.b, "cfg": c1} if node_first else {"cfg": c1, "node": c1.a.b}
+    res = copy.deepcopy(objs)
+    assert res["node"] is res["cfg"].a.b
+    assert res["node"]._get_root() is res["cfg"]
+    assert res["cfg"] == c1
+
+
+def test_deepcopy_with_memo() -> None:
+    c1 = OmegaConf.create({"a": {"b": [1, 2]}, "c": 3})
+    memo: Dict[int, Any] = {}
+    c2 = copy.deepcopy(c1, memo)
+    assert "_content" not in c2.__dict__
+    node = copy.deepcopy(c1.a.b, memo)
+    assert c2.a.b is node
+    # A lazy copy of an unmodified lazy copy copies the nodes of their source, which
+    # are not the nodes copied with the memo.
+    c3 = copy.deepcopy(c1)
+    c4 = copy.deepcopy(c3, memo)
+    assert "_content" not in c4.__dict__
+    assert c4.a.b is not node
+    assert c4.a.b == [1, 2]
+
+
+def test_lazy_copy_content_attribute() -> None:
+    c1 = OmegaConf.create({"a": {"b": [1, 2]}})
+    c2 = copy.deepcopy(c1)
+    assert isinstance(c2._content, dict)
+    assert c2._content.keys() == {"a"}
+    a = c2._get_node("a")
+    assert isinstance(a, DictConfig) and isinstance(a._content, dict)
+    b = a._content["b"]
+    assert isinstance(b, ListConfig) and isinstance(b._content, list)
+    assert b._content[1] == 2
+    assert copy.deepcopy(c1.a.b)._content == [1, 2]
+
+
+def test_pickle_lazy_copy() -> None:
+    c1 = OmegaConf.create({"a": {"b": [1, 2]}})
+    c2 = copy.deepcopy(c1)
+    assert pickle.loads(pickle.dumps(c1)) == c1
+    assert pickle.loads(pickle.dumps(c2)) == c1
+
+
+def test_merge_with_large_base_is_lazy() -> None:
+    base = OmegaConf.create({"a": {"b": 1}, "c": {"d": {"e": 2}}})
+    ret = OmegaConf.merge(base, {"a": {"b": 10}})
+    assert isinstance(ret, DictConfig)
+    assert "_content" not in ret._get_node("c").__dict__
+    assert ret == {"a": {"b": 10}, "c": {"d": {"e": 2}}}
+    assert ret.c.d._get_full_key("e") == "c.d.e"
+    assert base.a.b == 1
+
+
 @mark.parametrize(
     "src, flag_name, func, expectation",
     [
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import copy
+import pickle
 import re
 from pathlib import Path
 from textwrap import dedent
@@ -447,7 +449,7 @@ def test_list_dir(cfg: Any, expected: Any) -> None:
 def validate_list_keys(c: Any) -> None:
     # validate keys are maintained
     for i in range(len(c)):
-        assert c._get_node(i)._metadata.key == i
+        assert c._get_node(i)._key() == i
 
 
 @mark.parametrize(
@@ -598,6 +600,43 @@ def test_insert(
     validate_list_keys(c)
 
 
+@mark.parametrize("index", [0, 1, 3, 10, -1, -3, -10])
+def test_insert_position(index: int) -> None:
+    c = OmegaConf.create(["a", "b", "c"])
+    expected = ["a", "b", "c"]
+    c.insert(index, "x")
+    expected.insert(index, "x")
+    assert c == expected
+    validate_list_keys(c)
+
+
+def test_keys_of_moved_items() -> None:
+    cfg = OmegaConf.create({"lst": list(range(10)), "ref": "${lst[5]}"})
+    c = cfg.lst
+    c.insert(0, -1)
+    del c[3]
+    c.pop(1)
+    copies = [copy.deepcopy(c), pickle.loads(pickle.dumps(c))]
+    del c[:2]
+    assert c == [3, 4, 5, 6, 7, 8, 9]
+    assert c._get_node(2)._get_full_key(None) == "lst[2]"
+    assert cfg.ref == 8
+    validate_list_keys(c)
+    for c_copy in copies:
+        assert c_copy == [-1, 1, 3, 4, 5, 6, 7, 8, 9]
+        validate_list_keys(c_copy)
+
+
+@mark.parametrize("index", [1, -3])
+def test_keys_after_setitem(index: int) -> None:
+    cfg = OmegaConf.create({"lst": [1, 2, 3, 4]})
+    cfg.lst[index] = {"a": "???"}
+    validate_list_keys(cfg.lst)
+    del cfg.lst[2]
+    validate_list_keys(cfg.lst)
+    assert OmegaConf.missing_keys(cfg) == {"lst[1].a"}
+
+
 @mark.parametrize(
     "lst,idx,value,expectation",
     [
@@ -10,8 +10,10 @@ from typing import Any, Dict, List, Optional
 import yaml
 from pytest import mark, param, raises
 
-from omegaconf import DictConfig, ListConfig, OmegaConf
-from omegaconf.errors import UnsupportedValueType, ValidationError
+from omegaconf import Container, DictConfig, ListConfig, Node, OmegaConf
+from omegaconf._utils import _create_yaml_loader, get_yaml_loader
+from omegaconf.basecontainer import BaseContainer
+from omegaconf.errors import GrammarParseError, UnsupportedValueType, ValidationError
 from tests import (
     ConcretePlugin,
     DictOfAny,
@@ -236,6 +238,48 @@ def test_create_nested_dict_with_illegal_value() -> None:
         OmegaConf.create({"a": {"b": IllegalType()}})
 
 
+def test_create_dict_with_invalid_interpolation() -> None:
+    with raises(GrammarParseError, match=re.escape("full_key: a.b")):
+        OmegaConf.create({"a": {"b": "${foo"}})
+
+
+def _assert_same_tree(node1: Node, node2: Node) -> None:
+    assert type(node1) is type(node2)
+    assert node1._metadata == node2._metadata
+    content1 = node1.__dict__["_content"] if isinstance(node1, Container) else None
+    content2 = node2.__dict__["_content"] if isinstance(node2, Container) else None
+    if isinstance(content1, (dict, list)):
+        assert isinstance(content2, type(content1))
+        assert len(content1) == len(content2)
+        keys = list(content1) if isinstance(content1, dict) else range(len(content1))
+        assert keys == (list(content2) if isinstance(content2, dict) else keys)
+        for key in keys:
+            assert content1[key]._get_parent() is node1
+            assert content2[key]._get_parent() is node2
+            _assert_same_tree(content1[key], content2[key])
+    elif isinstance(node1, Container):
+        assert content1 == content2
+    else:
+        assert type(node1._value()) is type(node2._value())
+        assert node1._value() == node2._value()
+
+
+@mark.parametrize(
+    "data",
+    [
+        param({"a": 1, "b": [1.5, True, None, b"x"], "c": {"d": "???"}}, id="dict"),
+        param([{"a": "${b}"}, [], {}, "x_${a}", -1], id="list"),
+        param({1: "one", "x": {1.5: 2, True: 3}}, id="non_str_keys"),
+        param({"a": [Path("x"), (1, 2)]}, id="non_plain_values"),
+    ],
+)
+def test_create_plain_data_fast_path(data: Any, monkeypatch: Any) -> None:
+    cfg = OmegaConf.create(data)
+    monkeypatch.setattr(BaseContainer, "_are_plain_items", lambda self, items: False)
+    expected = OmegaConf.create(data)
+    _assert_same_tree(cfg, expected)
+
+
 def test_create_from_oc() -> None:
     c = OmegaConf.create(
         {"a": OmegaConf.create([1, 2, 3]), "b": OmegaConf.create({"c": 10})}
@@ -413,6 +457,69 @@ def test_yaml_duplicate_keys(input_: str) -> None:
         OmegaConf.create(input_)
 
 
+@mark.parametrize(
+    "base",
+    [
+        param(yaml.SafeLoader, id="python"),
+        param(
+            getattr(yaml, "CSafeLoader", None),
+            marks=mark.skipif(not yaml.__with_libyaml__, reason="requires libyaml"),
+            id="libyaml",
+        ),
+    ],
+)
+def test_yaml_loader(base: Any) -> None:
+    loader = _create_yaml_loader(base)
+    yaml_document = dedent(
+        """\
+        float: 1e3
+        float_underscore: 1_000.5
+        int: 1_000
+        timestamp: 2001-12-14
+        path: !!python/object/apply:pathlib.Path
+          - hello.txt
+        """
+    )
+    assert yaml.load(yaml_document, Loader=loader) == {
+        "float": 1000.0,
+        "float_underscore": 1000.5,
+        "int": 1000,
+        "timestamp": "2001-12-14",
+        "path": Path("hello.txt"),
+    }
+    with raises(yaml.constructor.ConstructorError, match="found duplicate key a"):
+        yaml.load("a: 1\na: 2", Loader=loader)
+
+
+def test_yaml_loader_is_cached() -> None:
+    loader = get_yaml_loader()
+    assert get_yaml_loader() is loader
+    if yaml.__with_libyaml__:
+        assert issubclass(loader, yaml.CSafeLoader)
+
+
+@mark.parametrize(
+    "input_",
+    [
+        param('{"a": 1, "b": [1.5, true, null], "c": {"d": "???"}}', id="dict"),
+        param(' \n[1, -0, 1e5, 1E+2, 12345678901234567890, "${a}"]', id="list"),
+        param('{"1": "a\\/b\\u00e9", "true": {}, "": []}', id="keys"),
+        param("[NaN, Infinity, -Infinity]", id="non_finite"),
+        param("{a: 1, b: [c, d]}", id="yaml_flow_style"),
+    ],
+)
+def test_create_from_json_str(input_: str) -> None:
+    cfg = OmegaConf.create(input_)
+    expected = yaml.load(input_, Loader=get_yaml_loader())
+    assert cfg == expected
+    assert repr(OmegaConf.to_container(cfg)) == repr(expected)
+
+
+def test_create_from_json_str_duplicate_keys() -> None:
+    with raises(yaml.constructor.ConstructorError, match="found duplicate key a"):
+        OmegaConf.create('{"a": 1, "b": {}, "a": 2}')
+
+
 def test_yaml_merge() -> None:
     cfg = OmegaConf.create(
         dedent(
@@ -0,0 +1,140 @@
+import copy
+import pickle
+import re
+from typing import Any, Callable
+
+from pytest import mark, param, raises
+
+from omegaconf import (
+    FrozenDict,
+    FrozenList,
+    MissingMandatoryValue,
+    OmegaConf,
+    ReadonlyConfigError,
+)
+from omegaconf.errors import (
+    ConfigAttributeError,
+    ConfigKeyError,
+    InterpolationToMissingValueError,
+)
+from tests import Color, User
+
+
+@mark.parametrize(
+    ("cfg", "expected"),
+    [
+        param({}, {}, id="empty_dict"),
+        param([], [], id="empty_list"),
+        param({"a": 1, "b": [1, {"c": 2}]}, {"a": 1, "b": [1, {"c": 2}]}, id="nested"),
+        param(
+            {"a": 1, "b": "${a}", "c": "x_${a}"},
+            {"a": 1, "b": 1, "c": "x_1"},
+            id="inter",
+        ),
+        param(
+            {"a": {"b": 1}, "c": "${a}"},
+            {"a": {"b": 1}, "c": {"b": 1}},
+            id="node_inter",
+        ),
+        param({"a": Color.RED}, {"a": Color.RED}, id="enum"),
+        param(User(name="Bond", age=7), {"name": "Bond", "age": 7}, id="structured"),
+    ],
+)
+def test_freeze(cfg: Any, expected: Any) -> None:
+    frozen = OmegaConf.freeze(cfg)
+    assert isinstance(frozen, FrozenDict if isinstance(expected, dict) else FrozenList)
+    assert frozen == expected
+    assert repr(frozen) == repr(expected)
+
+
+def test_freeze_missing() -> None:
+    with raises(MissingMandatoryValue):
+        OmegaConf.freeze(User)
+    with raises(InterpolationToMissingValueError):
+        OmegaConf.freeze({"a": {"b": "${c}"}, "c": "???"})
+
+
+def test_read_access() -> None:
+    frozen = OmegaConf.freeze(
+        OmegaConf.create({"a": {"b": [1, {"c": 2}]}, "d": None, 1: "one"})
+    )
+    assert isinstance(frozen, FrozenDict)
+    assert frozen.a.b[1].c == 2
+    assert frozen["a"]["b"][-1]["c"] == 2
+    assert frozen.d is None
+    assert frozen[1] == "one"
+    assert frozen.get("missing") is None
+    assert frozen.get("missing", 10) == 10
+    assert "a" in frozen and "z" not in frozen
+    assert list(frozen) == ["a", "d", 1]
+    assert len(frozen) == 3
+    assert dict(frozen.items())["d"] is None
+    assert isinstance(frozen.a.b, FrozenList)
+    assert frozen.a.b[0:1] == [1]
+    assert isinstance(frozen.a.b[0:1], FrozenList)
+    assert 1 in frozen.a.b
+    assert list(frozen.a.b)[0] == 1
+    assert frozen.a.b.index(1) == 0
+    assert dir(frozen) == ["a", "d"]
+
+
+def test_missing_key() -> None:
+    frozen = OmegaConf.freeze({"a": 1})
+    with raises(ConfigAttributeError, match=re.escape("Missing key b")):
+        frozen.b
+    with raises(ConfigKeyError, match=re.escape("Missing key b")):
+        frozen["b"]
+    with raises(AttributeError):
+        frozen.__foo__
+
+
+@mark.parametrize(
+    "func",
+    [
+        param(lambda c: c.__setattr__("a", 2), id="dict_setattr"),
+        param(lambda c: c.__setitem__("a", 2), id="dict_setitem"),
+        param(lambda c: c.__delattr__("a"), id="dict_delattr"),
+        param(lambda c: c.__delitem__("a"), id="dict_delitem"),
+        param(lambda c: c.b.__setitem__(0, 2), id="list_setitem"),
+        param(lambda c: c.b.__delitem__(0), id="list_delitem"),
+    ],
+)
+def test_immutable(func: Callable[[Any], None]) -> None:
+    frozen = OmegaConf.freeze({"a": 1, "b": [1]})
+    with raises(ReadonlyConfigError):
+        func(frozen)
+    assert frozen == {"a": 1, "b": [1]}
+
+
+def test_snapshot_is_independent_from_config() -> None:
+    cfg = OmegaConf.create({"a": 1, "b": "${a}"})
+    frozen = OmegaConf.freeze(cfg)
+    cfg.a = 2
+    assert frozen == {"a": 1, "b": 1}
+
+
+def test_eq_and_hash() -> None:
+    frozen = OmegaConf.freeze({"a": [1, 2], "b": {"c": 3}})
+    other = OmegaConf.freeze({"a": [1, 2], "b": {"c": 3}})
+    assert frozen == other
+    assert hash(frozen) == hash(other)
+    assert frozen != OmegaConf.freeze({"a": [1, 2], "b": {"c": 4}})
+    assert frozen.a == (1, 2)
+    assert frozen.a != "12"
+    assert {frozen: 1}[other] == 1
+
+
+def test_copy_and_pickle() -> None:
+    frozen = OmegaConf.freeze({"a": [1, 2], "b": {"c": 3}})
+    assert copy.copy(frozen) is frozen
+    assert copy.deepcopy(frozen) is frozen
+    loaded = pickle.loads(pickle.dumps(frozen))
+    assert loaded == frozen
+    assert isinstance(loaded, FrozenDict)
+    assert isinstance(loaded.a, FrozenList)
+
+
+def test_no_instance_dict() -> None:
+    frozen = OmegaConf.freeze({"a": [1]})
+    assert not hasattr(frozen, "__dict__")
+    assert not hasattr(frozen.a, "__dict__")
@@ -2,10 +2,10 @@ import math
 import re
 import threading
 import time
-from typing import Any, Callable, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import antlr4
-from pytest import mark, param, raises, warns
+from pytest import fixture, mark, param, raises, warns
 
 from omegaconf import (
     AnyNode,
@@ -14,6 +14,7 @@ from omegaconf import (
     ListConfig,
     OmegaConf,
     _utils,
+    grammar_compiler,
     grammar_parser,
     grammar_visitor,
 )
@@ -446,6 +447,20 @@ class TestOmegaConfGrammar:
         )
         self._visit(lambda: visitor.visit(parse_tree), expected_visit)
 
+    @parametrize_from(PARAMS_SINGLE_ELEMENT_NO_INTERPOLATION)
+    def test_single_element_no_interpolation_compiled(
+        self, definition: str, expected: Any
+    ) -> None:
+        parse_tree, expected_visit = self._parse("singleElement", definition, expected)
+        if parse_tree is None:
+            return
+
+        def run() -> Any:
+            program = grammar_compiler.compile_parse_tree(parse_tree)
+            return program(None, None, None)  # type: ignore
+
+        self._visit(run, expected_visit)
+
     @parametrize_from(PARAMS_SINGLE_ELEMENT_WITH_INTERPOLATION)
     def test_single_element_with_resolver(
         self, restore_resolvers: Any, definition: str, expected: Any
@@ -731,7 +746,7 @@ def test_parse_interpolation(inter: Any, key: Any, expected: Any) -> None:
         lexer_mode="VALUE_MODE",
     )
 
-    def callback(inter_key: Any, memo: Optional[Set[int]]) -> Any:
+    def callback(inter_key: Any, memo: Optional[Dict[int, Any]]) -> Any:
         assert isinstance(root, Container)
         ret = root._resolve_node_interpolation(inter_key=inter_key, memo=memo)
         return ret
@@ -799,10 +814,11 @@ def test_grammar_cache_is_thread_safe() -> None:
     lexer_ids = []
     stop = threading.Event()
 
-    def check_cache_lexer_id() -> None:
+    def check_cache_lexer_id(idx: int) -> None:
         # Parse a dummy string to make sure the grammar cache is populated
         # (this also checks that multiple threads can parse in parallel).
-        grammar_parser.parse("foo")
+        # Each thread uses its own string so as to bypass the parse tree cache.
+        grammar_parser.parse(f"foo_{idx}")
         # Keep track of the ID of the cached lexer.
         lexer_ids.append(id(grammar_parser._grammar_cache.data[0]))
         # Wait until we are done.
@@ -812,7 +828,7 @@ def test_grammar_cache_is_thread_safe() -> None:
     # Launch threads.
     threads = []
     for i in range(n_threads):
-        threads.append(threading.Thread(target=check_cache_lexer_id))
+        threads.append(threading.Thread(target=check_cache_lexer_id, args=(i,)))
         threads[-1].start()
 
     # Wait until all threads have reported their lexer ID.
@@ -826,3 +842,210 @@ def test_grammar_cache_is_thread_safe() -> None:
 
     # Check that each thread used a unique lexer.
     assert len(set(lexer_ids)) == n_threads
+
+
+class TestCompiledProgram:
+    def test_program_is_cached_on_parse_tree(self) -> None:
+        tree = grammar_parser.parse("${foo}_${bar:1,2}")
+        program = grammar_compiler.compile_parse_tree(tree)
+        assert grammar_compiler.compile_parse_tree(tree) is program
+
+    def test_constant_resolver_args_are_shared(self) -> None:
+        program = grammar_compiler.compile_parse_tree(
+            grammar_parser.parse("${foo:1,'a',null,${x}}")
+        )
+        calls: List[Any] = []
+
+        def node(key: Any, memo: Optional[Dict[int, Any]]) -> Any:
+            return key
+
+        def resolver(name: str, args: Any, args_str: Any) -> Any:
+            calls.append((name, args, args_str))
+            return "res"
+
+        for _ in range(2):
+            assert program(node, resolver, None) == "res"
+        assert calls == [("foo", (1, "a", None, "x"), ("1", "'a'", "null", "${x}"))] * 2
+
+    def test_mutable_results_are_not_shared(self) -> None:
+        program = grammar_compiler.compile_parse_tree(
+            grammar_parser.parse(
+                "[1, {a: [2]}]", parser_rule="singleElement", lexer_mode="VALUE_MODE"
+            )
+        )
+        first = program(None, None, None)  # type: ignore
+        second = program(None, None, None)  # type: ignore
+        assert first == second == [1, {"a": [2]}]
+        assert first is not second and first[1] is not second[1]
+
+    def test_empty_element_warns_on_each_evaluation(self) -> None:
+        program = grammar_compiler.compile_parse_tree(grammar_parser.parse("${foo:a,}"))
+        for _ in range(2):
+            with warns(UserWarning, match=re.escape("issues/572")):
+                program(None, lambda **kw: kw["args"], None)  # type: ignore
+
+
+def _run_program(program: grammar_compiler.Program) -> str:
+    """Evaluate a program with callbacks that report what they are called with"""
+
+    def node(key: Any, memo: Optional[Dict[int, Any]]) -> Any:
+        return f"<{key}>"
+
+    return repr(
+        program(node, lambda name, args, args_str: (name, args, args_str), None)
+    )
+
+
+class TestSimpleInterpolationFastPath:
+    @mark.parametrize(
+        "expression",
+        [
+            "${foo}",
+            "${  foo \t}",
+            "x ${ab.cd.ef.gh} y",
+            "$ ${foo} ${bar} ${boz} $",
+            "$$${foo}$$",
+            "${foo[bar].baz[boz]}",
+            "${..[foo].bar}",
+            "${$foo.bar$.x$y}",
+            "${$0.1.2$}",
+            "${foo-bar:bar-foo}",
+            "${foo : bar, baz,\tboz}",
+            "${foo:bar,0,a-b+c*d/$.%@?|}",
+            "${ns.f:1,-1,+2,1_000,00,0.5,5.,.5,1e3,-1E-3_0,1_0.5_1,1.2.3}",
+            "${f:inf,-INF,nan,NaN,Infinity,infx,e5,1e,.}",
+            "${f:true,FaLsE,null,NULL,true1,nullx,_null}",
+            "${f:/,-,+,$,%,*,@,?,|,$x,a/b}",
+            "pre_${a.b}_${f:x,1}_post",
+        ],
+    )
+    def test_same_as_grammar(self, expression: str) -> None:
+        program = grammar_compiler._compile_simple(expression)
+        assert program is not None
+        tree = grammar_parser.parse(expression)
+        expected = grammar_compiler.compile_parse_tree(tree)
+        assert _run_program(program) == _run_program(expected)
+
+    @mark.parametrize(
+        "expression",
+        [
+            "no interpolation",
+            "${foo:'quoted'}",
+            "${foo.${bar}}",
+            "${foo:${bar}}",
+            "${foo:[1,2]}",
+            r"\${foo}",
+            r"\\${foo}",
+            "${foo}\\",
+            "${foo\n}",
+            "${\nfoo}",
+            "${foo:a\n}",
+            # Not matched by `SIMPLE_INTERPOLATION_PATTERN`.
+            "${foo:}",
+            # Matched by `SIMPLE_INTERPOLATION_PATTERN`, but not valid.
+            "${:foo}",
+        ],
+    )
+    def test_fallback(self, expression: str) -> None:
+        assert grammar_compiler._compile_simple(expression) is None
+
+    def test_no_parsing(self) -> None:
+        OmegaConf.clear_parse_cache()
+        program = grammar_compiler.compile_interpolation("${a.b}_${f:x}")
+        assert OmegaConf.parse_cache_info().misses == 0
+        assert grammar_compiler.compile_interpolation("${a.b}_${f:x}") is program
+
+    def test_invalid_falls_back_to_parser(self) -> None:
+        with raises(GrammarParseError):
+            grammar_compiler.compile_interpolation("${:foo}")
+
+
+class TestParseCache:
+    @fixture(autouse=True)
+    def restore_cache(self) -> Any:
+        OmegaConf.clear_parse_cache()
+        yield
+        OmegaConf.set_parse_cache_size(grammar_parser.DEFAULT_PARSE_CACHE_SIZE)
+        OmegaConf.clear_parse_cache()
+
+    def test_hit(self) -> None:
+        tree = grammar_parser.parse("${foo}_${bar:1,2}")
+        assert grammar_parser.parse("${foo}_${bar:1,2}") is tree
+        info = OmegaConf.parse_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_key_includes_rule_and_mode(self) -> None:
+        tree = grammar_parser.parse("abc")
+        other = grammar_parser.parse(
+            "abc", parser_rule="singleElement", lexer_mode="VALUE_MODE"
+        )
+        assert other is not tree
+        assert OmegaConf.parse_cache_info().currsize == 2
+
+    def test_parse_error_not_cached(self) -> None:
+        for _ in range(2):
+            with raises(GrammarParseError):
+                grammar_parser.parse("${foo")
+        info = OmegaConf.parse_cache_info()
+        assert (info.misses, info.currsize) == (2, 0)
+
+    def test_eviction(self) -> None:
+        OmegaConf.set_parse_cache_size(2)
+        first = grammar_parser.parse("${a}")
+        grammar_parser.parse("${b}")
+        grammar_parser.parse("${a}")  # `${a}` becomes the most recently used
+        grammar_parser.parse("${c}")  # evicts `${b}`
+        info = OmegaConf.parse_cache_info()
+        assert (info.evictions, info.maxsize, info.currsize) == (1, 2, 2)
+        assert grammar_parser.parse("${a}") is first
+        hits = OmegaConf.parse_cache_info().hits
+        grammar_parser.parse("${b}")
+        assert OmegaConf.parse_cache_info().hits == hits
+
+    def test_disable(self) -> None:
+        OmegaConf.set_parse_cache_size(0)
+        assert grammar_parser.parse("${a}") is not grammar_parser.parse("${a}")
+        info = OmegaConf.parse_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (0, 2, 0)
+
+    def test_shrink(self) -> None:
+        for key in "abc":
+            grammar_parser.parse(f"${{{key}}}")
+        OmegaConf.set_parse_cache_size(1)
+        info = OmegaConf.parse_cache_info()
+        assert (info.evictions, info.currsize) == (2, 1)
+
+    @mark.parametrize("size", [-1, 1.5, "10"])
+    def test_invalid_size(self, size: Any) -> None:
+        with raises(ValueError):
+            OmegaConf.set_parse_cache_size(size)
+
+    def test_clear(self) -> None:
+        grammar_parser.parse("${a}")
+        OmegaConf.clear_parse_cache()
+        assert OmegaConf.parse_cache_info() == (
+            0,
+            0,
+            0,
+            grammar_parser.DEFAULT_PARSE_CACHE_SIZE,
+            0,
+        )
+
+    def test_resolution_uses_cache(self) -> None:
+        # Quoted strings are not handled by the fast path and require parsing.
+        value = "${oc.select:x,'default'}"
+        cfg = OmegaConf.create({"x": 1, "a": value, "b": value})
+        assert cfg.a == cfg.b == 1
+        assert OmegaConf.parse_cache_info().hits >= 1
+
+    def test_compiled_cache_info(self) -> None:
+        cfg = OmegaConf.create({"x": 1, "a": "${x}", "b": "${x}"})
+        assert cfg.a == cfg.b == 1
+        info = OmegaConf.parse_cache_info(compiled=True)
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+        # Simple interpolations are compiled without parsing.
+        assert OmegaConf.parse_cache_info().misses == 0
+        OmegaConf.set_parse_cache_size(0)
+        assert OmegaConf.parse_cache_info(compiled=True).maxsize == 0
+        OmegaConf.clear_parse_cache()
+        assert OmegaConf.parse_cache_info(compiled=True).currsize == 0
@@ -0,0 +1,212 @@
+import copy
+import pickle
+from typing import Any, Callable, List
+
+from pytest import fixture, mark, param
+
+from omegaconf import DictConfig, OmegaConf
+from omegaconf.base import _iter_full_keys
+from omegaconf.omegaconf import _select_one
+
+
+@fixture
+def cfg() -> DictConfig:
+    return OmegaConf.create(
+        {
+            "a": {"b": 1, "lst": [10, {"c": 2}, [3]]},
+            "x": "${a.b}",
+            "inter": "${a}",
+            "missing": "???",
+            "none": None,
+        },
+        flags={"index_keys": True},
+    )
+
+
+LST_KEYS = ["a.lst[0]", "a.lst[1]", "a.lst[1].c", "a.lst[2]", "a.lst[2][0]"]
+
+
+def unindexed_full_keys(cfg: DictConfig) -> List[str]:
+    return list(_iter_full_keys(cfg, ""))
+
+
+def test_full_keys(cfg: DictConfig) -> None:
+    expected = [
+        "a",
+        "a.b",
+        "a.lst",
+        *LST_KEYS,
+        "x",
+        "inter",
+        "missing",
+        "none",
+    ]
+    assert OmegaConf.full_keys(cfg) == expected
+    assert "_key_index" in cfg.__dict__
+    assert OmegaConf.full_keys(OmegaConf.create(cfg, flags={})) == expected
+
+
+@mark.parametrize("indexed", [True, False])
+@mark.parametrize(
+    "key, expected",
+    [
+        param("a.lst", LST_KEYS),
+        param("a.lst[1]", ["a.lst[1].c"]),
+        param("a.b", [], id="value"),
+        param("missing", [], id="missing"),
+        param("not_found", [], id="not_found"),
+        # Interpolations are resolved, as with `OmegaConf.select()`.
+        param("inter", ["a.b", "a.lst", *LST_KEYS]),
+    ],
+)
+def test_full_keys_below(
+    cfg: DictConfig, indexed: bool, key: str, expected: List[str]
+) -> None:
+    target = cfg if indexed else OmegaConf.create(OmegaConf.to_container(cfg))
+    assert OmegaConf.full_keys(target, key) == expected
+
+
+def test_select_uses_index(cfg: DictConfig, mocker: Any) -> None:
+    select_one = mocker.patch(
+        "omegaconf.omegaconf._select_one", side_effect=_select_one
+    )
+    assert OmegaConf.select(cfg, "a.lst[1].c") == 2
+    # Only the last key is selected from its parent.
+    assert select_one.call_count == 1
+    assert cfg.x == 1
+
+
+def test_not_indexed_without_flag() -> None:
+    cfg = OmegaConf.create({"a": {"b": 1}})
+    assert OmegaConf.select(cfg, "a.b") == 1
+    assert cfg.a._get_full_key("b") == "a.b"
+    assert "_key_index" not in cfg.__dict__
+
+
+def set_item(cfg: DictConfig) -> None:
+    cfg.a["b"] = {"new": 1}
+
+
+def add_key(cfg: DictConfig) -> None:
+    cfg.a.new = {"c": [1, 2]}
+
+
+def delete_key(cfg: DictConfig) -> None:
+    del cfg.a["lst"]
+
+
+def pop_key(cfg: DictConfig) -> None:
+    cfg.a.pop("b")
+
+
+def replace_container(cfg: DictConfig) -> None:
+    cfg.a = {"lst": [{"c": 3}]}
+
+
+def set_value(cfg: DictConfig) -> None:
+    cfg.a._set_value({"b": {"c": 1}})
+
+
+def set_missing(cfg: DictConfig) -> None:
+    cfg.a.lst._set_value("???")
+
+
+def set_interpolation(cfg: DictConfig) -> None:
+    cfg.a._set_value("${x}")
+
+
+def merge_with(cfg: DictConfig) -> None:
+    cfg.merge_with({"a": {"lst": [{"d": 1}], "e": {"f": 1}}})
+
+
+def update(cfg: DictConfig) -> None:
+    OmegaConf.update(cfg, "a.g.h", 1, force_add=True)
+
+
+def list_insert(cfg: DictConfig) -> None:
+    cfg.a.lst.insert(0, {"first": 1})
+
+
+def list_pop(cfg: DictConfig) -> None:
+    cfg.a.lst.pop(0)
+
+
+def list_delete_slice(cfg: DictConfig) -> None:
+    del cfg.a.lst[:2]
+
+
+def list_append(cfg: DictConfig) -> None:
+    cfg.a.lst.append([{"c": 4}])
+
+
+def list_clear(cfg: DictConfig) -> None:
+    cfg.a.lst.clear()
+
+
+@mark.parametrize(
+    "mutate",
+    [
+        param(set_item, id="setitem"),
+        param(add_key, id="add_key"),
+        param(delete_key, id="delitem"),
+        param(pop_key, id="pop"),
+        param(replace_container, id="replace_container"),
+        param(set_value, id="set_value"),
+        param(set_missing, id="set_missing"),
+        param(set_interpolation, id="set_interpolation"),
+        param(merge_with, id="merge_with"),
+        param(update, id="update"),
+        param(list_insert, id="list_insert"),
+        param(list_pop, id="list_pop"),
+        param(list_delete_slice, id="list_delete_slice"),
+        param(list_append, id="list_append"),
+        param(list_clear, id="list_clear"),
+    ],
+)
+def test_index_is_updated(
+    cfg: DictConfig, mutate: Callable[[DictConfig], None]
+) -> None:
+    OmegaConf.full_keys(cfg)  # build the index
+    mutate(cfg)
+    expected = unindexed_full_keys(cfg)
+    assert OmegaConf.full_keys(cfg) == expected
+
+    unindexed = OmegaConf.create(OmegaConf.to_container(cfg))
+    for key in expected:
+        node = OmegaConf.select(cfg, key, throw_on_resolution_failure=False)
+        expected_node = OmegaConf.select(
+            unindexed, key, throw_on_resolution_failure=False
+        )
+        if OmegaConf.is_config(node):
+            assert OmegaConf.to_container(node) == OmegaConf.to_container(expected_node)
+        else:
+            assert node == expected_node
+        parent, _, last_key = key.rpartition(".")
+        if not parent or "[" in last_key:
+            continue
+        container = OmegaConf.select(cfg, parent, throw_on_resolution_failure=False)
+        if OmegaConf.is_dict(container):
+            assert container._get_full_key(last_key) == key
+
+
+def test_keys_that_cannot_be_selected() -> None:
+    cfg = OmegaConf.create(
+        {"a.b": {"c": 1}, "": 2, 1: {"d": 3}}, flags={"index_keys": True}
+    )
+    assert OmegaConf.full_keys(cfg) == ["a.b", "a.b.c", "", "1", "1.d"]
+    assert OmegaConf.select(cfg, "a.b.c") is None
+    assert OmegaConf.select(cfg, "1.d") is None
+
+
+def test_index_not_copied(cfg: DictConfig) -> None:
+    OmegaConf.full_keys(cfg)
+    assert "_key_index" not in copy.deepcopy(cfg).__dict__
+    assert "_key_index" not in pickle.loads(pickle.dumps(cfg)).__dict__
+
+
+def test_index_dropped_when_root_is_added_to_config(cfg: DictConfig) -> None:
+    OmegaConf.full_keys(cfg)
+    parent = OmegaConf.create({}, flags={"no_deepcopy_set_nodes": True})
+    parent.child = cfg
+    assert "_key_index" not in cfg.__dict__
+    assert OmegaConf.full_keys(parent, "child.a.lst[1]") == ["child.a.lst[1].c"]
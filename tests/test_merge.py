@@ -1183,6 +1183,88 @@ def test_3way_dict_merge(merge: Any) -> None:
     assert {"a": 2, "b": 3, "c": 3} == c4
 
 
+@mark.parametrize(
+    "base, others, combined",
+    [
+        param(
+            {"a": {"b": 1, "c": [1]}},
+            [{"a": {"b": 2}}, {"a": {"d": "???"}}, {"a": {"b": "???", "c": [2]}}],
+            True,
+            id="nested",
+        ),
+        param(
+            {"a": 1},
+            [OmegaConf.create({"b": {"c": 1}}), {"b": {"d": "${a}"}}, {"e": None}],
+            True,
+            id="configs",
+        ),
+        param({"a": {"b": 1}}, [{"a": None}, {"a": {"c": 1}}], False, id="none"),
+        param({"a": {"b": 1}}, [{"a": "???"}, {"a": {"c": 1}}], False, id="missing"),
+        param(
+            {"a": {"b": 1}, "x": {"c": 2}},
+            [{"a": "${x}"}, {"a": "???"}],
+            False,
+            id="interpolation",
+        ),
+        param({"a": {"b": 1}}, [{"a": [1]}, {"a": 1}], False, id="error_hidden"),
+        param({"a": {"b": 1}}, [{"a": [1]}, {"a": [2]}], True, id="error"),
+        param(User, [{"age": "1"}, {"age": "x"}, {"age": 3}], False, id="typed_dest"),
+        param(
+            OmegaConf.create({"a": None}, flags={"struct": True}),
+            [{"a": {"x": 1}}, {"a": {"y": 2}}],
+            False,
+            id="struct_dest",
+        ),
+        param(
+            OmegaConf.create({"a": DictConfig({"b": 1}, flags={"readonly": True})}),
+            [{"a": {"c": 1}}, {"a": {"d": 2}}],
+            False,
+            id="readonly_path",
+        ),
+        param(
+            {},
+            [OmegaConf.create({"a": IntegerNode(1)}), {"a": "x"}, {"a": 3}],
+            False,
+            id="typed_by_previous_source",
+        ),
+        param(
+            {"a": {"k": 1}, "c": "${a}"},
+            [{"a": {"z": 0}}, {"c": {}}, {"a": {"k": 2}}],
+            False,
+            id="expanded_interpolation",
+        ),
+        param(
+            {"a": 1},
+            [OmegaConf.structured(User), {"name": "joe"}],
+            False,
+            id="typed_source",
+        ),
+    ],
+)
+def test_merge_many(base: Any, others: List[Any], combined: bool) -> None:
+    # Merging several sources at once combines them when it gives the same result
+    # as merging them one at a time.
+    def merge_one_at_a_time() -> Any:
+        cfg = OmegaConf.create(base)
+        for other in others:
+            cfg = OmegaConf.merge(cfg, other)
+        return cfg
+
+    cfg = OmegaConf.create(base)
+    assert (len(list(cfg._plan_merge(tuple(others)))) == 1) is combined
+    others_copy = copy.deepcopy(others)
+    try:
+        expected = merge_one_at_a_time()
+    except Exception as e:
+        with raises(type(e)):
+            OmegaConf.merge(base, *others)
+    else:
+        res = OmegaConf.merge(base, *others)
+        assert OmegaConf.to_yaml(res) == OmegaConf.to_yaml(expected)
+        assert OmegaConf.get_type(res) is OmegaConf.get_type(expected)
+    assert others == others_copy
+
+
 def test_merge_list_list() -> None:
     a = OmegaConf.create([1, 2, 3])
     b = OmegaConf.create([4, 5, 6])
@@ -1306,6 +1388,36 @@ def test_parent_maintained() -> None:
         ([1, 2, 3], ["0=bar", "2.a=100"], ["bar", 2, dict(a=100)]),
         ({}, ["foo=bar", "bar=100"], {"foo": "bar", "bar": 100}),
         ({}, ["foo=bar=10"], {"foo": "bar=10"}),
+        param(
+            {"a": {"b": {"c": 1}}},
+            ["a.b.c=2", "a.b.d=3", "a.e=4"],
+            {"a": {"b": {"c": 2, "d": 3}, "e": 4}},
+            id="shared_prefix",
+        ),
+        param(
+            {"a": {"b": {"c": 1}}},
+            ["a.b.c=2", "a.b={d: 3}", "a.b.e=4", "a.b=5", "a.b.f=6"],
+            {"a": {"b": {"f": 6}}},
+            id="prefix_replaced",
+        ),
+        param(
+            {"a": {"b": 1}, "i": DictConfig("${a}")},
+            ["i.c=2", "a=5", "a={d: 3}", "i.e=4"],
+            {"a": {"d": 3, "e": 4}, "i": "${a}"},
+            id="prefix_interpolation",
+        ),
+        param(
+            {"a": {"b": {"x": 0}}, "c": DictConfig("${a}")},
+            ["a.b.x=1", "c.b=5", "a.b.y=2"],
+            {"a": {"b": {"y": 2}}, "c": "${a}"},
+            id="cached_prefix_replaced_through_interpolation",
+        ),
+        param(
+            [[1], [2]],
+            ["0.0=3", "00=[4, 6]", "0.0=5"],
+            [[5, 6], [2]],
+            id="list_index_spellings",
+        ),
     ],
 )
 def test_merge_with_dotlist(
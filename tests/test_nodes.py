@@ -1,5 +1,6 @@
 import copy
 import functools
+import pickle
 import re
 import sys
 from enum import Enum
@@ -25,12 +26,14 @@ from omegaconf import (
     UnionNode,
     ValueNode,
 )
-from omegaconf._utils import BUILTIN_VALUE_TYPES, type_str
+from omegaconf._utils import BUILTIN_VALUE_TYPES, ValueKind, get_value_kind, type_str
+from omegaconf.base import Metadata
 from omegaconf.errors import (
     InterpolationToMissingValueError,
     UnsupportedValueType,
     ValidationError,
 )
+from omegaconf.grammar_compiler import Program
 from omegaconf.nodes import InterpolationResultNode
 from tests import Color, Enum1, IllegalType, User
 
@@ -702,9 +705,138 @@ def test_deepcopy(obj: Any) -> None:
     cp = copy.deepcopy(obj)
     assert cp == obj
     assert id(cp) != id(obj)
-    assert obj.__dict__.keys() == cp.__dict__.keys()
-    for k in obj.__dict__.keys():
-        assert obj.__dict__[k] == cp.__dict__[k]
+    state, cp_state = obj.__getstate__(), cp.__getstate__()
+    assert state.keys() == cp_state.keys()
+    for k in state.keys():
+        assert state[k] == cp_state[k]
+
+
+@mark.parametrize(
+    "node",
+    [
+        AnyNode(1),
+        StringNode("foo"),
+        BooleanNode(True),
+        EnumNode(Color, Color.RED),
+        InterpolationResultNode(1),
+    ],
+)
+def test_value_node_has_no_dict(node: ValueNode) -> None:
+    assert not hasattr(node, "__dict__")
+
+
+def test_empty_flags_are_shared() -> None:
+    cfg = OmegaConf.create({"a": 1, "b": 2})
+    a, b = cfg._get_node("a"), cfg._get_node("b")
+    assert a is not None and b is not None
+    assert a._metadata.flags is b._metadata.flags
+    a._set_flag("readonly", True)
+    assert a._metadata.flags == {"readonly": True}
+    assert b._metadata.flags == {}
+    assert not b._get_flag("readonly")
+    a._set_flag("readonly", None)
+    assert a._metadata.flags is b._metadata.flags
+    assert copy.deepcopy(a)._metadata.flags is b._metadata.flags
+
+
+def test_metadata_is_shared() -> None:
+    cfg = OmegaConf.create(
+        {"a": {"x": 1, "y": 1}, "b": {"x": 2, "y": "s"}, "c": [1, 2]}
+    )
+    assert cfg.a._get_node("x")._metadata is cfg.b._get_node("x")._metadata
+    assert cfg.a._get_node("x")._metadata is cfg.a._get_node("y")._metadata
+    assert cfg.b._get_node("x")._metadata is cfg.b._get_node("y")._metadata
+    assert cfg.c._get_node(1)._metadata is AnyNode(key=1)._metadata
+    assert IntegerNode(key=1)._metadata is not AnyNode(key=1)._metadata
+    assert AnyNode(key=1)._metadata is AnyNode(key=True)._metadata
+    assert AnyNode(key=1)._metadata.key is None
+    assert AnyNode(key=True)._key() is True
+    cp = copy.deepcopy(cfg)
+    assert cp.a._get_node("x")._metadata is cfg.a._get_node("x")._metadata
+    assert cp.a._get_node("x")._key() == "x"
+
+
+@mark.parametrize(
+    "modify",
+    [
+        param(lambda node: node._set_flag("readonly", True), id="set_flag"),
+        param(lambda node: node._set_flags_root(True), id="set_flags_root"),
+    ],
+)
+def test_shared_metadata_copy_on_write(modify: Callable[[Node], None]) -> None:
+    cfg = OmegaConf.create({"a": {"x": 1}, "b": {"x": 2}})
+    node, other = cfg.a._get_node("x"), cfg.b._get_node("x")
+    modify(node)
+    assert node._metadata is not other._metadata
+    assert other._metadata == Metadata(
+        ref_type=Any, object_type=None, optional=True, key=None
+    )
+    assert other._get_flag("readonly") is None
+    assert other._key() == "x"
+    with raises(TypeError):
+        other._metadata.key = "z"
+
+
+def test_set_key_keeps_shared_metadata() -> None:
+    cfg = OmegaConf.create({"a": {"x": 1}, "b": {"x": 2}})
+    node, other = cfg.a._get_node("x"), cfg.b._get_node("x")
+    node._set_key("z")
+    assert node._metadata is other._metadata
+    assert node._key() == "z"
+    assert other._key() == "x"
+
+
+def test_shared_metadata_after_pickle() -> None:
+    cfg = OmegaConf.create({"a": {"x": 1}, "b": {"x": 2}})
+    cfg.b._get_node("x")._set_flag("readonly", True)
+    # The key is pickled in the metadata, as in older versions.
+    assert cfg.a._get_node("x").__getstate__()["_metadata"].key == "x"
+    cp = pickle.loads(pickle.dumps(cfg))
+    assert cp.a._get_node("x")._metadata is cfg.a._get_node("x")._metadata
+    assert cp.b._get_node("x")._metadata.flags == {"readonly": True}
+    assert cp.b._get_node("x")._metadata.key is None
+    assert [cp.a._get_node("x")._key(), cp.b._get_node("x")._key()] == ["x", "x"]
+
+
+def test_resolver_cache_is_allocated_on_use() -> None:
+    cfg = OmegaConf.create({"a": 1})
+    node = cfg._get_node("a")
+    assert node is not None
+    assert cfg._metadata.resolver_cache is None
+    assert node._metadata.resolver_cache is None
+    OmegaConf.get_cache(cfg)["foo"][()] = 1
+    assert cfg._metadata.resolver_cache == {"foo": {(): 1}}
+
+
+def test_value_kind_is_cached() -> None:
+    cfg = OmegaConf.create({"a": 1, "b": "${a}", "c": "???"})
+    a, b, c = (cfg._get_node(key) for key in "abc")
+    assert isinstance(a, ValueNode)
+    assert isinstance(b, ValueNode)
+    assert isinstance(c, ValueNode)
+    assert getattr(a, "_kind", None) is None  # computed on demand
+    assert a._value_kind() is ValueKind.VALUE
+    assert a._kind is ValueKind.VALUE
+    assert b._value_kind() is ValueKind.INTERPOLATION
+    assert c._is_missing()
+
+    # The compiled interpolation is kept once resolved.
+    assert cfg.b == 1
+    assert isinstance(b._kind, Program)
+    assert b._get_program() is b._kind
+    assert b._value_kind() is ValueKind.INTERPOLATION
+    assert copy.deepcopy(b)._kind is b._kind
+    assert not hasattr(pickle.loads(pickle.dumps(b)), "_kind")
+    assert get_value_kind(pickle.loads(pickle.dumps(b))) is ValueKind.INTERPOLATION
+
+    b._set_value("???")
+    assert b._value_kind() is ValueKind.MANDATORY_MISSING
+    b._set_value("x")
+    assert b._kind is None
+    assert not b._is_interpolation()
+    c._set_value("${a}")
+    assert c._is_interpolation()
+    assert cfg.c == 1
 
 
 @mark.parametrize(
@@ -0,0 +1,272 @@
+import copy
+import math
+import pickle
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+from pytest import mark, param, raises
+
+from omegaconf import (
+    FloatNode,
+    IntegerNode,
+    ListConfig,
+    OmegaConf,
+    ReadonlyConfigError,
+    ValidationError,
+)
+from omegaconf.listconfig import _MIN_NUMERIC_ARRAY_SIZE
+
+SIZE = _MIN_NUMERIC_ARRAY_SIZE
+INTS = list(range(SIZE))
+FLOATS = [i / 2 for i in range(SIZE)]
+
+
+@dataclass
+class Weights:
+    ints: List[int] = field(default_factory=lambda: list(INTS))
+    floats: List[float] = field(default_factory=lambda: list(FLOATS))
+    ref: int = "${ints[3]}"  # type: ignore
+
+
+def is_numeric(lst: Any) -> bool:
+    assert isinstance(lst, ListConfig)
+    return lst._numeric_values() is not None
+
+
+def node_keys(lst: ListConfig) -> List[Any]:
+    nodes = lst._get_node(slice(None))
+    assert isinstance(nodes, list)
+    keys = []
+    for node in nodes:
+        assert node is not None
+        keys.append(node._key())
+    return keys
+
+
+def with_nodes(lst: ListConfig) -> ListConfig:
+    lst._get_node(0)  # creates the nodes
+    assert not is_numeric(lst)
+    return lst
+
+
+def test_structured_config() -> None:
+    cfg = OmegaConf.structured(Weights)
+    assert is_numeric(cfg.ints)
+    assert is_numeric(cfg.floats)
+    assert cfg.ints == INTS
+    assert cfg.ref == 3
+
+    # The nodes are created when the list is accessed through them.
+    assert not is_numeric(cfg.ints)
+    node = cfg.ints._get_node(5)
+    assert type(node) is IntegerNode
+    assert node._key() == 5 and node._get_parent() is cfg.ints
+    assert type(cfg.floats._get_node(1)) is FloatNode
+
+
+@mark.parametrize(
+    "content, element_type",
+    [
+        param(INTS[1:], int, id="small"),
+        param(INTS, Any, id="untyped"),
+        param(INTS[:-1] + ["1"], int, id="str"),
+        param(INTS[:-1] + ["${.0}"], int, id="interpolation"),
+        param(INTS[:-1] + ["???"], int, id="missing"),
+        param(INTS[:-1] + [None], Optional[int], id="none"),
+        param(INTS[:-1] + [2**64], int, id="large_int"),
+    ],
+)
+def test_not_numeric(content: List[Any], element_type: Any) -> None:
+    lst = ListConfig(content, element_type=element_type)
+    assert not is_numeric(lst)
+
+
+@mark.parametrize(
+    "content, element_type",
+    [
+        param(INTS[:-1] + [True], int, id="bool"),
+        param(INTS[:-1] + [0.5], int, id="float_in_ints"),
+        param(FLOATS[:-1] + ["abc"], float, id="str_in_floats"),
+    ],
+)
+def test_invalid_items(content: List[Any], element_type: Any) -> None:
+    with raises(ValidationError):
+        ListConfig(content, element_type=element_type)
+
+
+def test_ints_in_floats() -> None:
+    lst = ListConfig(INTS, element_type=float)
+    assert is_numeric(lst)
+    assert lst == [float(i) for i in INTS]
+    with raises(ValidationError):
+        ListConfig(INTS, element_type=float, flags={"convert": False})
+
+
+@mark.parametrize(
+    "operation",
+    [
+        param(len, id="len"),
+        param(lambda lst: lst[3], id="getitem"),
+        param(lambda lst: lst[-1], id="getitem_negative"),
+        param(lambda lst: lst.get(2), id="get"),
+        param(lambda lst: lst[2:10:3], id="slice"),
+        param(lambda lst: lst[::-5], id="slice_reversed"),
+        param(lambda lst: lst[:-3:-1], id="slice_negative"),
+        param(list, id="iter"),
+        param(lambda lst: 5 in lst, id="contains"),
+        param(lambda lst: 5.5 in lst, id="contains_missing"),
+        param(lambda lst: lst.count(6), id="count"),
+        param(lambda lst: lst.index(7), id="index"),
+        param(str, id="str"),
+        param(OmegaConf.to_container, id="to_container"),
+        param(OmegaConf.to_yaml, id="to_yaml"),
+        param(lambda lst: copy.deepcopy(lst)[:], id="deepcopy"),
+    ],
+)
+@mark.parametrize("element_type", [int, float])
+def test_read_without_nodes(
+    element_type: Any, operation: Callable[[ListConfig], Any]
+) -> None:
+    lst = ListConfig(INTS, element_type=element_type)
+    expected = operation(with_nodes(ListConfig(INTS, element_type=element_type)))
+    assert operation(lst) == expected
+    assert is_numeric(lst)
+
+
+def test_nan() -> None:
+    lst = ListConfig([1.0] * (SIZE - 1) + [math.nan], element_type=float)
+    assert is_numeric(lst)
+    # Like `FloatNode`, items compare equal to nan
+    assert math.nan in lst
+    assert lst.count(math.nan) == 0
+    assert 2.0 not in lst
+
+
+@mark.parametrize(
+    "index, value",
+    [
+        param(0, 10, id="int"),
+        param(-1, 10, id="negative"),
+        param(slice(2, 5), [10, 20], id="slice"),
+        param(slice(2, 2), [10, 20], id="empty_slice"),
+        param(slice(None, None, -2), [10] * (SIZE // 2), id="extended_slice"),
+        param(slice(5, None), (), id="delete"),
+    ],
+)
+def test_set_without_nodes(index: Any, value: Any) -> None:
+    lst = ListConfig(INTS, element_type=int)
+    expected = list(INTS)
+    expected[index] = value
+    lst[index] = value
+    assert is_numeric(lst)
+    assert lst == expected
+
+
+@mark.parametrize(
+    "index, value",
+    [
+        param(0, "${.1}", id="interpolation"),
+        param(0, "???", id="missing"),
+        param(0, "10", id="converted"),
+        param(slice(0, 2), ["10", 20], id="slice_converted"),
+    ],
+)
+def test_set_with_nodes(index: Any, value: Any) -> None:
+    lst = ListConfig(INTS, element_type=int)
+    expected = with_nodes(ListConfig(INTS, element_type=int))
+    expected[index] = value
+    lst[index] = value
+    assert not is_numeric(lst)
+    assert lst._get_node(0) == expected._get_node(0)
+    assert lst[1:] == expected[1:]
+
+
+@mark.parametrize(
+    "modify",
+    [
+        param(lambda lst: lst.append(1), id="append"),
+        param(lambda lst: lst.insert(0, 1), id="insert"),
+        param(lambda lst: lst.pop(), id="pop"),
+        param(lambda lst: lst.sort(reverse=True), id="sort"),
+        param(lambda lst: lst.__delitem__(0), id="delitem"),
+    ],
+)
+def test_modify_with_nodes(modify: Callable[[ListConfig], Any]) -> None:
+    lst = ListConfig(INTS, element_type=int)
+    expected = with_nodes(ListConfig(INTS, element_type=int))
+    assert modify(lst) == modify(expected)
+    assert not is_numeric(lst)
+    assert lst == expected
+    assert node_keys(lst) == node_keys(expected)
+
+
+def test_invalid_assignment() -> None:
+    lst = ListConfig(INTS, element_type=int)
+    with raises(ValidationError):
+        lst[0] = "abc"
+    assert lst == INTS
+    with raises(ValidationError):
+        lst._set_value(INTS + ["abc"])
+    assert lst == INTS
+    OmegaConf.set_readonly(lst, True)
+    with raises(ReadonlyConfigError):
+        lst[0] = 1
+
+
+def test_set_value() -> None:
+    cfg = OmegaConf.structured(Weights)
+    cfg.ints = [1] * SIZE
+    assert is_numeric(cfg.ints)
+    assert cfg.ints == [1] * SIZE
+    cfg.ints = [1]
+    assert not is_numeric(cfg.ints)
+    cfg.ints = ListConfig(INTS, element_type=int)
+    assert is_numeric(cfg.ints)
+
+
+def test_merge() -> None:
+    cfg = OmegaConf.merge(Weights, {"ints": [2] * SIZE, "floats": [1] * SIZE})
+    assert is_numeric(cfg.ints) and is_numeric(cfg.floats)
+    assert cfg.ints == [2] * SIZE
+    assert cfg.floats == [1.0] * SIZE
+    cfg = OmegaConf.merge(cfg, {"ints": ["${ref}"] + INTS[1:]})
+    assert not is_numeric(cfg.ints)
+    assert cfg.ints[:2] == [3, 1]
+
+
+@mark.parametrize("size", [3, SIZE])
+def test_merge_into_readonly(size: int) -> None:
+    cfg = OmegaConf.structured(Weights)
+    OmegaConf.set_readonly(cfg, True)
+    with raises(ReadonlyConfigError):
+        cfg.merge_with({"ints": list(range(size))})
+    assert cfg.ints == INTS
+
+
+def test_interpolation_cache_is_invalidated() -> None:
+    cfg = OmegaConf.create({"s": "${w}!"}, flags={"cache_interpolations": True})
+    cfg.w = ListConfig(INTS, element_type=int)
+    assert cfg.s == f"{INTS}!"
+    cfg.w[0] = 10
+    assert is_numeric(cfg.w)
+    assert cfg.s == f"{[10] + INTS[1:]}!"
+
+
+def test_pickle() -> None:
+    cfg = OmegaConf.structured(Weights)
+    cfg2 = pickle.loads(pickle.dumps(cfg))
+    assert cfg2 == cfg
+    assert OmegaConf.get_type(cfg2) is Weights
+
+
+def test_lazy_copy_is_detached() -> None:
+    cfg = OmegaConf.structured(Weights)
+    cfg_copy = copy.deepcopy(cfg)
+    cfg.ints[0] = 10
+    assert is_numeric(cfg.ints)
+    assert cfg_copy.ints[0] == 0
+
+
+def test_to_bytes() -> None:
+    cfg = OmegaConf.structured(Weights)
+    assert OmegaConf.from_bytes(OmegaConf.to_bytes(cfg)) == cfg
@@ -1,23 +1,39 @@
 # -*- coding: utf-8 -*-
 import copy
 import io
+import json
 import os
 import pathlib
 import pickle
 import re
 import sys
 import tempfile
+import threading
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
+import yaml
 from pytest import mark, param, raises
 
-from omegaconf import MISSING, DictConfig, ListConfig, Node, OmegaConf, UnionNode
+from omegaconf import (
+    MISSING,
+    AnyNode,
+    DictConfig,
+    ListConfig,
+    Node,
+    OmegaConf,
+    UnionNode,
+)
 from omegaconf._utils import get_type_hint
 from omegaconf.base import Box
-from omegaconf.errors import OmegaConfBaseException
+from omegaconf.errors import (
+    InterpolationKeyError,
+    OmegaConfBaseException,
+    ReadonlyConfigError,
+)
 from tests import (
     Color,
+    IllegalType,
     NestedContainers,
     PersonA,
     PersonD,
@@ -29,6 +45,20 @@ from tests import (
     UntypedDict,
     UntypedList,
 )
+from tests.structured_conf.data.dataclasses import (
+    AnyTypeConfig,
+    BoolConfig,
+    BytesConfig,
+    DictExamples,
+    EnumConfig,
+    FloatConfig,
+    FrozenClass,
+    IntegersConfig,
+    ListExamples,
+    PathConfig,
+    StringConfig,
+    StructuredOptional,
+)
 
 
 def save_load_from_file(conf: Any, resolve: bool, expected: Any) -> None:
@@ -133,6 +163,173 @@ def test_save_illegal_type() -> None:
         OmegaConf.save(OmegaConf.create(), 1000)  # type: ignore
 
 
+@mark.parametrize(
+    "input_",
+    [
+        param({"a": 10, "b": [1.5, True, None]}, id="dict"),
+        param({"foo": 10, "bar": "${foo}", "baz": "???"}, id="interpolation"),
+        param(["שלום"], id="unicode"),
+    ],
+)
+@mark.parametrize("file_class", [str, pathlib.Path])
+def test_save_load_json(tmpdir: str, input_: Any, file_class: Type[Any]) -> None:
+    cfg = OmegaConf.create(input_)
+    path = Path(tmpdir) / "cfg.JSON"
+    OmegaConf.save(cfg, file_class(path))
+    assert json.loads(path.read_text(encoding="utf-8")) == input_
+    assert OmegaConf.load(file_class(path)) == cfg
+
+
+def test_save_load_json_file_object() -> None:
+    cfg = OmegaConf.create({"foo": 10, "bar": "${foo}", "color": Color.RED, 1: 2})
+    stream = io.StringIO()
+    OmegaConf.save(cfg, stream, resolve=True, format="json")
+    assert stream.getvalue() == '{"foo": 10, "bar": 10, "color": "RED", "1": 2}'
+    stream.seek(0)
+    assert OmegaConf.load(stream, format="json") == {
+        "foo": 10,
+        "bar": 10,
+        "color": "RED",
+        "1": 2,
+    }
+
+
+@mark.parametrize(
+    "value, expected",
+    [
+        param(
+            float("nan"),
+            raises(ValueError, match="Cannot save the config as JSON"),
+            id="nan",
+        ),
+        param(
+            float("-inf"),
+            raises(ValueError, match="Cannot save the config as JSON"),
+            id="inf",
+        ),
+        param(b"bytes", raises(TypeError, match="not JSON serializable"), id="bytes"),
+    ],
+)
+def test_save_json_error(tmpdir: str, value: Any, expected: Any) -> None:
+    cfg = OmegaConf.create({"a": 1, "b": value})
+    stream = io.StringIO()
+    with expected:
+        OmegaConf.save(cfg, stream, format="json")
+    assert stream.getvalue() == ""
+
+    path = Path(tmpdir) / "cfg.json"
+    path.write_text("previous")
+    with expected:
+        OmegaConf.save(cfg, path)
+    assert path.read_text() == "previous"
+
+
+def test_save_load_yaml_to_json_path(tmpdir: str) -> None:
+    path = Path(tmpdir) / "cfg.json"
+    OmegaConf.save(OmegaConf.create({"a": [1]}), path, format="yaml")
+    assert path.read_text() == "a:\n- 1\n"
+    assert OmegaConf.load(path, format="yaml") == {"a": [1]}
+
+
+def test_load_json_duplicate_keys(tmpdir: str) -> None:
+    path = Path(tmpdir) / "cfg.json"
+    path.write_text('{"a": {"b": 1, "b": 2}}')
+    with raises(yaml.constructor.ConstructorError, match="found duplicate key b"):
+        OmegaConf.load(path)
+
+
+@mark.parametrize("name", ["cfg.yaml", "cfg.json"])
+def test_save_error_keeps_file(tmpdir: str, name: str) -> None:
+    path = Path(tmpdir) / name
+    path.write_text("previous")
+    cfg = OmegaConf.create({"a": 1, "b": "${missing}"})
+    with raises(InterpolationKeyError):
+        OmegaConf.save(cfg, path, resolve=True)
+    assert path.read_text() == "previous"
+    assert os.listdir(tmpdir) == [name]
+
+
+@mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+def test_save_keeps_file_mode(tmpdir: str) -> None:
+    path = Path(tmpdir) / "cfg.yaml"
+    path.write_text("previous")
+    path.chmod(0o640)
+    OmegaConf.save(OmegaConf.create({"a": 1}), path)
+    assert path.read_text() == "a: 1\n"
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+@mark.skipif(sys.platform == "win32", reason="symlinks require privileges")
+def test_save_to_symlink(tmpdir: str) -> None:
+    target = Path(tmpdir) / "target.yaml"
+    target.write_text("previous")
+    link = Path(tmpdir) / "cfg.yaml"
+    link.symlink_to(target)
+    OmegaConf.save(OmegaConf.create({"a": 1}), link)
+    assert link.is_symlink()
+    assert target.read_text() == "a: 1\n"
+
+
+def test_save_to_hard_link(tmpdir: str) -> None:
+    target = Path(tmpdir) / "target.yaml"
+    target.write_text("previous")
+    link = Path(tmpdir) / "cfg.yaml"
+    os.link(target, link)
+    OmegaConf.save(OmegaConf.create({"a": 1}), link)
+    assert target.read_text() == "a: 1\n"
+    assert os.path.samefile(target, link)
+
+
+@mark.skipif(sys.platform == "win32", reason="FIFOs are not supported")
+def test_save_to_fifo(tmpdir: str) -> None:
+    path = Path(tmpdir) / "cfg.yaml"
+    os.mkfifo(path)
+    received: List[str] = []
+    reader = threading.Thread(
+        target=lambda: received.append(path.read_text()), daemon=True
+    )
+    reader.start()
+    OmegaConf.save(OmegaConf.create({"a": 1}), path)
+    reader.join(timeout=10)
+    assert received == ["a: 1\n"]
+    assert os.listdir(tmpdir) == ["cfg.yaml"]
+
+
+def test_save_load_invalid_format(tmpdir: str) -> None:
+    msg = "Unsupported format 'toml', expected 'yaml' or 'json'"
+    with raises(ValueError, match=re.escape(msg)):
+        OmegaConf.save(OmegaConf.create(), Path(tmpdir) / "cfg", format="toml")
+    with raises(ValueError, match=re.escape(msg)):
+        OmegaConf.load(io.StringIO(), format="toml")
+
+
+@mark.parametrize("workers", [None, 1, 2])
+def test_load_many(tmpdir: str, workers: Optional[int]) -> None:
+    paths = []
+    for i in range(4):
+        path = Path(tmpdir) / f"cfg_{i}.{'json' if i % 2 else 'yaml'}"
+        cfg = {"a": i, f"b_{i}": [i], "c": {"d": "${a}", f"e_{i}": "???"}}
+        OmegaConf.save(OmegaConf.create(cfg), path)
+        paths.append(path)
+
+    loaded = OmegaConf.load_many(paths, workers=workers)
+    expected = OmegaConf.merge(*[OmegaConf.load(path) for path in paths])
+    assert OmegaConf.to_bytes(loaded) == OmegaConf.to_bytes(expected)
+
+
+@mark.parametrize("workers", [1, 2])
+def test_load_many_error(tmpdir: str, workers: int) -> None:
+    path = Path(tmpdir) / "cfg.yaml"
+    path.write_text("a: 1\na: 2\n")
+    with raises(yaml.constructor.ConstructorError, match="found duplicate key a"):
+        OmegaConf.load_many([path, path], workers=workers)
+
+
+def test_load_many_no_paths() -> None:
+    with raises(ValueError, match=re.escape("load_many() requires at least one path")):
+        OmegaConf.load_many([])
+
+
 @mark.parametrize("obj", [param({"a": "b"}, id="dict"), param([1, 2, 3], id="list")])
 def test_pickle(obj: Any) -> None:
     with tempfile.TemporaryFile() as fp:
@@ -416,6 +613,23 @@ def test_pickle_backward_compatibility(version: str) -> None:
         assert cfg == OmegaConf.create({"a": [{"b": 10}]})
 
 
+def test_pickle_backward_compatibility_value_nodes() -> None:
+    # Pickled before value nodes were stored in slots.
+    path = Path(__file__).parent / "data" / "2.3.0.pickle"
+    with open(path, mode="rb") as fp:
+        cfg = pickle.load(fp)
+    assert cfg == {"a": [{"b": 10}], "c": Color.RED, "d": 1}
+    assert OmegaConf.get_cache(cfg) == {"r": {"k": 1}}
+    node = cfg._get_node("c")
+    assert node.enum_type is Color
+    assert node.fields == {"RED": 1, "GREEN": 2, "BLUE": 3}
+    assert cfg._get_node("d")._get_flag("readonly")
+    with raises(ReadonlyConfigError):
+        cfg.d = 2
+    cfg.c = "BLUE"
+    assert cfg["c"] == Color.BLUE
+
+
 @mark.skipif(sys.version_info >= (3, 7), reason="requires python3.6")
 def test_python36_pickle_optional() -> None:
     cfg = OmegaConf.structured(SubscriptedDictOpt)
@@ -457,3 +671,232 @@ def test_copy_preserves_parent_of_child(
     assert get_child(box)._parent is box
     cp = copy_fn(box)
     assert get_child(cp)._parent is cp
+
+
+def _assert_same_tree(node1: Node, node2: Node) -> None:
+    assert type(node1) is type(node2)
+    assert node1._metadata == node2._metadata
+    assert node1._metadata.flags == node2._metadata.flags
+    assert node1._metadata.flags_root == node2._metadata.flags_root
+    if isinstance(node1, Box):
+        content1 = node1.__dict__["_content"]
+        content2 = node2.__dict__["_content"]
+        if isinstance(content1, Node):
+            assert content2._get_parent() is node2
+            _assert_same_tree(content1, content2)
+        elif isinstance(content1, (dict, list)):
+            assert type(content2) is type(content1)
+            keys = (
+                list(content1) if isinstance(content1, dict) else range(len(content1))
+            )
+            assert keys == (list(content2) if isinstance(content2, dict) else keys)
+            for key in keys:
+                assert content2[key]._get_parent() is node2
+                _assert_same_tree(content1[key], content2[key])
+        else:
+            assert content1 == content2
+    else:
+        assert type(node1._value()) is type(node2._value())
+        assert node1._value() == node2._value()
+
+
+@mark.parametrize(
+    "cfg",
+    [
+        param(OmegaConf.create(), id="empty"),
+        param(
+            OmegaConf.create({"a": 1, "b": [1.5, True, None, b"x"], "c": {"d": "???"}}),
+            id="dict",
+        ),
+        param(OmegaConf.create([{"a": "${b}"}, [], "x_${a}", -1]), id="list"),
+        param(OmegaConf.create({1: "a", 1.5: "b", False: "c", b"d": 1}), id="keys"),
+        param(DictConfig(content=MISSING), id="missing"),
+        param(DictConfig(content=None), id="none"),
+        param(ListConfig(content="${x}"), id="interpolation"),
+        param(
+            OmegaConf.create({"a": {"b": 1}}, flags={"struct": True, "readonly": True}),
+            id="flags",
+        ),
+        param(
+            DictConfig({"a": Path("/x"), "b": Color.RED, Color.GREEN: 2}),
+            id="escaped_values",
+        ),
+        param(OmegaConf.structured(AnyTypeConfig), id="any_type"),
+        param(OmegaConf.structured(BoolConfig), id="bool"),
+        param(OmegaConf.structured(IntegersConfig), id="int"),
+        param(OmegaConf.structured(FloatConfig), id="float"),
+        param(OmegaConf.structured(StringConfig), id="str"),
+        param(OmegaConf.structured(BytesConfig), id="bytes"),
+        param(OmegaConf.structured(PathConfig), id="path"),
+        param(OmegaConf.structured(EnumConfig), id="enum"),
+        param(OmegaConf.structured(DictExamples), id="dict_examples"),
+        param(OmegaConf.structured(ListExamples), id="list_examples"),
+        param(OmegaConf.structured(StructuredOptional), id="structured_optional"),
+        param(OmegaConf.structured(NestedContainers), id="nested_containers"),
+        param(OmegaConf.structured(SubscriptedDictOpt), id="subscripted_dict_opt"),
+        param(OmegaConf.structured(FrozenClass), id="frozen_class"),
+        param(
+            OmegaConf.structured(UnionAnnotations),
+            marks=mark.skipif(
+                sys.version_info < (3, 7), reason="requires python3.7 or newer"
+            ),
+            id="union",
+        ),
+    ],
+)
+@mark.parametrize("indexed", [False, True])
+def test_to_bytes(cfg: Any, indexed: bool) -> None:
+    data = OmegaConf.to_bytes(cfg, indexed=indexed)
+    assert isinstance(data, bytes)
+    cfg2 = OmegaConf.from_bytes(data)
+    _assert_same_tree(cfg, cfg2)
+    assert cfg2._get_parent() is None
+    assert OmegaConf.get_type(cfg2) is OmegaConf.get_type(cfg)
+    # the encoding does not depend on the (shared or not) metadata of the nodes
+    assert OmegaConf.to_bytes(cfg2, indexed=indexed) == data
+
+
+def test_to_bytes_is_smaller_than_pickle() -> None:
+    cfg = OmegaConf.create({f"key_{i}": {"a": i, "b": [i, str(i)]} for i in range(100)})
+    assert len(OmegaConf.to_bytes(cfg)) < len(pickle.dumps(cfg)) / 2
+
+
+def test_to_bytes_child() -> None:
+    cfg = OmegaConf.create({"a": {"b": 1}}, flags={"struct": True})
+    child = OmegaConf.from_bytes(OmegaConf.to_bytes(cfg.a))
+    _assert_same_tree(cfg.a, child)
+    # the parent (and the flags inherited from it) are not encoded
+    assert child._get_parent() is None
+    assert not OmegaConf.is_struct(child)
+
+
+def test_to_bytes_object() -> None:
+    obj = IllegalType()
+    cfg = OmegaConf.create({"a": obj}, flags={"allow_objects": True})
+    cfg2 = OmegaConf.from_bytes(OmegaConf.to_bytes(cfg))
+    assert cfg2._get_flag("allow_objects")
+    assert type(cfg2.a) is IllegalType
+    assert cfg2.a is not obj
+
+
+class CustomNode(AnyNode):
+    __slots__ = ()
+
+
+def test_to_bytes_unknown_node() -> None:
+    cfg = OmegaConf.create({"a": 1, "b": 2})
+    cfg._set_item_impl("a", CustomNode(3))
+    cfg2 = OmegaConf.from_bytes(OmegaConf.to_bytes(cfg))
+    _assert_same_tree(cfg, cfg2)
+
+
+def test_to_bytes_structured() -> None:
+    cfg = OmegaConf.from_bytes(OmegaConf.to_bytes(PersonD))
+    assert OmegaConf.get_type(cfg) is PersonD
+    assert cfg == OmegaConf.structured(PersonD)
+
+
+@mark.parametrize(
+    "data, msg",
+    [
+        param(b"", "Data is not a config encoded by OmegaConf.to_bytes()", id="empty"),
+        param(
+            b"OCB", "Data is not a config encoded by OmegaConf.to_bytes()", id="header"
+        ),
+        param(pickle.dumps({}), "Data is not a config encoded", id="pickle"),
+        param(b"OCB\x02\x00", "Unsupported version of the OmegaConf binary format: 2"),
+    ],
+)
+def test_from_bytes_invalid(data: bytes, msg: str) -> None:
+    with raises(ValueError, match=re.escape(msg)):
+        OmegaConf.from_bytes(data)
+
+
+def _large_config() -> DictConfig:
+    return OmegaConf.create(
+        {f"key_{i}": {f"x_{j}": list(range(100)) for j in range(20)} for i in range(3)}
+    )
+
+
+def _is_decoded(cfg: Any) -> bool:
+    return "_content" in cfg.__dict__
+
+
+@mark.parametrize("open_file", [False, True])
+def test_load_lazy(tmpdir: str, open_file: bool) -> None:
+    cfg = _large_config()
+    path = Path(tmpdir) / "cfg.bin"
+    path.write_bytes(OmegaConf.to_bytes(cfg, indexed=True))
+
+    if open_file:
+        with open(path, "rb") as f:
+            loaded = OmegaConf.load(f, lazy=True)
+    else:
+        loaded = OmegaConf.load(path, lazy=True)
+    assert isinstance(loaded, DictConfig)
+    assert list(loaded.keys()) == ["key_0", "key_1", "key_2"]
+    key_0 = loaded._get_node("key_0")
+    assert isinstance(key_0, DictConfig)
+    assert not _is_decoded(key_0)
+
+    assert loaded.key_1.x_2[5] == 5
+    assert _is_decoded(loaded._get_node("key_1"))
+    assert _is_decoded(loaded.key_1._get_node("x_2"))
+    assert not _is_decoded(loaded.key_1._get_node("x_0"))
+    assert not _is_decoded(key_0)
+    content = key_0._content
+    assert isinstance(content, dict)
+    assert content.keys() == cfg.key_0.keys()
+
+    _assert_same_tree(cfg, loaded)
+
+
+@mark.parametrize(
+    "op",
+    [
+        param(lambda cfg: copy.deepcopy(cfg), id="deepcopy"),
+        param(lambda cfg: pickle.loads(pickle.dumps(cfg)), id="pickle"),
+        param(lambda cfg: OmegaConf.merge(cfg, {"key_0": {"x": 1}}), id="merge"),
+        param(lambda cfg: OmegaConf.to_bytes(cfg), id="to_bytes"),
+    ],
+)
+def test_from_bytes_indexed_copy(op: Any) -> None:
+    cfg = _large_config()
+    loaded = OmegaConf.from_bytes(OmegaConf.to_bytes(cfg, indexed=True))
+    res = op(loaded)
+    if isinstance(res, bytes):
+        res = OmegaConf.from_bytes(res)
+    assert res.key_1 == cfg.key_1
+    res.key_2.x_0[0] = 10
+    assert loaded.key_2.x_0[0] == 0
+
+
+def test_from_bytes_indexed_modify() -> None:
+    cfg = _large_config()
+    loaded = OmegaConf.from_bytes(OmegaConf.to_bytes(cfg, indexed=True))
+    loaded.key_0.x_1 = 10
+    loaded.key_1.x_0.append(100)
+    del loaded.key_2
+    cfg.key_0.x_1 = 10
+    cfg.key_1.x_0.append(100)
+    del cfg.key_2
+    assert loaded == cfg
+
+
+@mark.parametrize(
+    "file_",
+    [
+        param(io.BytesIO(OmegaConf.to_bytes({"a": 1}, indexed=True)), id="bytes_io"),
+        param(1000, id="int"),
+    ],
+)
+def test_load_lazy_illegal_type(file_: Any) -> None:
+    with raises(TypeError, match="Unexpected file type"):
+        OmegaConf.load(file_, lazy=True)
+
+
+def test_load_lazy_yaml(tmpdir: str) -> None:
+    path = Path(tmpdir) / "cfg.yaml"
+    OmegaConf.save(_large_config(), path)
+    with raises(ValueError, match=re.escape("Data is not a config encoded")):
+        OmegaConf.load(path, lazy=True)
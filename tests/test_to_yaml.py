@@ -1,12 +1,15 @@
+import io
 import platform
+import re
 from pathlib import Path
 from textwrap import dedent
 from typing import Any
 
 import yaml
-from pytest import mark
+from pytest import mark, param, raises
 
 from omegaconf import DictConfig, EnumNode, ListConfig, OmegaConf, _utils
+from omegaconf.errors import InterpolationKeyError
 from tests import Enum1, User
 
 
@@ -165,3 +168,137 @@ def test_structured_configs(user: User) -> None:
         """
     )
     assert OmegaConf.to_yaml(user) == expected
+
+
+@mark.parametrize(
+    "value",
+    [
+        *_utils.YAML_BOOL_TYPES,
+        *["yES", "t", "1", "-1", "+1", " 1 ", "\t1\n", "007", "1_000", "1__000"],
+        *["_1", "1_", "1.", ".1", "1.5", "-.5e-3", "1e3", "1E+3", "1.e3", "1e", "e3"],
+        *["1_0.5_0", "1_.5", "1._5", "1.5e1_0", ".", "-", "", " ", "1 2", "0x10"],
+        *["inf", "-Infinity", " NaN ", "+nan", "infinit", "nan1", "٣", "١.٥"],
+        *["1j", "${a}", "hello", "\x1c1", "\u20031\u2003"],
+    ],
+)
+def test_str_representer_quotes(value: str) -> None:
+    expected = _utils.yaml_is_bool(value) or _utils.is_int(value)
+    expected = expected or _utils.is_float(value)
+    dumper = _utils.get_omega_conf_dumper()
+    node = dumper.str_representer(dumper(None), value)
+    assert (node.style == "'") == expected
+
+
+@mark.skipif(not yaml.__with_libyaml__, reason="requires libyaml")
+@mark.parametrize(
+    "input_",
+    [
+        {"a": "1", "b": [True, "yes", 1.5, "1.5", None, "null"], "c": {"d": "???"}},
+        {"multiline": "a\nb", "quotes": "'\"", "unicode": "你好", "empty": ""},
+        {"long": "x " * 100, "colon": "a: b", "hash": "# c", 1: b"bytes"},
+        # Strings that libyaml does not emit like the Python emitter
+        {"emoji": "\U0001F600", "nel": "a\x85b", "bom": "\ufeff", "tab": "a\tb"},
+        {"": "empty key", "k" * 130: "long key", "\u4e2d" * 50: "long utf-8 key"},
+        {"folded": "\x07 x" * 40, "nested": [{"e": ["\U0001F600"]}]},
+    ],
+)
+def test_to_yaml_libyaml(input_: Any) -> None:
+    cfg = OmegaConf.create(input_)
+    container = OmegaConf.to_container(cfg)
+    expected = yaml.dump(
+        container,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+        Dumper=_utils.get_omega_conf_dumper(),
+    )
+    assert issubclass(_utils._get_omega_conf_fast_dumper(), yaml.CDumper)
+    assert OmegaConf.to_yaml(cfg) == expected
+
+
+def test_to_yaml_with_added_representer() -> None:
+    class Point:
+        pass
+
+    def represent_point(dumper: yaml.Dumper, data: Point) -> yaml.Node:
+        return dumper.represent_scalar("!point", "x")
+
+    dumper = _utils.get_omega_conf_dumper()
+    dumper.add_representer(Point, represent_point)
+    try:
+        cfg = OmegaConf.create({"p": Point()}, flags={"allow_objects": True})
+        assert OmegaConf.to_yaml(cfg) == "p: !point x\n"
+    finally:
+        del dumper.yaml_representers[Point]
+
+
+@mark.parametrize(
+    "input_",
+    [
+        param({"a": 1, "b": [1, "2", None, {"c": "???"}], "d": "${a}"}, id="dict"),
+        param(["${a}", {}, [], "yes", b"bytes"], id="list"),
+        param({Enum1.FOO: Enum1.BAR, "z": "1.5", "a": Path("x")}, id="enum"),
+        param({"x": "${b.y}", "y": {"z": 1}, 1: 2.5}, id="node_inter"),
+        param(User(name="Bond", age=7), id="structured"),
+        param(DictConfig(None), id="none"),
+        param(ListConfig("???"), id="missing"),
+        param(DictConfig("${a}"), id="inter"),
+    ],
+)
+@mark.parametrize("resolve", [False, True])
+@mark.parametrize("sort_keys", [False, True])
+def test_dump(input_: Any, resolve: bool, sort_keys: bool) -> None:
+    cfg = OmegaConf.create({"a": 1, "b": input_})
+    stream = io.StringIO()
+    OmegaConf.dump(cfg, stream, resolve=resolve, sort_keys=sort_keys)
+    expected = OmegaConf.to_yaml(cfg, resolve=resolve, sort_keys=sort_keys)
+    assert stream.getvalue() == expected
+
+
+class _UnseekableStream(io.StringIO):
+    def seekable(self) -> bool:
+        return False
+
+
+@mark.parametrize("stream_type", [io.StringIO, _UnseekableStream])
+@mark.parametrize(
+    "input_",
+    [
+        param({"a": "b", "c": ["d"]}, id="ascii"),
+        param({"a": "b", "c": ["\U0001F600"]}, id="emoji"),
+        param({"a": "b", "c": {"": 1}}, id="empty_key"),
+    ],
+)
+def test_dump_like_python_dumper(input_: Any, stream_type: Any) -> None:
+    cfg = OmegaConf.create(input_)
+    stream = stream_type()
+    stream.write("# header\n")
+    OmegaConf.dump(cfg, stream)
+    expected = yaml.dump(
+        input_,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+        Dumper=_utils.get_omega_conf_dumper(),
+    )
+    assert stream.getvalue() == "# header\n" + expected
+
+
+def test_dump_resolve_error() -> None:
+    cfg = OmegaConf.create({"a": "${missing}"})
+    with raises(InterpolationKeyError, match=re.escape("full_key: a")):
+        OmegaConf.dump(cfg, io.StringIO(), resolve=True)
+
+
+@mark.parametrize(
+    "cfg",
+    [
+        param(DictConfig(None), id="none"),
+        param(ListConfig("???"), id="missing"),
+        param(DictConfig("${a}"), id="inter"),
+    ],
+)
+def test_dump_special_container(cfg: Any) -> None:
+    stream = io.StringIO()
+    OmegaConf.dump(cfg, stream)
+    assert stream.getvalue() == OmegaConf.to_yaml(cfg)
@@ -1,11 +1,14 @@
+import gc
 import re
 import sys
+import weakref
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import attr
+import yaml
 from pytest import mark, param, raises
 
 from omegaconf import DictConfig, ListConfig, Node, OmegaConf, UnionNode, _utils
@@ -27,6 +30,7 @@ from omegaconf._utils import (  # _normalize_ref_type,
     is_supported_union_annotation,
     is_tuple_annotation,
     is_union_annotation,
+    load_dotlist_value,
     nullcontext,
     split_key,
 )
@@ -368,6 +372,28 @@ class TestGetStructuredConfigInfo:
         with raises(ValueError):
             _utils.get_structured_config_data("invalid")
 
+    @mark.parametrize("test_cls", [_TestDataclass, _TestAttrsClass])
+    def test_get_structured_config_data_twice(self, test_cls: Any) -> None:
+        d1 = _utils.get_structured_config_data(test_cls)
+        d2 = _utils.get_structured_config_data(test_cls)
+        assert d1 == d2
+        assert all(d1[name] is not d2[name] for name in d1)
+        assert d1["list1"]._get_parent() is None
+        d1["list1"].append(1)
+        assert d2["list1"] == []
+
+    def test_structured_schema_cache_is_weak(self) -> None:
+        @dataclass
+        class Temporary:
+            x: int = 1
+
+        _utils.get_structured_config_data(Temporary)
+        ref = weakref.ref(Temporary)
+        assert ref() in _utils._structured_schemas
+        del Temporary
+        gc.collect()
+        assert ref() is None
+
     @mark.parametrize(
         "test_cls_or_obj",
         [_TestDataclass, _TestDataclass(), _TestAttrsClass, _TestAttrsClass()],
@@ -495,6 +521,44 @@ def test_value_kind(value: Any, kind: _utils.ValueKind) -> None:
     assert _utils.get_value_kind(value) == kind
 
 
+@mark.parametrize(
+    "value",
+    [
+        "",
+        "0",
+        "-10",
+        "+1",
+        "007",
+        "0x1F",
+        "1_000",
+        "1.5",
+        "-01.25",
+        "1e3",
+        ".inf",
+        "true",
+        "Yes",
+        "off",
+        "null",
+        "~",
+        "y",
+        "word",
+        "path/to/file.txt",
+        "a-b_c",
+        "a: b",
+        "[1, 2]",
+        "{a: b}",
+        "${a.b}",
+        "???",
+        "'quoted'",
+    ],
+)
+def test_load_dotlist_value(value: str) -> None:
+    expected = yaml.load(value, Loader=_utils.get_yaml_loader())
+    res = load_dotlist_value(value)
+    assert res == expected
+    assert type(res) is type(expected)
+
+
 def test_re_parent() -> None:
     def validate(cfg1: DictConfig) -> None:
         assert cfg1._get_parent() is None
@@ -1090,6 +1154,10 @@ def test_marker_string_representation() -> None:
     ],
 )
 def test_split_key(key: str, expected: List[str]) -> None:
+    tokens = split_key(key)
+    assert tokens == expected
+    # Split keys are cached: modifying the returned list must not affect them.
+    tokens.append("x")
     assert split_key(key) == expected
 
 